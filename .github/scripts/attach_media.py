@@ -14,7 +14,52 @@ This script provides media management functionality:
 import os
 import json
 import glob
+from datetime import datetime
 from pathlib import Path
+from template_engine import Template, load_template
+from static_assets import asset_url, publish_assets
+
+# Report fragments, compiled once
+LINKED_IMAGES_ITEM = Template(
+    """
+            <div class="trade-item">
+                <strong>{trade_id}</strong> ({image_count} image{plural})
+                <div class="image-list">
+                    {images}
+                </div>
+            </div>
+            """,
+    "media report linked images",
+)
+
+ORPHANED_SECTION = Template(
+    """
+        <div class="section">
+            <h2 class="warning">⚠️ Orphaned Images</h2>
+            <p class="note intro">
+                These images are not linked to any trade. They may be from deleted trades or incorrectly named directories.
+            </p>
+            <div class="image-list">
+                {images}
+            </div>
+        </div>
+        """,
+    "media report orphaned images",
+)
+
+NO_ORPHANS_SECTION = '<div class="section"><h2 class="success">✓ No Orphaned Images</h2><p class="note">All images are properly linked to trades.</p></div>'
+
+UPDATED_SECTION = Template(
+    """
+        <div class="section">
+            <h2 class="success">✓ Updated Trade Files</h2>
+            <div class="image-list">
+                {files}
+            </div>
+        </div>
+        """,
+    "media report updated files",
+)
 
 
 def scan_trade_images():
@@ -200,146 +245,49 @@ def generate_validation_report(trade_images, trades, orphaned, updated_files):
     """
     total_images = sum(len(imgs) for imgs in trade_images.values())
 
-    report_html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Media Validation Report - SFTi-Pennies</title>
-    <style>
-        body {{
-            font-family: 'Inter', sans-serif;
-            background: #0a0e1a;
-            color: #e4e4e7;
-            padding: 2rem;
-            line-height: 1.6;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-        }}
-        h1 {{
-            color: #00ff88;
-            margin-bottom: 0.5rem;
-        }}
-        .summary {{
-            background: #1a1f2e;
-            padding: 1.5rem;
-            border-radius: 8px;
-            margin: 1.5rem 0;
-            border-left: 4px solid #00ff88;
-        }}
-        .stat {{
-            display: flex;
-            justify-content: space-between;
-            padding: 0.5rem 0;
-        }}
-        .stat-label {{
-            color: #9ca3af;
-        }}
-        .stat-value {{
-            font-weight: 600;
-            color: #00ff88;
-        }}
-        .section {{
-            background: #1a1f2e;
-            padding: 1.5rem;
-            border-radius: 8px;
-            margin: 1.5rem 0;
-        }}
-        .section h2 {{
-            color: #ffd700;
-            margin-bottom: 1rem;
-        }}
-        .trade-item {{
-            background: #0f1420;
-            padding: 1rem;
-            border-radius: 6px;
-            margin: 0.75rem 0;
-        }}
-        .image-list {{
-            margin-top: 0.5rem;
-            padding-left: 1rem;
-        }}
-        .image-item {{
-            color: #9ca3af;
-            font-family: 'JetBrains Mono', monospace;
-            font-size: 0.875rem;
-            padding: 0.25rem 0;
-        }}
-        .warning {{
-            color: #ff4757;
-        }}
-        .success {{
-            color: #00ff88;
-        }}
-        .timestamp {{
-            color: #9ca3af;
-            font-size: 0.875rem;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>📸 Media Validation Report</h1>
-        <p class="timestamp">Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        
-        <div class="summary">
-            <h2 style="margin-top: 0;">Summary</h2>
-            <div class="stat">
-                <span class="stat-label">Total Images:</span>
-                <span class="stat-value">{total_images}</span>
-            </div>
-            <div class="stat">
-                <span class="stat-label">Trades with Images:</span>
-                <span class="stat-value">{len(trade_images)}</span>
-            </div>
-            <div class="stat">
-                <span class="stat-label">Orphaned Images:</span>
-                <span class="stat-value {'warning' if orphaned else 'success'}">{len(orphaned)}</span>
-            </div>
-            <div class="stat">
-                <span class="stat-label">Updated Files:</span>
-                <span class="stat-value">{len(updated_files)}</span>
-            </div>
-        </div>
-        
-        <div class="section">
-            <h2>✓ Linked Images</h2>
-            {''.join([f'''
-            <div class="trade-item">
-                <strong>{trade_id}</strong> ({len(images)} image{'s' if len(images) != 1 else ''})
-                <div class="image-list">
-                    {''.join([f'<div class="image-item">• {img}</div>' for img in images])}
-                </div>
-            </div>
-            ''' for trade_id, images in trade_images.items()])}
-        </div>
-        
-        {f'''
-        <div class="section">
-            <h2 class="warning">⚠️ Orphaned Images</h2>
-            <p style="color: #9ca3af; margin-bottom: 1rem;">
-                These images are not linked to any trade. They may be from deleted trades or incorrectly named directories.
-            </p>
-            <div class="image-list">
-                {''.join([f'<div class="image-item warning">• {img}</div>' for img in orphaned])}
-            </div>
-        </div>
-        ''' if orphaned else '<div class="section"><h2 class="success">✓ No Orphaned Images</h2><p style="color: #9ca3af;">All images are properly linked to trades.</p></div>'}
-        
-        {f'''
-        <div class="section">
-            <h2 class="success">✓ Updated Trade Files</h2>
-            <div class="image-list">
-                {''.join([f'<div class="image-item success">• {f}</div>' for f in updated_files])}
-            </div>
-        </div>
-        ''' if updated_files else ''}
-    </div>
-</body>
-</html>
-"""
+    linked_images = "".join(
+        LINKED_IMAGES_ITEM.render(
+            trade_id=trade_id,
+            image_count=len(images),
+            plural="s" if len(images) != 1 else "",
+            images="".join(
+                [f'<div class="image-item">• {img}</div>' for img in images]
+            ),
+        )
+        for trade_id, images in trade_images.items()
+    )
+
+    if orphaned:
+        orphaned_section = ORPHANED_SECTION.render(
+            images="".join(
+                [f'<div class="image-item warning">• {img}</div>' for img in orphaned]
+            )
+        )
+    else:
+        orphaned_section = NO_ORPHANS_SECTION
+
+    if updated_files:
+        updated_section = UPDATED_SECTION.render(
+            files="".join(
+                [f'<div class="image-item success">• {f}</div>' for f in updated_files]
+            )
+        )
+    else:
+        updated_section = ""
+
+    publish_assets("media-report.css")
+    report_html = load_template("media-validation-report.html.template").render(
+        page_css=asset_url("media-report.css"),
+        generated=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        total_images=total_images,
+        trades_with_images=len(trade_images),
+        orphaned_class="warning" if orphaned else "success",
+        orphaned_count=len(orphaned),
+        updated_count=len(updated_files),
+        linked_images=linked_images,
+        orphaned_section=orphaned_section,
+        updated_section=updated_section,
+    )
 
     # Write report to file
     report_path = Path("index.directory/media-validation-report.html")
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Benchmark Imports Script
+Measures broker CSV parsing throughput in rows per second
+
+Synthetic exports for every built-in broker are written to a temporary
+directory and streamed through importer.iter_transactions(). Each broker
+is timed twice:
+- sniffed: the file's timestamp format is picked once from its first rows
+  and parsed by slicing, with repeated strings cached (the import path)
+- baseline: every row tries the mapping's formats with strptime in order,
+  as the importers did before per-file sniffing
+
+Usage:
+    python .github/scripts/benchmark_imports.py
+    python .github/scripts/benchmark_imports.py --rows 500000 --repeat 5
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from globals_utils import setup_imports
+
+# Setup imports
+setup_imports(__file__)
+from importers import get_importer
+
+BROKERS = ["ibkr", "schwab", "robinhood", "webull"]
+
+HEADERS = {
+    "ibkr": "Symbol,Date/Time,Quantity,T. Price,Proceeds,Comm/Fee,Basis,Realized P/L",
+    "schwab": "Date,Action,Symbol,Description,Quantity,Price,Fees & Comm,Amount",
+    "robinhood": (
+        "Activity Date,Process Date,Settle Date,Instrument,Description,"
+        "Trans Code,Quantity,Price,Amount"
+    ),
+    "webull": "Time,Symbol,Side,Filled/Quantity,Filled Avg Price,Total,Status",
+}
+
+
+def synthetic_row(broker, rng, when):
+    """
+    One CSV row in the broker's export layout
+
+    Args:
+        broker (str): Broker name
+        rng (random.Random): Random source
+        when (datetime): Execution time
+
+    Returns:
+        str: CSV line without newline
+    """
+    symbol = f"S{rng.randint(0, 199):03d}"
+    quantity = rng.choice([10, 50, 100, 250])
+    price = f"{rng.uniform(0.5, 20):.2f}"
+    side = rng.choice(["Buy", "Sell"])
+    if broker == "ibkr":
+        signed = quantity if side == "Buy" else -quantity
+        stamp = when.strftime("%Y-%m-%d %H:%M:%S")
+        return f"{symbol},{stamp},{signed},{price},0,-1.00,0,0"
+    if broker == "schwab":
+        stamp = when.strftime("%m/%d/%Y")
+        return f"{stamp},{side},{symbol},DESC,{quantity},${price},$0.65,0"
+    if broker == "robinhood":
+        stamp = when.strftime("%m/%d/%Y")
+        return f"{stamp},{stamp},{stamp},{symbol},DESC,{side},{quantity},${price},0"
+    stamp = when.strftime("%Y-%m-%d %H:%M:%S")
+    return f"{stamp},{symbol},{side},{quantity}/{quantity},{price},0,Filled"
+
+
+def write_export(broker, rows, directory, seed):
+    """
+    Write a synthetic export and return its path
+
+    Args:
+        broker (str): Broker name
+        rows (int): Data rows
+        directory (str): Output directory
+        seed (int): Random seed
+
+    Returns:
+        str: CSV file path
+    """
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 2, 9, 30)
+    path = os.path.join(directory, f"{broker}.csv")
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(HEADERS[broker] + "\n")
+        for i in range(rows):
+            when = start + timedelta(seconds=7 * i)
+            f.write(synthetic_row(broker, rng, when) + "\n")
+    return path
+
+
+def baseline_timestamp_parser(samples, formats):
+    """strptime over every format for every row (no sniffing, no cache)"""
+
+    def parse(value):
+        for candidate in (value, value.split()[0]):
+            for fmt in formats:
+                try:
+                    return datetime.strptime(candidate, fmt)
+                except ValueError:
+                    continue
+        return None
+
+    return parse
+
+
+def time_parse(importer, path, repeat):
+    """
+    Best-of-N time to stream a file through iter_transactions()
+
+    Returns:
+        tuple: (executions yielded, seconds)
+    """
+    best = None
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            count = sum(1 for _ in importer.iter_transactions(f))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return count, best
+
+
+def main():
+    """Main benchmark execution"""
+    parser = argparse.ArgumentParser(description="Benchmark broker CSV parsing")
+    parser.add_argument(
+        "--rows", type=int, default=200000, help="Rows per export (default: 200000)"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    parser.add_argument("--seed", type=int, default=2025, help="Random seed")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"IMPORT THROUGHPUT ({args.rows:,} rows per broker, best of {args.repeat})")
+    print("=" * 70)
+    print(f"{'Broker':<12}{'Baseline rows/s':>18}{'Sniffed rows/s':>18}{'Speedup':>10}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for broker in BROKERS:
+            path = write_export(broker, args.rows, directory, args.seed)
+            importer = get_importer(broker)
+
+            importer.timestamp_parser = baseline_timestamp_parser
+            baseline_count, baseline = time_parse(importer, path, args.repeat)
+            del importer.timestamp_parser
+            count, sniffed = time_parse(importer, path, args.repeat)
+
+            if count != baseline_count:
+                print(f"✗ {broker}: {count} executions vs {baseline_count} baseline")
+                return 1
+            print(
+                f"{broker:<12}{count / baseline:>18,.0f}{count / sniffed:>18,.0f}"
+                f"{baseline / sniffed:>9.1f}x"
+            )
+
+    print("=" * 70)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
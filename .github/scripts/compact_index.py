@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Compact Trades Index
+Writes a compact, column-oriented variant of trades-index.json for the dashboard
+
+trades-index.json stays as-is for existing consumers. trades-compact.json holds
+the same trades as:
+- a column header and one array per trade
+- dictionary-encoded ticker, direction, strategy, broker and tags
+- dates as epoch days, times as minutes after midnight
+- prices as fixed-point integers (1/10000), P&L as integer cents
+
+Bodies, notes, file paths, screenshots and any other fields move to lazily
+fetched detail shards (index.directory/trade-details/details-NNNN.json), one
+object per trade in row order. A value the encoding cannot reproduce exactly
+(e.g. a price with more than 4 decimals) is also kept in the detail shard,
+so decode_compact_index() restores every trade exactly.
+
+Performance Optimizations:
+- Only detail shards whose trades changed are rewritten
+  (fingerprints in index.directory/.cache/trade-details.json)
+- Compact JSON without indentation
+
+Usage:
+    python .github/scripts/compact_index.py
+    python .github/scripts/compact_index.py --verify
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import date, timedelta
+
+from globals_utils import setup_imports
+
+# Setup imports
+setup_imports(__file__)
+from utils import OutputManifest, fingerprint, load_trades_index
+
+COMPACT_INDEX_PATH = "index.directory/trades-compact.json"
+DETAILS_DIR = "index.directory/trade-details"
+
+# Bump when the column layout or an encoding changes
+COMPACT_FORMAT_VERSION = 1
+
+# Trades per detail shard
+DETAIL_SHARD_SIZE = 100
+
+# (column, encoding); fixed:N stores round(value * N) as an integer
+COMPACT_COLUMNS = [
+    ("trade_number", "int"),
+    ("ticker", "dict:ticker"),
+    ("direction", "dict:direction"),
+    ("entry_date", "epoch_day"),
+    ("entry_time", "minutes"),
+    ("exit_date", "epoch_day"),
+    ("exit_time", "minutes"),
+    ("entry_price", "fixed:10000"),
+    ("exit_price", "fixed:10000"),
+    ("position_size", "fixed:1"),
+    ("strategy", "dict:strategy"),
+    ("broker", "dict:broker"),
+    ("stop_loss", "fixed:10000"),
+    ("target_price", "fixed:10000"),
+    ("risk_reward_ratio", "fixed:100"),
+    ("pnl_usd", "fixed:100"),
+    ("pnl_percent", "fixed:100"),
+    ("strategy_tags", "dict_list:tags"),
+    ("setup_tags", "dict_list:tags"),
+    ("session_tags", "dict_list:tags"),
+    ("market_condition_tags", "dict_list:tags"),
+]
+
+EPOCH = date(1970, 1, 1)
+
+
+def _encode_value(value, encoding, dictionaries):
+    """
+    Encode one value
+
+    Returns:
+        Encoded value, or None if the value cannot be encoded
+    """
+    kind, _, arg = encoding.partition(":")
+    try:
+        if kind == "int":
+            return int(value)
+        if kind == "fixed":
+            return round(float(value) * int(arg))
+        if kind == "epoch_day":
+            return (date.fromisoformat(str(value)) - EPOCH).days
+        if kind == "minutes":
+            hours, minutes = str(value).split(":")[:2]
+            return int(hours) * 60 + int(minutes)
+        if kind == "dict":
+            return dictionaries[arg].setdefault(str(value), len(dictionaries[arg]))
+        if kind == "dict_list":
+            return [dictionaries[arg].setdefault(str(v), len(dictionaries[arg])) for v in value]
+    except (TypeError, ValueError):
+        return None
+    return None
+
+
+def _decode_value(value, encoding, dictionaries):
+    """Inverse of _encode_value; dictionaries map name -> list of strings"""
+    kind, _, arg = encoding.partition(":")
+    if kind == "int":
+        return value
+    if kind == "fixed":
+        return value / int(arg)
+    if kind == "epoch_day":
+        return (EPOCH + timedelta(days=value)).isoformat()
+    if kind == "minutes":
+        return f"{value // 60:02d}:{value % 60:02d}"
+    if kind == "dict":
+        return dictionaries[arg][value]
+    if kind == "dict_list":
+        return [dictionaries[arg][v] for v in value]
+    return value
+
+
+def _round_trips(value, encoded, encoding):
+    """True if encoded decodes back to exactly value"""
+    kind = encoding.partition(":")[0]
+    if kind == "dict":
+        return isinstance(value, str)
+    if kind == "dict_list":
+        return isinstance(value, list) and all(isinstance(v, str) for v in value)
+    decoded = _decode_value(encoded, encoding, None)
+    return decoded == value and type(decoded) is type(value)
+
+
+def encode_compact_index(index_data):
+    """
+    Encode a trades index into the compact layout
+
+    Args:
+        index_data (dict): Contents of trades-index.json
+
+    Returns:
+        tuple: (compact payload without the detail shard list,
+                list of per-trade detail dicts in row order)
+    """
+    dictionaries = {}
+    for _, encoding in COMPACT_COLUMNS:
+        if encoding.startswith("dict"):
+            dictionaries.setdefault(encoding.partition(":")[2], {})
+
+    column_names = {name for name, _ in COMPACT_COLUMNS}
+    rows = []
+    details = []
+    for trade in index_data.get("trades", []):
+        row = []
+        detail = {key: value for key, value in trade.items() if key not in column_names}
+        for name, encoding in COMPACT_COLUMNS:
+            value = trade.get(name)
+            encoded = None
+            if value is not None:
+                encoded = _encode_value(value, encoding, dictionaries)
+                # Keep values the encoding would alter in the detail shard
+                if encoded is None or not _round_trips(value, encoded, encoding):
+                    detail[name] = value
+            row.append(encoded)
+        rows.append(row)
+        details.append(detail)
+
+    payload = {
+        "version": COMPACT_FORMAT_VERSION,
+        "generated_at": index_data.get("generated_at"),
+        "statistics": index_data.get("statistics", {}),
+        "columns": [name for name, _ in COMPACT_COLUMNS],
+        "encodings": [encoding for _, encoding in COMPACT_COLUMNS],
+        "dictionaries": _as_lists(dictionaries),
+        "rows": rows,
+    }
+    return payload, details
+
+
+def _as_lists(dictionaries):
+    """Dictionary name -> list of strings in code order"""
+    return {name: list(codes) for name, codes in dictionaries.items()}
+
+
+def decode_compact_index(payload, details=None):
+    """
+    Decode a compact payload back into trade dicts
+
+    Args:
+        payload (dict): Contents of trades-compact.json
+        details (list): Optional per-trade detail dicts in row order
+
+    Returns:
+        list: Trade dictionaries
+    """
+    dictionaries = payload["dictionaries"]
+    trades = []
+    for position, row in enumerate(payload["rows"]):
+        trade = {}
+        for name, encoding, value in zip(payload["columns"], payload["encodings"], row):
+            if value is not None:
+                trade[name] = _decode_value(value, encoding, dictionaries)
+        if details is not None:
+            trade.update(details[position])
+        trades.append(trade)
+    return trades
+
+
+def write_compact_index(index_data):
+    """
+    Write trades-compact.json and the changed detail shards
+
+    Args:
+        index_data (dict): Contents of trades-index.json
+
+    Returns:
+        tuple: (detail shards written, total detail shards)
+    """
+    payload, details = encode_compact_index(index_data)
+
+    os.makedirs(DETAILS_DIR, exist_ok=True)
+    manifest = OutputManifest("trade-details")
+    shards = []
+    written = 0
+    for number, offset in enumerate(range(0, len(details), DETAIL_SHARD_SIZE)):
+        shard = details[offset : offset + DETAIL_SHARD_SIZE]
+        path = os.path.join(DETAILS_DIR, f"details-{number:04d}.json")
+        shard_fingerprint = fingerprint(COMPACT_FORMAT_VERSION, shard)
+        if not manifest.is_fresh(path, shard_fingerprint):
+            content = json.dumps(shard, ensure_ascii=False, separators=(",", ":"))
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+            manifest.record(path, shard_fingerprint, content)
+            written += 1
+        shards.append(
+            {
+                "file": os.path.relpath(path, "index.directory").replace(os.sep, "/"),
+                "version": manifest.digest(path)[:12],
+            }
+        )
+
+    # Remove shards left over from a longer index
+    expected = {os.path.basename(shard["file"]) for shard in shards}
+    for filename in os.listdir(DETAILS_DIR):
+        if filename.startswith("details-") and filename not in expected:
+            path = os.path.join(DETAILS_DIR, filename)
+            os.remove(path)
+            manifest.discard(path)
+    manifest.save()
+
+    payload["detail_shard_size"] = DETAIL_SHARD_SIZE
+    payload["detail_shards"] = shards
+    with open(COMPACT_INDEX_PATH, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+
+    return written, len(shards)
+
+
+def verify_compact_index(index_data):
+    """
+    Check that the compact index decodes back to the original trades
+
+    Args:
+        index_data (dict): Contents of trades-index.json
+
+    Returns:
+        int: Number of trades that do not round-trip
+    """
+    payload, details = encode_compact_index(index_data)
+    decoded = decode_compact_index(json.loads(json.dumps(payload)), details)
+    mismatches = 0
+    for original, restored in zip(index_data.get("trades", []), decoded):
+        expected = {k: v for k, v in original.items() if v is not None}
+        if expected != restored:
+            mismatches += 1
+            print(f"Mismatch: trade {original.get('trade_number')} {original.get('ticker')}")
+    return mismatches
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Write the compact trades index")
+    parser.add_argument(
+        "--verify", action="store_true", help="Check the encoding round-trips, write nothing"
+    )
+    args = parser.parse_args()
+
+    index_data = load_trades_index()
+    if not index_data:
+        return 1
+
+    if args.verify:
+        mismatches = verify_compact_index(index_data)
+        print(f"{len(index_data.get('trades', []))} trade(s), {mismatches} mismatch(es)")
+        return 1 if mismatches else 0
+
+    written, total = write_compact_index(index_data)
+    print(f"✓ Compact index written to {COMPACT_INDEX_PATH}")
+    print(f"  Detail shards: {written} written, {total - written} unchanged")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
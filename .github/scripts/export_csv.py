@@ -1,36 +1,58 @@
 #!/usr/bin/env python3
 """
 Export CSV Script
-Exports trades from trades-index.json to CSV format
+Exports trades from the trade store (or trades-index.json) to CSV format
 
 Features:
-- Export all trades or filter by strategy, date range
+- Export all trades or filter by strategy, ticker, broker, tag, P&L sign
+  and entry date range
 - Configurable output file path
 - Standard CSV format compatible with spreadsheet applications
+
+Performance Optimizations:
+- Filters run as one indexed SQL query on the trade store written by
+  parse_trades.py (index.directory/.cache/trades.sqlite)
+- Matching trades stream from the query cursor into the CSV writer
+- When the store is missing or older than trades-index.json, the index is
+  loaded into an in-memory store and queried the same way
 """
 
 import csv
 import argparse
 from datetime import datetime
-import os
+from itertools import chain
 from globals_utils import setup_imports
 
 # Setup imports
 setup_imports(__file__)
 from utils import load_trades_index
+from trade_store import (
+    PNL_CONDITIONS,
+    TRADE_STORE_PATH,
+    open_trade_store,
+    trade_store_from_index,
+)
 
 
 def export_to_csv(trades, output_file="trades-export.csv"):
     """
     Export trades to CSV file with comprehensive trade data
 
+    Trades are written as they are read, so a query cursor streams
+    straight into the file.
+
     Args:
-        trades (list): List of trade dictionaries
+        trades (iterable): Trade dictionaries (list or generator)
         output_file (str): Output CSV file path
+
+    Returns:
+        int: Number of trades exported
     """
-    if not trades:
+    trades = iter(trades)
+    first = next(trades, None)
+    if first is None:
         print("No trades to export")
-        return
+        return 0
 
     # Define CSV fields - comprehensive set of trade attributes
     fields = [
@@ -61,15 +83,19 @@ def export_to_csv(trades, output_file="trades-export.csv"):
             writer.writeheader()
 
             # Write trades
-            for trade in trades:
+            count = 0
+            for trade in chain([first], trades):
                 # Flatten nested fields if needed
                 row = {field: trade.get(field, "") for field in fields}
                 writer.writerow(row)
+                count += 1
 
-        print(f"Exported {len(trades)} trade(s) to {output_file}")
+        print(f"Exported {count} trade(s) to {output_file}")
+        return count
 
     except Exception as e:
         print(f"Error exporting to CSV: {e}")
+        return 0
 
 
 def main():
@@ -86,6 +112,16 @@ def main():
         "--filter-date-from", help="Filter trades from date (YYYY-MM-DD)"
     )
     parser.add_argument("--filter-date-to", help="Filter trades to date (YYYY-MM-DD)")
+    parser.add_argument("--filter-ticker", help="Filter by ticker symbol")
+    parser.add_argument("--filter-broker", help="Filter by broker name")
+    parser.add_argument(
+        "--filter-tag", help="Filter by tag (strategy, setup, session or market tag)"
+    )
+    parser.add_argument(
+        "--filter-pnl",
+        choices=sorted(PNL_CONDITIONS),
+        help="Filter by P&L sign",
+    )
 
     args = parser.parse_args()
 
@@ -93,71 +129,46 @@ def main():
     print("SFTi-Pennies CSV Exporter")
     print("=" * 60)
 
-    # Load trades
-    index_data = load_trades_index()
-    if not index_data:
-        return
-
-    trades = index_data.get("trades", [])
-    print(f"Loaded {len(trades)} trade(s) from index")
-
-    # Apply filters
-    if args.filter_strategy:
-        trades = [
-            t
-            for t in trades
-            if t.get("strategy", "").lower() == args.filter_strategy.lower()
-        ]
-        print(
-            f"Filtered to {len(trades)} trade(s) with strategy '{args.filter_strategy}'"
-        )
-
-    if args.filter_date_from:
-        # Filter trades from date (inclusive)
+    filters = {
+        "strategy": args.filter_strategy,
+        "ticker": args.filter_ticker,
+        "broker": args.filter_broker,
+        "tag": args.filter_tag,
+        "pnl": args.filter_pnl,
+    }
+
+    # Date bounds are parsed once here; stored entry dates are already ISO
+    for key, flag, value in (
+        ("date_from", "--filter-date-from", args.filter_date_from),
+        ("date_to", "--filter-date-to", args.filter_date_to),
+    ):
+        if not value:
+            continue
         try:
-            from_date = datetime.strptime(args.filter_date_from, "%Y-%m-%d")
-            filtered_trades = []
-            for t in trades:
-                entry_date = t.get("entry_date", "")
-                if entry_date:  # Skip trades with missing dates
-                    try:
-                        if datetime.strptime(entry_date, "%Y-%m-%d") >= from_date:
-                            filtered_trades.append(t)
-                    except ValueError:
-                        # Skip trades with invalid date format
-                        continue
-            trades = filtered_trades
-            print(f"Filtered to {len(trades)} trade(s) from {args.filter_date_from}")
+            filters[key] = datetime.strptime(value, "%Y-%m-%d").date().isoformat()
         except ValueError:
-            print(
-                f"Warning: Invalid date format for --filter-date-from (expected YYYY-MM-DD)"
-            )
+            print(f"Warning: Invalid date format for {flag} (expected YYYY-MM-DD)")
+    filters = {key: value for key, value in filters.items() if value}
 
-    if args.filter_date_to:
-        # Filter trades to date (inclusive)
-        try:
-            to_date = datetime.strptime(args.filter_date_to, "%Y-%m-%d")
-            filtered_trades = []
-            for t in trades:
-                entry_date = t.get("entry_date", "")
-                if entry_date:  # Skip trades with missing dates
-                    try:
-                        if datetime.strptime(entry_date, "%Y-%m-%d") <= to_date:
-                            filtered_trades.append(t)
-                    except ValueError:
-                        # Skip trades with invalid date format
-                        continue
-            trades = filtered_trades
-            print(f"Filtered to {len(trades)} trade(s) until {args.filter_date_to}")
-        except ValueError:
-            print(
-                f"Warning: Invalid date format for --filter-date-to (expected YYYY-MM-DD)"
-            )
+    # Query the trade store, or the index when the store is behind it
+    store = open_trade_store()
+    if store:
+        print(f"Querying {store.count()} trade(s) in {TRADE_STORE_PATH}")
+    else:
+        index_data = load_trades_index()
+        if not index_data:
+            return
+        trades = index_data.get("trades", [])
+        print(f"Loaded {len(trades)} trade(s) from index")
+        store = trade_store_from_index(trades)
+
+    if filters:
+        print("Filters: " + ", ".join(f"{key}={value}" for key, value in filters.items()))
 
     # Export
-    if trades:
-        export_to_csv(trades, args.output)
-    else:
+    exported = export_to_csv(store.query(**filters), args.output)
+    store.close()
+    if not exported and filters:
         print("No trades match filters")
 
     print("=" * 60)
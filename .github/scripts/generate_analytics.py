@@ -21,7 +21,7 @@ from globals_utils import setup_imports, save_json_file, ensure_directory
 
 # Setup imports
 setup_imports(__file__)
-from utils import load_trades_index, load_account_config
+from utils import load_trades_index, load_account_config, load_daily_series, daily_series_dates
 
 # Constants
 MAX_PROFIT_FACTOR = 999.99  # Used when profit factor would be infinity (all wins, no losses)
@@ -274,6 +274,41 @@ def calculate_drawdown_series(trades: List[Dict]) -> Dict:
     return {"labels": labels, "values": drawdowns}
 
 
+def calculate_daily_drawdown_series(daily_series: Dict) -> Dict:
+    """
+    Calculate end-of-day drawdown from the materialized daily series
+
+    Works on one value per day with trades instead of one per trade, so its
+    cost depends on the length of the history rather than the trade count.
+
+    Args:
+        daily_series: Daily series from utils.load_daily_series()
+
+    Returns:
+        Dict: {'labels': [...], 'values': [...]}
+    """
+    labels = []
+    values = []
+    running_total = 0.0
+    peak = 0.0
+
+    for day, pnl, count in zip(
+        daily_series_dates(daily_series),
+        daily_series.get("pnl", []),
+        daily_series.get("trade_count", []),
+    ):
+        # The series has a slot per calendar day; only trading days are plotted
+        if not count:
+            continue
+        running_total += pnl
+        if running_total > peak:
+            peak = running_total
+        labels.append(day.strftime("%m/%d"))
+        values.append(round(running_total - peak, 2))
+
+    return {"labels": labels, "values": values}
+
+
 def calculate_kelly_criterion(trades: List[Dict]) -> float:
     """
     Calculate Kelly Criterion percentage
@@ -594,6 +629,7 @@ def main():
             "by_setup": {},
             "by_session": {},
             "drawdown_series": {"labels": [], "values": []},
+            "daily_drawdown_series": {"labels": [], "values": []},
             "account": {
                 "starting_balance": starting_balance,
                 "total_deposits": total_deposits,
@@ -619,6 +655,9 @@ def main():
             min(drawdown_series["values"]) if drawdown_series["values"] else 0
         )
         kelly = calculate_kelly_criterion(sorted_trades)
+        daily_drawdown_series = calculate_daily_drawdown_series(
+            load_daily_series(sorted_trades)
+        )
         
         # Calculate advanced analytics
         sharpe_ratio = calculate_sharpe_ratio(sorted_trades)
@@ -653,6 +692,7 @@ def main():
             "by_setup": by_setup,
             "by_session": by_session,
             "drawdown_series": drawdown_series,
+            "daily_drawdown_series": daily_drawdown_series,
             "returns": {
                 "total_return_percent": returns_metrics["total_return_percent"],
                 "avg_return_percent": returns_metrics["avg_return_percent"],
@@ -5,15 +5,16 @@ Generates equity curve data in Chart.js compatible JSON format
 and creates a static chart image using matplotlib (if available)
 """
 
+import heapq
 import json
 import os
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from collections import defaultdict
 from globals_utils import setup_imports, ensure_directory, save_json_file
 
 # Setup imports
 setup_imports(__file__)
-from utils import load_trades_index, load_account_config
+from utils import load_trades_index, load_account_config, load_daily_series
 
 # Try to import matplotlib, but don't fail if it's not available
 try:
@@ -38,6 +39,29 @@ TRADING_SESSION_ORDER = [
     "Extended Hours"
 ]
 
+# Weekday row order for the intraday heatmap (matches date.weekday())
+WEEKDAY_NAMES = [
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+]
+
+# Bin width in minutes for the intraday minute-of-day x weekday matrix
+INTRADAY_BIN_MINUTES = 5
+
+# Number of tickers shown on the ticker performance leaderboard
+TICKER_LEADERBOARD_SIZE = 20
+
+# Per-ticker detail shards are keyed by this many leading ticker characters
+TICKER_SHARD_PREFIX_LENGTH = 1
+# Kept out of assets/charts/: the service worker answers assets/charts/*.json
+# requests by file name alone, which would drop the subdirectory
+TICKER_SHARD_DIR = "index.directory/assets/tickers"
+
 
 def generate_equity_curve_data(trades):
     """
@@ -424,12 +448,13 @@ def generate_performance_by_day_data(trades):
     }
 
 
-def generate_ticker_performance_data(trades):
+def generate_ticker_performance_data(trades, top_n=TICKER_LEADERBOARD_SIZE):
     """
     Generate performance by ticker data in Chart.js format
 
     Args:
         trades (list): List of trade dictionaries
+        top_n (int): Number of tickers to keep on the leaderboard
 
     Returns:
         dict: Chart.js compatible data structure
@@ -440,32 +465,23 @@ def generate_ticker_performance_data(trades):
             "datasets": [{"label": "Total P&L", "data": [], "backgroundColor": []}],
         }
 
-    # Aggregate by ticker
-    ticker_stats = {}
+    # Aggregate total P&L by ticker
+    ticker_pnl = defaultdict(float)
 
     for trade in trades:
-        ticker = trade.get("ticker", "UNKNOWN")
-        pnl = trade.get("pnl_usd", 0)
+        ticker_pnl[trade.get("ticker", "UNKNOWN")] += trade.get("pnl_usd", 0)
 
-        if ticker not in ticker_stats:
-            ticker_stats[ticker] = {"total_pnl": 0, "count": 0}
-
-        ticker_stats[ticker]["total_pnl"] += pnl
-        ticker_stats[ticker]["count"] += 1
-
-    # Sort by total P&L (descending)
-    sorted_tickers = sorted(
-        ticker_stats.items(), key=lambda x: x[1]["total_pnl"], reverse=True
-    )
+    # Select the leaderboard with a bounded heap instead of sorting every ticker
+    # (nlargest keeps the same tie order as a stable descending sort)
+    top_tickers = heapq.nlargest(top_n, ticker_pnl.items(), key=lambda x: x[1])
 
     # Prepare data
     labels = []
     total_pnls = []
     colors = []
 
-    for ticker, stats in sorted_tickers[:20]:  # Top 20 tickers
+    for ticker, total_pnl in top_tickers:
         labels.append(ticker)
-        total_pnl = stats["total_pnl"]
         total_pnls.append(round(total_pnl, 2))
         colors.append("#00ff88" if total_pnl >= 0 else "#ff4757")
 
@@ -554,6 +570,275 @@ def generate_time_of_day_performance_data(trades):
     }
 
 
+def _parse_day_ordinal(date_str):
+    """
+    Convert a YYYY-MM-DD date string into a proleptic Gregorian ordinal
+
+    Args:
+        date_str (str): Date string (a trailing time component is ignored)
+
+    Returns:
+        int: Day ordinal, or None if the date cannot be parsed
+    """
+    try:
+        return date.fromisoformat(str(date_str)[:10]).toordinal()
+    except (ValueError, TypeError):
+        return None
+
+
+def _minute_of_day(time_str):
+    """
+    Convert an HH:MM or HH:MM:SS time string into minutes since midnight
+
+    Args:
+        time_str (str): Time string
+
+    Returns:
+        int: Minute of day (0-1439), or None if the time cannot be parsed
+    """
+    if not time_str:
+        return None
+    parts = str(time_str).split(":")
+    if len(parts) < 2:
+        return None
+    try:
+        minute = int(parts[0]) * 60 + int(parts[1])
+    except ValueError:
+        return None
+    return minute if 0 <= minute < 1440 else None
+
+
+def generate_calendar_heatmap_data(daily_series):
+    """
+    Generate a dense daily P&L calendar grid covering the whole trade history
+
+    The daily series written by parse_trades.py (trades bucketed by exit
+    date) is already indexed by calendar day, so array index i is the day
+    origin + i and days without trades are zero-filled.
+
+    Args:
+        daily_series (dict): Daily series from utils.load_daily_series()
+
+    Returns:
+        dict: Calendar grid with origin date and parallel per-day arrays
+    """
+    if not daily_series or not daily_series.get("start_date"):
+        return {
+            "origin": None,
+            "origin_weekday": None,
+            "days": 0,
+            "pnl": [],
+            "count": [],
+            "wins": [],
+            "win_rate": [],
+        }
+
+    origin = date.fromisoformat(daily_series["start_date"])
+    count = daily_series["trade_count"]
+    wins = daily_series["win_count"]
+
+    return {
+        "origin": origin.isoformat(),
+        "origin_weekday": origin.weekday(),
+        "days": daily_series["days"],
+        "pnl": daily_series["pnl"],
+        "count": count,
+        "wins": wins,
+        "win_rate": [
+            round(w / c * 100, 1) if c else 0 for w, c in zip(wins, count)
+        ],
+    }
+
+
+def generate_intraday_heatmap_data(trades, bin_minutes=INTRADAY_BIN_MINUTES):
+    """
+    Generate a minute-of-day x weekday P&L matrix from trade timestamps
+
+    Trades are binned by entry time (falling back to exit time when no entry
+    time is recorded) using integer division into fixed-width minute bins.
+    Rows follow WEEKDAY_NAMES; column i covers minutes
+    [i * bin_minutes, (i + 1) * bin_minutes) after midnight.
+
+    Args:
+        trades (list): List of trade dictionaries
+        bin_minutes (int): Width of each time bin in minutes
+
+    Returns:
+        dict: Dense weekday x bin matrices for P&L, trade count and wins
+    """
+    bins_per_day = (1440 + bin_minutes - 1) // bin_minutes
+
+    pnl = [[0.0] * bins_per_day for _ in WEEKDAY_NAMES]
+    count = [[0] * bins_per_day for _ in WEEKDAY_NAMES]
+    wins = [[0] * bins_per_day for _ in WEEKDAY_NAMES]
+
+    for trade in trades:
+        minute = _minute_of_day(trade.get("entry_time"))
+        day_field = "entry_date"
+        if minute is None:
+            minute = _minute_of_day(trade.get("exit_time"))
+            day_field = "exit_date"
+        if minute is None:
+            continue
+
+        ordinal = _parse_day_ordinal(trade.get(day_field) or trade.get("entry_date"))
+        if ordinal is None:
+            continue
+
+        # date.fromordinal(1) is a Monday, so (ordinal - 1) % 7 == weekday()
+        weekday = (ordinal - 1) % 7
+        column = minute // bin_minutes
+        trade_pnl = trade.get("pnl_usd", 0) or 0
+
+        pnl[weekday][column] += trade_pnl
+        count[weekday][column] += 1
+        if trade_pnl > 0:
+            wins[weekday][column] += 1
+
+    return {
+        "origin": "00:00",
+        "bin_minutes": bin_minutes,
+        "bins_per_day": bins_per_day,
+        "weekdays": WEEKDAY_NAMES,
+        "pnl": [[round(value, 2) for value in row] for row in pnl],
+        "count": count,
+        "wins": wins,
+    }
+
+
+def ticker_shard_key(ticker, prefix_length=TICKER_SHARD_PREFIX_LENGTH):
+    """
+    Get the detail shard key for a ticker
+
+    Args:
+        ticker (str): Ticker symbol
+        prefix_length (int): Number of leading characters used as the key
+
+    Returns:
+        str: Shard key (uppercase alphanumerics, other characters become '_')
+    """
+    prefix = str(ticker)[:prefix_length].upper()
+    return "".join(c if c.isalnum() else "_" for c in prefix) or "_"
+
+
+def _hold_minutes(trade):
+    """
+    Calculate minutes between a trade's entry and exit timestamps
+
+    Args:
+        trade (dict): Trade dictionary
+
+    Returns:
+        int: Hold time in minutes, or None if either timestamp is incomplete
+    """
+    entry_day = _parse_day_ordinal(trade.get("entry_date"))
+    exit_day = _parse_day_ordinal(trade.get("exit_date") or trade.get("entry_date"))
+    entry_minute = _minute_of_day(trade.get("entry_time"))
+    exit_minute = _minute_of_day(trade.get("exit_time"))
+
+    if None in (entry_day, exit_day, entry_minute, exit_minute):
+        return None
+
+    return (exit_day - entry_day) * 1440 + exit_minute - entry_minute
+
+
+def generate_ticker_detail_shards(trades, prefix_length=TICKER_SHARD_PREFIX_LENGTH):
+    """
+    Generate per-ticker detail records grouped into shards by ticker prefix
+
+    The ticker view (ticker.html) only needs to fetch the one shard its
+    symbol falls into instead of the full trades index.
+
+    Args:
+        trades (list): List of trade dictionaries
+        prefix_length (int): Number of leading ticker characters per shard key
+
+    Returns:
+        dict: {shard_key: {ticker: detail_dict}}
+    """
+    by_ticker = defaultdict(list)
+    for trade in trades:
+        by_ticker[trade.get("ticker", "UNKNOWN")].append(trade)
+
+    shards = defaultdict(dict)
+
+    for ticker, ticker_trades in by_ticker.items():
+        # Chronological order so the cumulative series reads left to right
+        ticker_trades.sort(
+            key=lambda t: (
+                str(t.get("exit_date") or t.get("entry_date") or ""),
+                str(t.get("exit_time") or ""),
+            )
+        )
+
+        trade_ids = []
+        dates = []
+        cumulative_pnl = []
+        running_total = 0.0
+        win_count = 0
+        hold_total = 0
+        hold_count = 0
+
+        for trade in ticker_trades:
+            pnl = trade.get("pnl_usd", 0) or 0
+            running_total += pnl
+            if pnl > 0:
+                win_count += 1
+
+            hold = _hold_minutes(trade)
+            if hold is not None and hold >= 0:
+                hold_total += hold
+                hold_count += 1
+
+            trade_ids.append(f"trade-{int(trade.get('trade_number', 0)):03d}-{ticker}")
+            dates.append(str(trade.get("exit_date") or trade.get("entry_date") or ""))
+            cumulative_pnl.append(round(running_total, 2))
+
+        trade_count = len(ticker_trades)
+        shards[ticker_shard_key(ticker, prefix_length)][ticker] = {
+            "trade_ids": trade_ids,
+            "dates": dates,
+            "cumulative_pnl": cumulative_pnl,
+            "total_pnl": round(running_total, 2),
+            "trade_count": trade_count,
+            "win_rate": round(win_count / trade_count * 100, 1),
+            "avg_hold_minutes": round(hold_total / hold_count, 1) if hold_count else None,
+        }
+
+    return dict(shards)
+
+
+def save_ticker_detail_shards(shards, output_dir=TICKER_SHARD_DIR,
+                              prefix_length=TICKER_SHARD_PREFIX_LENGTH):
+    """
+    Write ticker detail shards and a small manifest, removing stale shards
+
+    Args:
+        shards (dict): Output of generate_ticker_detail_shards()
+        output_dir (str): Directory that holds the shard files
+        prefix_length (int): Prefix length used to build the shard keys
+    """
+    ensure_directory(output_dir)
+
+    for key, tickers in shards.items():
+        save_json_file(os.path.join(output_dir, f"{key}.json"), tickers)
+
+    # Drop shards whose prefix no longer has any trades
+    for filename in os.listdir(output_dir):
+        key, ext = os.path.splitext(filename)
+        if ext == ".json" and key != "index" and key not in shards:
+            os.remove(os.path.join(output_dir, filename))
+
+    save_json_file(
+        os.path.join(output_dir, "index.json"),
+        {
+            "prefix_length": prefix_length,
+            "shards": sorted(shards.keys()),
+            "ticker_count": sum(len(tickers) for tickers in shards.values()),
+        },
+    )
+
+
 def format_date_label(date, timeframe, interval=None):
     """
     Format a date object into a label string based on the timeframe and interval
@@ -1228,17 +1513,32 @@ def main():
     ticker_data = generate_ticker_performance_data(trades)
     save_json_file("index.directory/assets/charts/ticker-performance-data.json", ticker_data)
     print("  ✓ Ticker performance data saved")
+
+    # 4b. Per-ticker detail shards
+    ticker_shards = generate_ticker_detail_shards(trades)
+    save_ticker_detail_shards(ticker_shards)
+    print(f"  ✓ Ticker detail shards saved ({len(ticker_shards)} shard(s))")
     
     # 5. Time of Day Performance
     time_of_day_data = generate_time_of_day_performance_data(trades)
     save_json_file("index.directory/assets/charts/time-of-day-performance-data.json", time_of_day_data)
     print("  ✓ Time of day performance data saved")
+
+    # 6. Calendar Heatmap (daily P&L grid)
+    calendar_data = generate_calendar_heatmap_data(load_daily_series(trades))
+    save_json_file("index.directory/assets/charts/calendar-heatmap-data.json", calendar_data)
+    print("  ✓ Calendar heatmap data saved")
+
+    # 7. Intraday Heatmap (minute-of-day x weekday grid)
+    intraday_data = generate_intraday_heatmap_data(trades)
+    save_json_file("index.directory/assets/charts/intraday-heatmap-data.json", intraday_data)
+    print("  ✓ Intraday heatmap data saved")
     
-    # 6. Portfolio Value Charts (all timeframes)
+    # 8. Portfolio Value Charts (all timeframes)
     print("\nGenerating Portfolio Value charts...")
     generate_portfolio_value_charts(trades, account_config)
     
-    # 7. Total Return Charts (all timeframes)
+    # 9. Total Return Charts (all timeframes)
     print("\nGenerating Total Return charts...")
     generate_total_return_charts(trades, account_config)
 
@@ -3,12 +3,47 @@
 Generate Index Script
 Consolidates all parsed trade data and generates the master trades index
 This is essentially a wrapper that ensures parse_trades.py output is in the right place
+
+Also writes the all-trades listing: fixed-size JSON pages
+(index.directory/all-trades/page-NNNN.json) with precomputed sort orders in
+all-trades/index.json, browsed by a virtual-scrolling all-trades.html shell.
+Appending trades rewrites only the last page.
 """
 
 import json
 import os
 import shutil
 from navbar_template import get_navbar_html
+from globals_utils import setup_imports
+
+# Setup imports
+setup_imports(__file__)
+from utils import fingerprint, OutputManifest
+from template_engine import load_template
+from static_assets import asset_url, publish_assets
+
+# Listing pages for all-trades.html, fetched on demand by the page shell
+LISTING_DIR = "index.directory/all-trades"
+
+# Trades per listing page; changing it re-partitions every page
+LISTING_PAGE_SIZE = 100
+
+# Bump when the row layout changes to force every page to be rewritten
+LISTING_FORMAT_VERSION = 1
+
+# Row layout: each trade is stored as an array in this column order
+LISTING_COLUMNS = [
+    "link",
+    "trade_number",
+    "ticker",
+    "direction",
+    "entry_price",
+    "exit_price",
+    "position_size",
+    "pnl_usd",
+    "entry_date",
+    "strategy",
+]
 
 
 def main():
@@ -40,177 +75,148 @@ def main():
     create_trade_list_html(trades)
 
 
+def listing_sort_key(trade):
+    """
+    Storage order of the listing: chronological, so new trades land on the last page
+
+    Args:
+        trade (dict): Trade dictionary
+
+    Returns:
+        tuple: Sort key
+    """
+    return (
+        trade.get("entry_date") or "",
+        trade.get("entry_time") or "",
+        trade.get("trade_number", 0),
+        trade.get("ticker") or "",
+    )
+
+
+def listing_row(trade):
+    """
+    Compact listing row for a trade, in LISTING_COLUMNS order
+
+    Args:
+        trade (dict): Trade dictionary
+
+    Returns:
+        list: Row values
+    """
+    trade_number = trade.get("trade_number", 0)
+    ticker = trade.get("ticker", "UNKNOWN")
+    return [
+        f"trades/trade-{trade_number:03d}-{ticker}.html",
+        trade.get("trade_number", "N/A"),
+        trade.get("ticker", "N/A"),
+        trade.get("direction", "N/A"),
+        trade.get("entry_price", 0),
+        trade.get("exit_price", 0),
+        trade.get("position_size", 0),
+        trade.get("pnl_usd", 0),
+        trade.get("entry_date", "N/A"),
+        trade.get("strategy", "N/A"),
+    ]
+
+
+def sort_permutations(rows):
+    """
+    Precompute the listing's sort orders as permutations of row positions
+
+    Each array lists row positions in ascending order; the page reads it
+    backwards for descending order. Ties keep storage (chronological) order.
+
+    Args:
+        rows (list): Listing rows in storage order
+
+    Returns:
+        dict: {'date': [...], 'pnl': [...], 'ticker': [...]}
+    """
+    positions = range(len(rows))
+    pnl = LISTING_COLUMNS.index("pnl_usd")
+    ticker = LISTING_COLUMNS.index("ticker")
+    return {
+        "date": list(positions),
+        "pnl": sorted(positions, key=lambda i: rows[i][pnl] or 0),
+        "ticker": sorted(positions, key=lambda i: str(rows[i][ticker])),
+    }
+
+
+def write_listing_pages(trades):
+    """
+    Write the all-trades listing as fixed-size JSON pages plus an index
+
+    Page boundaries follow storage order, so appending trades rewrites only
+    the last page; unchanged pages are skipped via
+    index.directory/.cache/all-trades-pages.json.
+
+    Args:
+        trades (list): List of trade dictionaries
+
+    Returns:
+        tuple: (pages written, total pages)
+    """
+    os.makedirs(LISTING_DIR, exist_ok=True)
+    manifest = OutputManifest("all-trades-pages")
+
+    rows = [listing_row(t) for t in sorted(trades, key=listing_sort_key)]
+    pages = []
+    written = 0
+    for number, offset in enumerate(range(0, len(rows), LISTING_PAGE_SIZE)):
+        page_rows = rows[offset : offset + LISTING_PAGE_SIZE]
+        filename = f"page-{number:04d}.json"
+        path = os.path.join(LISTING_DIR, filename)
+        page_fingerprint = fingerprint(LISTING_FORMAT_VERSION, page_rows)
+
+        if not manifest.is_fresh(path, page_fingerprint):
+            content = json.dumps({"page": number, "rows": page_rows}, separators=(",", ":"))
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+            manifest.record(path, page_fingerprint, content)
+            written += 1
+
+        # The digest busts browser caches for rewritten pages
+        pages.append({"file": filename, "version": manifest.digest(path)[:12]})
+
+    # Remove pages left over from a longer listing
+    expected = {page["file"] for page in pages}
+    for filename in os.listdir(LISTING_DIR):
+        if filename.startswith("page-") and filename not in expected:
+            path = os.path.join(LISTING_DIR, filename)
+            os.remove(path)
+            manifest.discard(path)
+
+    listing_index = {
+        "total": len(rows),
+        "page_size": LISTING_PAGE_SIZE,
+        "columns": LISTING_COLUMNS,
+        "pages": pages,
+        "orders": sort_permutations(rows),
+    }
+    with open(os.path.join(LISTING_DIR, "index.json"), "w", encoding="utf-8") as f:
+        json.dump(listing_index, f, separators=(",", ":"))
+
+    manifest.save()
+    return written, len(pages)
+
+
 def create_trade_list_html(trades):
     """
-    Create a simple HTML page listing all trades
+    Create the all-trades page: a shell that virtual-scrolls the listing pages
 
     Args:
         trades (list): List of trade dictionaries
     """
-    # Generate table rows
-    rows = []
-    
-    if trades:
-        # Sort by trade number
-        sorted_trades = sorted(trades, key=lambda t: t.get("trade_number", 0), reverse=True)
-        
-        for trade in sorted_trades:
-            pnl = trade.get("pnl_usd", 0)
-            pnl_class = "positive" if pnl >= 0 else "negative"
-            pnl_sign = "+" if pnl >= 0 else ""
-
-            # Generate trade page link
-            trade_number = trade.get("trade_number", 0)
-            ticker = trade.get("ticker", "UNKNOWN")
-            trade_link = f"trades/trade-{trade_number:03d}-{ticker}.html"
-
-            rows.append(
-                f"""
-        <tr style="cursor: pointer;" onclick="window.location.href='{trade_link}'">
-            <td><a href="{trade_link}" style="color: inherit; text-decoration: none;">#{trade.get('trade_number', 'N/A')}</a></td>
-            <td><a href="{trade_link}" style="color: inherit; text-decoration: none;"><strong>{trade.get('ticker', 'N/A')}</strong></a></td>
-            <td>{trade.get('direction', 'N/A')}</td>
-            <td>${trade.get('entry_price', 0):.4f}</td>
-            <td>${trade.get('exit_price', 0):.4f}</td>
-            <td>{trade.get('position_size', 0):,}</td>
-            <td class="{pnl_class}">{pnl_sign}${abs(pnl):.2f}</td>
-            <td>{trade.get('entry_date', 'N/A')}</td>
-            <td>{trade.get('strategy', 'N/A')}</td>
-        </tr>
-        """
-            )
-    else:
-        # Show empty state message
-        rows.append(
-            """
-        <tr>
-            <td colspan="9" style="text-align: center; padding: 3rem; color: var(--text-secondary);">
-                No trades recorded yet. Add your first trade to get started!
-            </td>
-        </tr>
-        """
-        )
-
-    html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0, viewport-fit=cover">
-    <meta name="description" content="Complete list of all recorded trades">
-    <meta name="theme-color" content="#00ff88">
-    
-    <title>All Trades - SFTi-Pennies</title>
-    
-    <!-- Fonts -->
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&family=JetBrains+Mono:wght@400;500;600;700&display=swap" rel="stylesheet">
-    
-    <!-- Tailwind CDN -->
-    <script src="https://cdn.tailwindcss.com"></script>
-    
-    <!-- Custom Styles -->
-    <link rel="stylesheet" href="assets/css/main.css">
-    <link rel="stylesheet" href="assets/css/glass-effects.css">
-    <link rel="stylesheet" href="assets/css/review-trades.css">
-    <link rel="stylesheet" href="assets/css/glowing-bubbles.css">
-    
-    <!-- PWA Manifest -->
-    <link rel="manifest" href="../manifest.json">
-    
-    <!-- Icons -->
-    <link rel="icon" type="image/png" sizes="192x192" href="assets/icons/icon-192.png">
-    
-    <style>
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            background-color: var(--bg-secondary);
-            border: 1px solid var(--border-color);
-            border-radius: 8px;
-            overflow: hidden;
-        }}
-        th, td {{
-            padding: 1rem;
-            text-align: left;
-            border-bottom: 1px solid var(--border-color);
-        }}
-        th {{
-            background-color: var(--bg-tertiary);
-            font-weight: 600;
-            color: var(--accent-green);
-            text-transform: uppercase;
-            font-size: 0.875rem;
-            letter-spacing: 0.05em;
-        }}
-        tr:hover {{
-            background-color: var(--bg-tertiary);
-            cursor: pointer;
-        }}
-        tr a {{
-            display: block;
-            width: 100%;
-            height: 100%;
-        }}
-        .positive {{
-            color: var(--accent-green);
-            font-weight: 600;
-        }}
-        .negative {{
-            color: var(--accent-red);
-            font-weight: 600;
-        }}
-    </style>
-</head>
-<body>
-    <canvas id="bg-canvas"></canvas>
-    
-{get_navbar_html("directory")}
-    
-    <main class="container">
-        <h1>All Trades</h1>
-        <p style="color: var(--text-secondary); margin-bottom: 2rem;">
-            Complete list of all recorded trades
-        </p>
-        
-        <div style="overflow-x: auto;">
-            <table>
-                <thead>
-                    <tr>
-                        <th>Trade #</th>
-                        <th>Ticker</th>
-                        <th>Direction</th>
-                        <th>Entry</th>
-                        <th>Exit</th>
-                        <th>Size</th>
-                        <th>P&L</th>
-                        <th>Date</th>
-                        <th>Strategy</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {''.join(rows)}
-                </tbody>
-            </table>
-        </div>
-    </main>
-    
-    <!-- Footer - Generated by footer.js -->
-    
-    <!-- Load shared utilities first -->
-    <script src="assets/js/utils.js"></script>
-    <script src="assets/js/chartConfig.js"></script>
-    
-    <!-- Application scripts -->
-    <script src="assets/js/navbar.js"></script>
-    <script src="assets/js/footer.js"></script>
-    <script src="assets/js/background.js"></script>
-    <script src="assets/js/auth.js"></script>
-    <script src="assets/js/app.js"></script>
-    <script src="assets/js/glowing-bubbles.js"></script>
-</body>
-</html>
-"""
+    written, total_pages = write_listing_pages(trades)
+    print(f"Listing pages: {written} written, {total_pages - written} unchanged")
+
+    publish_assets("all-trades.css", "all-trades.js", "search.js")
+    html_content = load_template("all-trades.html.template").render(
+        navbar=get_navbar_html("directory"),
+        page_css=asset_url("all-trades.css"),
+        page_js=asset_url("all-trades.js"),
+        search_js=asset_url("search.js"),
+    )
 
     with open("index.directory/all-trades.html", "w", encoding="utf-8") as f:
         f.write(html_content)
@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+Generate Search Index Script
+Builds a client-side full-text index over trades, notes and summary reviews
+
+Documents:
+- Trades: ticker, strategy, direction, tags, notes and the full markdown body
+  (from the parse cache written by parse_trades.py)
+- Notes: index.directory/SFTi.Notez/*.md
+- Summaries: the review sections of index.directory/summaries/*.md
+
+Output (index.directory/search/):
+- docs.json: document table, BM25 parameters and corpus statistics
+- shard-{prefix}.json: inverted index for the terms from {prefix} up to the
+  next shard's prefix. Terms are bucketed by their first characters and
+  consecutive buckets are packed into shards of about TARGET_SHARD_BYTES, so
+  a small journal is one or two shards and a large one splits further
+
+Each term maps to a posting list of [doc id gap, term frequency] pairs: doc
+ids ascend, so ids are stored as deltas from the previous one. The browser
+scores with BM25 (assets/js/search.js) and fetches the shard each query term
+falls into, usually one or two files.
+
+Performance Optimizations:
+- Incremental: only documents whose source file changed are re-tokenized
+  (per-document terms cached in index.directory/.cache/search-docs.json)
+- Trades come from the parse cache, so trade files are not re-read
+- Document ids are stable, so a change rewrites only the shards of the terms
+  it touches (index.directory/.cache/search-shards.json)
+"""
+
+import glob
+import json
+import os
+import re
+from collections import Counter, defaultdict
+
+from globals_utils import setup_imports, save_json_file
+
+# Setup imports
+setup_imports(__file__)
+from utils import (
+    CACHE_DIR,
+    OutputManifest,
+    file_stamp,
+    fingerprint,
+    load_parse_cache,
+    load_trades_index,
+)
+from generate_summaries import parse_review_sections
+
+SEARCH_DIR = "index.directory/search"
+SEARCH_CACHE_PATH = f"{CACHE_DIR}/search-docs.json"
+
+# Bump when tokenization or the output layout changes
+SEARCH_FORMAT_VERSION = 2
+
+# Approximate JSON size of a shard: consecutive term prefix buckets are packed
+# up to this size, and the bucket prefix grows (up to MAX_SHARD_PREFIX_LENGTH
+# characters) until no single bucket is larger
+TARGET_SHARD_BYTES = 16 * 1024
+MAX_SHARD_PREFIX_LENGTH = 3
+
+# BM25 parameters, applied by the browser at query time
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Term frequency weight per field
+FIELD_WEIGHTS = {"ticker": 3, "tags": 2, "text": 1}
+
+# Words too common in the journal to be worth indexing
+STOPWORDS = frozenset(
+    """
+    a an and are as at be but by for from had has have i in is it its my no not
+    of on or so that the then there this to was were will with
+    """.split()
+)
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Characters of text kept as a result snippet
+SNIPPET_LENGTH = 160
+
+
+def tokenize(text):
+    """
+    Split text into index terms (mirrored by tokenize() in assets/js/search.js)
+
+    Args:
+        text (str): Text to tokenize
+
+    Returns:
+        list: Lowercase terms of 2+ characters, stopwords removed
+    """
+    return [
+        token
+        for token in TOKEN_PATTERN.findall(str(text).lower())
+        if len(token) >= 2 and token not in STOPWORDS
+    ]
+
+
+def weigh_fields(fields):
+    """
+    Weighted term frequencies for a document
+
+    Args:
+        fields (dict): {field name in FIELD_WEIGHTS: text}
+
+    Returns:
+        tuple: ({term: weighted frequency}, document length)
+    """
+    terms = Counter()
+    for field, text in fields.items():
+        weight = FIELD_WEIGHTS[field]
+        for token in tokenize(text):
+            terms[token] += weight
+    return dict(terms), sum(terms.values())
+
+
+def snippet(text):
+    """First SNIPPET_LENGTH characters of text with whitespace collapsed"""
+    text = " ".join(str(text).split())
+    return text[:SNIPPET_LENGTH] + "..." if len(text) > SNIPPET_LENGTH else text
+
+
+def trade_document(trade, body):
+    """
+    Search document for a trade
+
+    Args:
+        trade (dict): Parsed trade
+        body (str): Full markdown body of the trade file
+
+    Returns:
+        tuple: (meta dict, fields dict)
+    """
+    trade_number = int(trade.get("trade_number", 0))
+    ticker = trade.get("ticker", "UNKNOWN")
+    tags = [trade.get("strategy") or "", trade.get("direction") or "", trade.get("broker") or ""]
+    for key in ("strategy_tags", "setup_tags", "session_tags", "market_condition_tags"):
+        tags.extend(str(tag) for tag in trade.get(key) or [])
+
+    notes = trade.get("notes") or ""
+    meta = {
+        "type": "trade",
+        "title": f"#{trade_number} {ticker} {trade.get('direction', '')} - "
+        f"{trade.get('strategy', 'Unknown')}",
+        "url": f"trades/trade-{trade_number:03d}-{ticker}.html",
+        "date": trade.get("entry_date", ""),
+        "snippet": snippet(notes),
+    }
+    fields = {"ticker": ticker, "tags": " ".join(tags), "text": f"{notes}\n{body}"}
+    return meta, fields
+
+
+def note_document(filepath):
+    """
+    Search document for a note in SFTi.Notez
+
+    Args:
+        filepath (str): Note markdown path
+
+    Returns:
+        tuple: (meta dict, fields dict)
+    """
+    with open(filepath, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    title = os.path.splitext(os.path.basename(filepath))[0]
+    heading = re.search(r"^#+\s+(.+)$", content, re.MULTILINE)
+    if heading:
+        title = heading.group(1).strip().strip("*")
+
+    meta = {
+        "type": "note",
+        "title": title,
+        "url": os.path.relpath(filepath, "index.directory").replace(os.sep, "/"),
+        "date": "",
+        "snippet": snippet(re.sub(r"[#*_>`!\[\]()]", "", content)),
+    }
+    return meta, {"tags": title, "text": content}
+
+
+def summary_document(filepath):
+    """
+    Search document for the review sections of a period summary
+
+    Args:
+        filepath (str): Summary markdown path, e.g. .../weekly-2025-W45.md
+
+    Returns:
+        tuple: (meta dict, fields dict)
+    """
+    with open(filepath, "r", encoding="utf-8") as f:
+        review = parse_review_sections(f.read())
+
+    stem = os.path.splitext(os.path.basename(filepath))[0]
+    period, _, key = stem.partition("-")
+    text = "\n".join(value for value in review.values() if value)
+
+    meta = {
+        "type": "summary",
+        "title": f"{period.capitalize()} summary {key}",
+        "url": os.path.relpath(filepath, "index.directory").replace(os.sep, "/"),
+        "date": key,
+        "snippet": snippet(text),
+    }
+    return meta, {"tags": f"{period} {key}", "text": text}
+
+
+def collect_sources():
+    """
+    Find every searchable document and a cheap change marker for it
+
+    Returns:
+        dict: {document key: (stamp, loader)}; loader() -> (meta, fields)
+    """
+    sources = {}
+
+    # Trades: parsed results and full bodies from the parse cache
+    parse_cache = load_parse_cache()
+    if parse_cache:
+        for path, entry in parse_cache.items():
+            if entry.get("trade"):
+                sources[path] = (
+                    entry["stamp"],
+                    lambda e=entry: trade_document(e["trade"], e.get("body", "")),
+                )
+    else:
+        index_data = load_trades_index() or {}
+        for trade in index_data.get("trades", []):
+            key = trade.get("file_path") or fingerprint(trade)
+            sources[key] = (
+                fingerprint(trade),
+                lambda t=trade: trade_document(t, t.get("body", "")),
+            )
+
+    for path in sorted(glob.glob("index.directory/SFTi.Notez/*.md")):
+        if not path.endswith("README.md"):
+            sources[path] = (file_stamp(path), lambda p=path: note_document(p))
+
+    for path in sorted(glob.glob("index.directory/summaries/*.md")):
+        sources[path] = (file_stamp(path), lambda p=path: summary_document(p))
+
+    return sources
+
+
+def load_search_cache():
+    """Per-document cache from the previous run, or an empty one"""
+    try:
+        with open(SEARCH_CACHE_PATH, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache.get("version") == SEARCH_FORMAT_VERSION:
+            return cache
+    except (OSError, json.JSONDecodeError):
+        pass
+    return {"version": SEARCH_FORMAT_VERSION, "next_id": 0, "docs": {}}
+
+
+def update_documents(cache, sources):
+    """
+    Re-tokenize changed documents and assign stable ids to new ones
+
+    Args:
+        cache (dict): Search cache (updated in place)
+        sources (dict): Output of collect_sources()
+
+    Returns:
+        tuple: (documents tokenized, documents removed)
+    """
+    docs = cache["docs"]
+    removed = [key for key in docs if key not in sources]
+    for key in removed:
+        del docs[key]
+
+    # Reassign ids when removals leave the id space mostly empty
+    if docs and cache["next_id"] > 2 * len(sources):
+        for new_id, key in enumerate(sorted(docs, key=lambda k: docs[k]["id"])):
+            docs[key]["id"] = new_id
+        cache["next_id"] = len(docs)
+
+    tokenized = 0
+    for key, (stamp, loader) in sources.items():
+        cached = docs.get(key)
+        if cached and cached["stamp"] == stamp:
+            continue
+        try:
+            meta, fields = loader()
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Warning: Could not index {key}: {e}")
+            continue
+        terms, length = weigh_fields(fields)
+        if cached:
+            doc_id = cached["id"]
+        else:
+            doc_id = cache["next_id"]
+            cache["next_id"] += 1
+        docs[key] = {
+            "id": doc_id,
+            "stamp": stamp,
+            "meta": meta,
+            "terms": terms,
+            "length": length,
+        }
+        tokenized += 1
+
+    return tokenized, len(removed)
+
+
+def plan_shards(postings):
+    """
+    Choose the term prefix length and shard boundaries from TARGET_SHARD_BYTES
+
+    Args:
+        postings (dict): {term: encoded posting list}
+
+    Returns:
+        tuple: (prefix length, {bucket prefix: shard key}); a shard's key is
+               the prefix of its first bucket
+    """
+    # Serialized size of each term's entry: "term":[...],
+    entry_bytes = {
+        term: len(term) + len(json.dumps(encoded, separators=(",", ":"))) + 4
+        for term, encoded in postings.items()
+    }
+
+    # Shortest prefix whose largest bucket still fits in one shard
+    for prefix_length in range(1, MAX_SHARD_PREFIX_LENGTH + 1):
+        buckets = Counter()
+        for term, size in entry_bytes.items():
+            buckets[term[:prefix_length]] += size
+        if max(buckets.values(), default=0) <= TARGET_SHARD_BYTES:
+            break
+
+    # Pack consecutive buckets until the next one would overflow the shard
+    shard_of = {}
+    key, size = None, 0
+    for prefix in sorted(buckets):
+        if key is None or size + buckets[prefix] > TARGET_SHARD_BYTES:
+            key, size = prefix, 0
+        shard_of[prefix] = key
+        size += buckets[prefix]
+    return prefix_length, shard_of
+
+
+def build_shards(docs):
+    """
+    Invert per-document terms into delta-encoded posting lists, grouped into
+    shards by plan_shards()
+
+    Args:
+        docs (dict): Cached documents
+
+    Returns:
+        tuple: ({shard key: {term: [id gap, tf, id gap, tf, ...]}}, prefix length)
+    """
+    postings = defaultdict(list)
+    for doc in sorted(docs.values(), key=lambda d: d["id"]):
+        for term, tf in doc["terms"].items():
+            postings[term].append((doc["id"], tf))
+
+    encoded_postings = {}
+    for term in sorted(postings):
+        encoded = []
+        previous = 0
+        for doc_id, tf in postings[term]:
+            encoded.extend((doc_id - previous, tf))
+            previous = doc_id
+        encoded_postings[term] = encoded
+
+    prefix_length, shard_of = plan_shards(encoded_postings)
+    shards = defaultdict(dict)
+    for term, encoded in encoded_postings.items():
+        shards[shard_of[term[:prefix_length]]][term] = encoded
+    return shards, prefix_length
+
+
+def write_search_index(cache):
+    """
+    Write changed shards and the document table
+
+    Args:
+        cache (dict): Search cache with up-to-date documents
+
+    Returns:
+        tuple: (shards written, total shards, prefix length)
+    """
+    os.makedirs(SEARCH_DIR, exist_ok=True)
+    manifest = OutputManifest("search-shards")
+    docs = cache["docs"]
+
+    shards, prefix_length = build_shards(docs)
+    shard_versions = {}
+    written = 0
+    for prefix, terms in shards.items():
+        path = os.path.join(SEARCH_DIR, f"shard-{prefix}.json")
+        shard_fingerprint = fingerprint(SEARCH_FORMAT_VERSION, terms)
+        if not manifest.is_fresh(path, shard_fingerprint):
+            content = json.dumps(terms, separators=(",", ":"))
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+            manifest.record(path, shard_fingerprint, content)
+            written += 1
+        shard_versions[prefix] = manifest.digest(path)[:12]
+
+    # Remove shards whose terms are all gone
+    for path in glob.glob(os.path.join(SEARCH_DIR, "shard-*.json")):
+        prefix = os.path.basename(path)[len("shard-") : -len(".json")]
+        if prefix not in shard_versions:
+            os.remove(path)
+            manifest.discard(path)
+
+    table = [None] * cache["next_id"]
+    for doc in docs.values():
+        meta = doc["meta"]
+        table[doc["id"]] = [
+            meta["type"],
+            meta["title"],
+            meta["url"],
+            meta["date"],
+            meta["snippet"],
+            doc["length"],
+        ]
+
+    doc_count = len(docs)
+    total_length = sum(doc["length"] for doc in docs.values())
+    search_docs = {
+        "version": SEARCH_FORMAT_VERSION,
+        "prefix_length": prefix_length,
+        "k1": BM25_K1,
+        "b": BM25_B,
+        "doc_count": doc_count,
+        "avg_length": round(total_length / doc_count, 3) if doc_count else 0,
+        "columns": ["type", "title", "url", "date", "snippet", "length"],
+        "docs": table,
+        "shards": shard_versions,
+    }
+    with open(os.path.join(SEARCH_DIR, "docs.json"), "w", encoding="utf-8") as f:
+        json.dump(search_docs, f, ensure_ascii=False, separators=(",", ":"))
+
+    manifest.save()
+    return written, len(shard_versions), prefix_length
+
+
+def main():
+    """Main execution function"""
+    print("Generating search index...")
+
+    cache = load_search_cache()
+    sources = collect_sources()
+    tokenized, removed = update_documents(cache, sources)
+    print(
+        f"{len(sources)} document(s): {tokenized} tokenized, "
+        f"{len(sources) - tokenized} unchanged, {removed} removed"
+    )
+
+    written, total, prefix_length = write_search_index(cache)
+    save_json_file(SEARCH_CACHE_PATH, cache, indent=None)
+
+    print(f"✓ Search index written to {SEARCH_DIR}/")
+    print(f"  Shards: {written} written, {total - written} unchanged")
+    print(f"  Prefix length: {prefix_length}")
+
+
+if __name__ == "__main__":
+    main()
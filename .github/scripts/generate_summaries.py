@@ -5,27 +5,110 @@ Generates weekly, monthly, and yearly summaries from parsed trade data
 Enhanced to preserve user reviews and auto-aggregate higher-level summaries
 
 Performance Optimizations:
-- Single-pass calculation of all period statistics
+- Mergeable PeriodStats: weeks and months are merged from cached
+  (week, month) fragments, years are merged from months
+- Fragment counts and sums are rolled up from the daily series
+  (index.directory/daily-series.json) instead of recounted per trade
 - Combined winner/loser tracking with strategy breakdown
 - Efficient best/worst trade tracking without separate max/min operations
-- Reduced file I/O with smart caching of summary content
+- Reduced file I/O: one directory listing per run, review sections
+  parsed in a single line scan and only for periods being regenerated
 - Optimized date parsing with string operations
+- Incremental: periods whose member trades, preserved review and
+  child summaries are unchanged are skipped without reading or writing
 """
 
+import json
 import os
 import re
 from datetime import datetime, timedelta
 from collections import defaultdict
-from globals_utils import setup_imports
+from globals_utils import setup_imports, save_json_file
 
 # Setup imports
 setup_imports(__file__)
-from utils import load_trades_index, calculate_period_stats
+from utils import (
+    CACHE_DIR,
+    load_trades_index,
+    load_daily_series,
+    aggregate_daily_series,
+    trade_day,
+    period_key,
+    fingerprint,
+    OutputManifest,
+    PeriodStats,
+)
+from template_engine import load_template
 
 # Regex patterns for file matching
 WEEKLY_PATTERN = r"weekly-\d{4}-W(\d{2})\.md"
 MONTHLY_PATTERN = r"monthly-\d{4}-(\d{2})\.md"
 
+# Bump when the summary markdown layout changes to force a full regeneration
+SUMMARY_FORMAT_VERSION = 1
+
+# Cached PeriodStats per (week, month) fragment
+STATS_CACHE_PATH = os.path.join(CACHE_DIR, "period-stats.json")
+
+
+# Review sections preserved across regenerations:
+# heading -> (review key, line prefix that ends the section, placeholder prefix)
+REVIEW_SECTIONS = {
+    "### What Went Well": (
+        "what_went_well",
+        "##",
+        "_To be filled in manually during review",
+    ),
+    "### What Needs Improvement": (
+        "needs_improvement",
+        "##",
+        "_To be filled in manually during review",
+    ),
+    "### Key Lessons Learned": (
+        "key_lessons",
+        "##",
+        "_To be filled in manually during review",
+    ),
+    "## Next Period Goals": ("next_goals", "---", "- _Goal"),
+}
+
+
+def parse_review_sections(content):
+    """
+    Extract user-filled review sections in a single pass over the lines
+
+    Args:
+        content (str): Summary markdown
+
+    Returns:
+        dict: Review sections (empty string for missing or placeholder text)
+    """
+    review = {key: "" for key, _, _ in REVIEW_SECTIONS.values()}
+    section = None
+    body = []
+
+    for line in content.split("\n"):
+        if section:
+            key, terminator, placeholder = section
+            if not line.startswith(terminator):
+                body.append(line)
+                continue
+            text = "\n".join(body).strip()
+            if not text.startswith(placeholder):
+                review[key] = text
+            section = None
+
+        section = REVIEW_SECTIONS.get(line.rstrip())
+        body = []
+
+    if section:
+        key, _, placeholder = section
+        text = "\n".join(body).strip()
+        if not text.startswith(placeholder):
+            review[key] = text
+
+    return review
+
 
 def load_existing_summary(filepath):
     """
@@ -42,97 +125,159 @@ def load_existing_summary(filepath):
 
     try:
         with open(filepath, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Extract review sections
-        review = {
-            "what_went_well": "",
-            "needs_improvement": "",
-            "key_lessons": "",
-            "next_goals": "",
-        }
-
-        # Extract "What Went Well" section
-        match = re.search(
-            r"### What Went Well\s*\n\s*\n(.*?)(?=\n###|\n##|$)", content, re.DOTALL
-        )
-        if match and not match.group(1).strip().startswith(
-            "_To be filled in manually during review"
-        ):
-            review["what_went_well"] = match.group(1).strip()
-
-        # Extract "What Needs Improvement" section
-        match = re.search(
-            r"### What Needs Improvement\s*\n\s*\n(.*?)(?=\n###|\n##|$)",
-            content,
-            re.DOTALL,
-        )
-        if match and not match.group(1).strip().startswith(
-            "_To be filled in manually during review"
-        ):
-            review["needs_improvement"] = match.group(1).strip()
-
-        # Extract "Key Lessons Learned" section
-        match = re.search(
-            r"### Key Lessons Learned\s*\n\s*\n(.*?)(?=\n##|$)", content, re.DOTALL
-        )
-        if match and not match.group(1).strip().startswith(
-            "_To be filled in manually during review"
-        ):
-            review["key_lessons"] = match.group(1).strip()
-
-        # Extract "Next Period Goals" section
-        match = re.search(
-            r"## Next Period Goals\s*\n\s*\n(.*?)(?=\n---|$)", content, re.DOTALL
-        )
-        if match and not match.group(1).strip().startswith("- _Goal"):
-            review["next_goals"] = match.group(1).strip()
-
-        return review
+            return parse_review_sections(f.read())
     except Exception as e:
         print(f"Warning: Error loading existing summary {filepath}: {e}")
         return None
 
 
-def group_trades_by_period(trades, period="week"):
+class SummaryIndex:
+    """
+    Index of the summaries directory, built with a single listdir per run.
+
+    Maps (period type, period key) -> path -> parsed review sections.
+    Files are parsed lazily on first use and summaries written during the
+    run are re-indexed from their new content without re-reading them.
     """
-    Group trades by time period (week, month, year)
+
+    def __init__(self, summaries_dir="index.directory/summaries"):
+        self.summaries_dir = summaries_dir
+        self.paths = {}
+        self.reviews = {}
+
+        filenames = os.listdir(summaries_dir) if os.path.exists(summaries_dir) else []
+        for filename in filenames:
+            if filename.startswith("weekly-") and re.match(WEEKLY_PATTERN, filename):
+                period_type = "week"
+            elif filename.startswith("monthly-") and re.match(
+                MONTHLY_PATTERN, filename
+            ):
+                period_type = "month"
+            elif filename.startswith("yearly-") and filename.endswith(".md"):
+                period_type = "year"
+            else:
+                continue
+            key = filename[filename.index("-") + 1 : -len(".md")]
+            self.paths[(period_type, key)] = os.path.join(summaries_dir, filename)
+
+    def path(self, period_type, key):
+        """Path of a period's summary file (whether or not it exists yet)"""
+        prefix = {"week": "weekly", "month": "monthly", "year": "yearly"}[period_type]
+        return self.paths.get(
+            (period_type, key), os.path.join(self.summaries_dir, f"{prefix}-{key}.md")
+        )
+
+    def review(self, period_type, key):
+        """
+        Parsed review sections for a period
+
+        Returns:
+            dict: Copy of the review sections, or None if no summary exists
+        """
+        indexed = (period_type, key)
+        if indexed not in self.reviews:
+            if indexed in self.paths:
+                self.reviews[indexed] = load_existing_summary(self.paths[indexed])
+            else:
+                self.reviews[indexed] = None
+        review = self.reviews[indexed]
+        return dict(review) if review is not None else None
+
+    def update(self, period_type, key, content):
+        """
+        Re-index a summary that was just written
+
+        Args:
+            period_type (str): 'week', 'month', or 'year'
+            key (str): Period key
+            content (str): Markdown that was written
+        """
+        indexed = (period_type, key)
+        self.paths[indexed] = self.path(period_type, key)
+        self.reviews[indexed] = parse_review_sections(content)
+
+    def keys(self, period_type, prefix):
+        """Sorted period keys of a type that start with prefix"""
+        return sorted(
+            key
+            for kind, key in self.paths
+            if kind == period_type and key.startswith(prefix)
+        )
+
+
+def group_trades_by_fragment(trades):
+    """
+    Group trades by (week key, month key) of the day they are realized on
+    (utils.trade_day(), the daily series' bucketing).
+    Weeks can straddle months, so these fragments are the smallest pieces
+    that both weekly and monthly stats can be merged from.
 
     Args:
         trades (list): List of trade dictionaries
-        period (str): 'week', 'month', or 'year'
 
     Returns:
-        dict: Dictionary with period keys and trade lists as values
+        dict: {(week_key, month_key): [trades]} in first-seen order
     """
     grouped = defaultdict(list)
 
     for trade in trades:
-        try:
-            # Parse date only once
-            entry_date_str = str(trade.get("entry_date"))
-            entry_date = datetime.fromisoformat(entry_date_str)
-
-            # Generate key based on period type
-            if period == "week":
-                key = f"{entry_date.year}-W{entry_date.isocalendar()[1]:02d}"
-            elif period == "month":
-                key = f"{entry_date.year}-{entry_date.month:02d}"
-            elif period == "year":
-                key = str(entry_date.year)
-            else:
-                key = "unknown"
-
-            grouped[key].append(trade)
-        except (ValueError, TypeError) as e:
-            print(
-                f"Warning: Could not parse date for trade {trade.get('trade_number')}: {e}"
-            )
+        day = trade_day(trade)
+        if day is None:
+            print(f"Warning: Could not parse date for trade {trade.get('trade_number')}")
             continue
+        key = (period_key(day, "week"), period_key(day, "month"))
+        grouped[key].append(trade)
 
     return dict(grouped)
 
 
+def load_fragment_stats(fragments, fragment_totals):
+    """
+    Build PeriodStats for each fragment, reusing cached stats for fragments
+    whose trades are unchanged since the last run
+
+    Counts and sums come from the daily series totals; the fragment's
+    trades only supply the best/worst trade and strategy breakdown.
+
+    Args:
+        fragments (dict): Output of group_trades_by_fragment()
+        fragment_totals (dict): aggregate_daily_series(series, ('week', 'month'))
+
+    Returns:
+        tuple: ({key: PeriodStats}, {key: trades fingerprint})
+    """
+    try:
+        with open(STATS_CACHE_PATH, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        cache = {}
+
+    stats = {}
+    fingerprints = {}
+    updated_cache = {}
+    for key, fragment_trades in fragments.items():
+        cache_key = "|".join(key)
+        totals = fragment_totals.get(key)
+        trades_fingerprint = fingerprint(fragment_trades, totals)
+        entry = cache.get(cache_key)
+        if entry and entry.get("fingerprint") == trades_fingerprint:
+            stats[key] = PeriodStats.from_json(entry["stats"])
+        elif totals:
+            stats[key] = PeriodStats.from_daily_totals(totals, fragment_trades)
+        else:
+            stats[key] = PeriodStats.from_trades(fragment_trades)
+        fingerprints[key] = trades_fingerprint
+        updated_cache[cache_key] = {
+            "fingerprint": trades_fingerprint,
+            "stats": stats[key].to_json(),
+        }
+
+    if updated_cache != cache:
+        save_json_file(STATS_CACHE_PATH, updated_cache)
+
+    return stats, fingerprints
+
+
 def generate_summary_markdown(
     period_key, period_stats, period_type="week", existing_review=None
 ):
@@ -190,49 +335,27 @@ def generate_summary_markdown(
         key_lessons = "_To be filled in manually during review_"
         next_goals = "- _Goal 1_\n- _Goal 2_\n- _Goal 3_"
 
-    markdown = f"""# {title}
-
-**Period**: {period_key}
-
-## Statistics
-
-- **Total Trades**: {period_stats['total_trades']}
-- **Winning Trades**: {period_stats['winning_trades']}
-- **Losing Trades**: {period_stats['losing_trades']}
-- **Win Rate**: {period_stats['win_rate']}%
-- **Total P&L**: ${period_stats['total_pnl']:.2f}
-- **Average P&L per Trade**: ${period_stats['avg_pnl']:.2f}
-- **Best Trade**: {period_stats['best_trade']['ticker']} (+${period_stats['best_trade']['pnl']:.2f})
-- **Worst Trade**: {period_stats['worst_trade']['ticker']} (${period_stats['worst_trade']['pnl']:.2f})
-- **Total Volume Traded**: {period_stats['total_volume']:,} shares
-
-## Performance Analysis
-
-### What Went Well
-
-{what_went_well}
-
-### What Needs Improvement
-
-{needs_improvement}
-
-### Key Lessons Learned
-
-{key_lessons}
-
-## Strategy Breakdown
-
-{strategy_breakdown}
-
-## Next Period Goals
-
-{next_goals}
-
----
-
-**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
-    return markdown
+    return load_template("period-summary.md.template").render(
+        title=title,
+        period_key=period_key,
+        total_trades=period_stats["total_trades"],
+        winning_trades=period_stats["winning_trades"],
+        losing_trades=period_stats["losing_trades"],
+        win_rate=period_stats["win_rate"],
+        total_pnl=f"{period_stats['total_pnl']:.2f}",
+        avg_pnl=f"{period_stats['avg_pnl']:.2f}",
+        best_ticker=period_stats["best_trade"]["ticker"],
+        best_pnl=f"{period_stats['best_trade']['pnl']:.2f}",
+        worst_ticker=period_stats["worst_trade"]["ticker"],
+        worst_pnl=f"{period_stats['worst_trade']['pnl']:.2f}",
+        total_volume=f"{period_stats['total_volume']:,}",
+        what_went_well=what_went_well,
+        needs_improvement=needs_improvement,
+        key_lessons=key_lessons,
+        strategy_breakdown=strategy_breakdown,
+        next_goals=next_goals,
+        generated=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    )
 
 
 def main():
@@ -254,71 +377,149 @@ def main():
     # Create summaries directory in index.directory/
     os.makedirs("index.directory/summaries", exist_ok=True)
 
+    # Fingerprints of each period's inputs from the previous run
+    manifest = OutputManifest("summaries")
+    summary_index = SummaryIndex()
+    skipped = 0
+
+    # Stats are built per (week, month) fragment and merged upwards:
+    # weeks and months from fragments, years from months. Fragment totals
+    # are rolled up from the daily series rather than recounted from trades
+    fragments = group_trades_by_fragment(trades)
+    fragment_totals = aggregate_daily_series(
+        load_daily_series(trades), ("week", "month")
+    )
+    fragment_stats, fragment_fingerprints = load_fragment_stats(
+        fragments, fragment_totals
+    )
+    week_fragments = defaultdict(list)
+    month_fragments = defaultdict(list)
+    for key in fragments:
+        week_fragments[key[0]].append(key)
+        month_fragments[key[1]].append(key)
+
     # Generate weekly summaries
     print("Generating weekly summaries...")
-    weekly_groups = group_trades_by_period(trades, "week")
-    for week_key, week_trades in weekly_groups.items():
-        stats = calculate_period_stats(week_trades)
-
-        # Load existing review content to preserve user input
+    month_children = defaultdict(list)
+    for week_key, keys in week_fragments.items():
         filename = f"index.directory/summaries/weekly-{week_key}.md"
-        existing_review = load_existing_summary(filename)
+        period_fingerprint = fingerprint(
+            SUMMARY_FORMAT_VERSION, [fragment_fingerprints[key] for key in keys]
+        )
 
-        markdown = generate_summary_markdown(week_key, stats, "week", existing_review)
+        if manifest.is_fresh(filename, period_fingerprint):
+            skipped += 1
+        else:
+            stats = PeriodStats.merge_all(
+                fragment_stats[key] for key in keys
+            ).to_dict()
 
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(markdown)
+            # Load existing review content to preserve user input
+            existing_review = summary_index.review("week", week_key)
 
-        if existing_review and any(existing_review.values()):
-            print(f"  Updated {filename} (preserved user review)")
-        else:
-            print(f"  Created {filename}")
+            markdown = generate_summary_markdown(
+                week_key, stats, "week", existing_review
+            )
+
+            with open(filename, "w", encoding="utf-8") as f:
+                f.write(markdown)
+            summary_index.update("week", week_key, markdown)
+            manifest.record(filename, period_fingerprint, markdown)
+
+            if existing_review and any(existing_review.values()):
+                print(f"  Updated {filename} (preserved user review)")
+            else:
+                print(f"  Created {filename}")
+
+        # Monthly summaries pull insights from their weeks' files
+        month_key = get_week_month_key(week_key)
+        if month_key:
+            month_children[month_key].append((week_key, manifest.digest(filename)))
 
     # Generate monthly summaries from weekly data
     print("Generating monthly summaries (aggregated from weekly data)...")
-    monthly_groups = group_trades_by_period(trades, "month")
-    for month_key, month_trades in monthly_groups.items():
-        stats = calculate_period_stats(month_trades)
+    month_stats = {}
+    year_months = defaultdict(list)
+    year_children = defaultdict(list)
+    for month_key, keys in month_fragments.items():
+        month_stats[month_key] = PeriodStats.merge_all(
+            fragment_stats[key] for key in keys
+        )
+        year_months[month_key.split("-")[0]].append(month_key)
 
-        # Load existing review content to preserve user input
         filename = f"index.directory/summaries/monthly-{month_key}.md"
-        existing_review = load_existing_summary(filename)
-
-        # Aggregate insights from weekly summaries if available
-        year, month = month_key.split("-")
-        weekly_insights = aggregate_weekly_insights(year, month)
+        period_fingerprint = fingerprint(
+            SUMMARY_FORMAT_VERSION,
+            [fragment_fingerprints[key] for key in keys],
+            sorted(month_children[month_key]),
+        )
 
-        # Merge weekly insights with existing review
-        if weekly_insights and not existing_review:
-            existing_review = weekly_insights
-        elif weekly_insights and existing_review:
-            # Preserve user-written content but add weekly insights as suggestions
-            for key in ["what_went_well", "needs_improvement", "key_lessons"]:
-                if not existing_review.get(key) and weekly_insights.get(key):
-                    existing_review[key] = weekly_insights[key]
+        if manifest.is_fresh(filename, period_fingerprint):
+            skipped += 1
+        else:
+            stats = month_stats[month_key].to_dict()
+
+            # Load existing review content to preserve user input
+            existing_review = summary_index.review("month", month_key)
+
+            # Aggregate insights from weekly summaries if available
+            year, month = month_key.split("-")
+            weekly_insights = aggregate_weekly_insights(year, month, summary_index)
+
+            # Merge weekly insights with existing review
+            if weekly_insights and not existing_review:
+                existing_review = weekly_insights
+            elif weekly_insights and existing_review:
+                # Preserve user-written content but add weekly insights as suggestions
+                for key in ["what_went_well", "needs_improvement", "key_lessons"]:
+                    if not existing_review.get(key) and weekly_insights.get(key):
+                        existing_review[key] = weekly_insights[key]
+
+            markdown = generate_summary_markdown(
+                month_key, stats, "month", existing_review
+            )
 
-        markdown = generate_summary_markdown(month_key, stats, "month", existing_review)
+            with open(filename, "w", encoding="utf-8") as f:
+                f.write(markdown)
+            summary_index.update("month", month_key, markdown)
+            manifest.record(filename, period_fingerprint, markdown)
 
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(markdown)
+            if existing_review and any(existing_review.values()):
+                print(f"  Updated {filename} (with weekly insights)")
+            else:
+                print(f"  Created {filename}")
 
-        if existing_review and any(existing_review.values()):
-            print(f"  Updated {filename} (with weekly insights)")
-        else:
-            print(f"  Created {filename}")
+        year_children[month_key.split("-")[0]].append(
+            (month_key, manifest.digest(filename))
+        )
 
     # Generate yearly summaries from monthly data
     print("Generating yearly summaries (aggregated from monthly data)...")
-    yearly_groups = group_trades_by_period(trades, "year")
-    for year_key, year_trades in yearly_groups.items():
-        stats = calculate_period_stats(year_trades)
+    for year_key, month_keys in year_months.items():
+        filename = f"index.directory/summaries/yearly-{year_key}.md"
+        period_fingerprint = fingerprint(
+            SUMMARY_FORMAT_VERSION,
+            [
+                fragment_fingerprints[key]
+                for month in month_keys
+                for key in month_fragments[month]
+            ],
+            sorted(year_children[year_key]),
+        )
+
+        if manifest.is_fresh(filename, period_fingerprint):
+            skipped += 1
+            continue
+
+        stats = PeriodStats.merge_all(
+            month_stats[month] for month in month_keys
+        ).to_dict()
 
         # Load existing review content to preserve user input
-        filename = f"index.directory/summaries/yearly-{year_key}.md"
-        existing_review = load_existing_summary(filename)
+        existing_review = summary_index.review("year", year_key)
 
         # Aggregate insights from monthly summaries if available
-        monthly_insights = aggregate_monthly_insights(year_key)
+        monthly_insights = aggregate_monthly_insights(year_key, summary_index)
 
         # Merge monthly insights with existing review
         if monthly_insights and not existing_review:
@@ -333,12 +534,17 @@ def main():
 
         with open(filename, "w", encoding="utf-8") as f:
             f.write(markdown)
+        summary_index.update("year", year_key, markdown)
+        manifest.record(filename, period_fingerprint, markdown)
 
         if existing_review and any(existing_review.values()):
             print(f"  Updated {filename} (with monthly insights)")
         else:
             print(f"  Created {filename}")
 
+    manifest.save()
+    if skipped:
+        print(f"Skipped {skipped} unchanged summaries")
     print("Summary generation complete!")
 
 
@@ -388,18 +594,39 @@ def get_week_month(week_number, year):
         return None
 
 
-def aggregate_weekly_insights(year, month):
+def get_week_month_key(week_key):
+    """
+    Monthly summary key that a weekly summary rolls up into
+
+    Args:
+        week_key (str): Week key (e.g., '2025-W42')
+
+    Returns:
+        str: Month key (e.g., '2025-10') or None if cannot determine
+    """
+    try:
+        year, week = week_key.split("-W")
+        month = get_week_month(int(week), int(year))
+    except ValueError:
+        return None
+    return f"{year}-{month:02d}" if month else None
+
+
+def aggregate_weekly_insights(year, month, summary_index=None):
     """
     Aggregate insights from weekly summaries for a given month
 
     Args:
         year (str): Year string
         month (str): Month string (01-12)
+        summary_index (SummaryIndex): Index of summary files (built if omitted)
 
     Returns:
         dict: Aggregated review sections
     """
-    summaries_dir = "index.directory/summaries"
+    if summary_index is None:
+        summary_index = SummaryIndex()
+
     aggregated = {
         "what_went_well": "",
         "needs_improvement": "",
@@ -407,32 +634,20 @@ def aggregate_weekly_insights(year, month):
         "next_goals": "",
     }
 
-    # Find all weekly summaries for this month
+    # Find all weekly summaries for this month (keys sort by week number)
     weekly_reviews = []
-    if os.path.exists(summaries_dir):
-        for filename in os.listdir(summaries_dir):
-            if filename.startswith(f"weekly-{year}-W") and filename.endswith(".md"):
-                # Extract week number from filename
-                try:
-                    week_match = re.match(WEEKLY_PATTERN, filename)
-                    if week_match:
-                        week_num = int(week_match.group(1))
-                        # Check if this week belongs to the target month
-                        week_month = get_week_month(week_num, int(year))
-                        if week_month == int(month):
-                            filepath = os.path.join(summaries_dir, filename)
-                            review = load_existing_summary(filepath)
-                            if review and any(review.values()):
-                                weekly_reviews.append((week_num, review))
-                except (ValueError, AttributeError):
-                    continue
+    for week_key in summary_index.keys("week", f"{year}-W"):
+        week_num = int(week_key.split("-W")[1])
+        # Check if this week belongs to the target month
+        if get_week_month(week_num, int(year)) != int(month):
+            continue
+        review = summary_index.review("week", week_key)
+        if review and any(review.values()):
+            weekly_reviews.append((week_num, review))
 
     if not weekly_reviews:
         return None
 
-    # Sort by week number
-    weekly_reviews.sort(key=lambda x: x[0])
-
     # Aggregate each section using the helper function
     aggregated["what_went_well"] = aggregate_section(
         weekly_reviews, "what_went_well", "**Week {}**"
@@ -447,17 +662,20 @@ def aggregate_weekly_insights(year, month):
     return aggregated if any(aggregated.values()) else None
 
 
-def aggregate_monthly_insights(year):
+def aggregate_monthly_insights(year, summary_index=None):
     """
     Aggregate insights from monthly summaries for a given year
 
     Args:
         year (str): Year string
+        summary_index (SummaryIndex): Index of summary files (built if omitted)
 
     Returns:
         dict: Aggregated review sections
     """
-    summaries_dir = "index.directory/summaries"
+    if summary_index is None:
+        summary_index = SummaryIndex()
+
     aggregated = {
         "what_went_well": "",
         "needs_improvement": "",
@@ -467,24 +685,17 @@ def aggregate_monthly_insights(year):
 
     # Find all monthly summaries for this year
     monthly_reviews = []
-    if os.path.exists(summaries_dir):
-        for filename in sorted(os.listdir(summaries_dir)):
-            if filename.startswith(f"monthly-{year}-") and filename.endswith(".md"):
-                # Extract month number from filename
-                month_match = re.match(MONTHLY_PATTERN, filename)
-                if not month_match:
-                    continue
-                month_num = int(month_match.group(1))
-                if not (1 <= month_num <= 12):
-                    continue
-                try:
-                    month_name = datetime(int(year), month_num, 1).strftime("%B")
-                except ValueError:
-                    continue
-                filepath = os.path.join(summaries_dir, filename)
-                review = load_existing_summary(filepath)
-                if review and any(review.values()):
-                    monthly_reviews.append((month_name, review))
+    for month_key in summary_index.keys("month", f"{year}-"):
+        month_num = int(month_key.split("-")[1])
+        if not (1 <= month_num <= 12):
+            continue
+        try:
+            month_name = datetime(int(year), month_num, 1).strftime("%B")
+        except ValueError:
+            continue
+        review = summary_index.review("month", month_key)
+        if review and any(review.values()):
+            monthly_reviews.append((month_name, review))
 
     if not monthly_reviews:
         return None
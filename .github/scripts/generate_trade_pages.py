@@ -11,14 +11,21 @@ Features:
 - Mobile-friendly design with dark theme
 
 Performance Optimizations:
+- Page layout is a precompiled template (.github/templates/trade-page.html.template)
+- Styles and the gallery script are shared content-hashed assets
+  (index.directory/assets/dist/) instead of being inlined in every page
+- Incremental: pages whose trade data and template are unchanged are skipped
+  (fingerprints in index.directory/.cache/trade-pages.json)
+- Changed pages render in batches on a process pool; pages for deleted or
+  renamed trades are removed
 - List comprehensions for gallery and tag rendering
 - Efficient string joining instead of concatenation in loops
-- Pre-computed formatting with f-strings
 
 Output: index.directory/trades/{trade-id}.html
 """
 
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from navbar_template import get_navbar_html
@@ -26,7 +33,15 @@ from globals_utils import setup_imports, calculate_time_in_trade
 
 # Setup imports
 setup_imports(__file__)
-from utils import load_trades_index
+from utils import load_trades_index, fingerprint, OutputManifest
+from template_engine import load_template
+from static_assets import asset_url, publish_assets
+
+# Bump when page rendering changes outside the template to force regeneration
+PAGE_FORMAT_VERSION = 2
+
+# Pages rendered per worker task; more than one batch uses a process pool
+PAGE_BATCH_SIZE = 200
 
 
 def generate_trade_html(trade):
@@ -75,14 +90,11 @@ def generate_trade_html(trade):
     time_in_trade = calculate_time_in_trade(entry_date, entry_time, exit_date, exit_time)
 
     # Generate tag badges HTML
-    def render_tags(tags, color):
+    def render_tags(tags, kind):
         if not tags:
-            return '<span style="color: var(--text-secondary); font-style: italic;">None</span>'
+            return '<span class="trade-empty">None</span>'
         # Use list comprehension and join for better performance
-        return "".join([
-            f'<span style="display: inline-block; padding: 0.25rem 0.75rem; background: {color}; color: white; border-radius: 4px; font-size: 0.875rem; margin-right: 0.5rem; margin-bottom: 0.5rem;">{tag}</span>'
-            for tag in tags
-        ])
+        return "".join([f'<span class="trade-tag {kind}">{tag}</span>' for tag in tags])
 
     # Generate image gallery HTML
     gallery_html = ""
@@ -94,244 +106,126 @@ def generate_trade_html(trade):
                 img_path = img.replace("../../assets/", "../assets/")
                 gallery_items.append(f"""
                 <a href="{img_path}" class="glightbox" data-gallery="trade-{trade_number}">
-                    <img src="{img_path}" alt="Trade screenshot {idx+1}" style="width: 200px; height: 150px; object-fit: cover; border-radius: 8px; cursor: pointer; border: 2px solid var(--border-color); transition: all 0.3s;">
+                    <img src="{img_path}" alt="Trade screenshot {idx+1}">
                 </a>
                 """)
 
         if gallery_items:
             gallery_html = f"""
-            <div style="background: var(--bg-secondary); padding: 1.5rem; border-radius: 8px; margin-bottom: 1.5rem;">
-                <h2 style="margin-bottom: 1rem;">📸 Screenshots</h2>
-                <div style="display: grid; grid-template-columns: repeat(auto-fill, minmax(200px, 1fr)); gap: 1rem;">
+            <div class="trade-card compact">
+                <h2>📸 Screenshots</h2>
+                <div class="trade-gallery">
                     {''.join(gallery_items)}
                 </div>
             </div>
             """
         else:
             gallery_html = """
-            <div style="background: var(--bg-secondary); padding: 1.5rem; border-radius: 8px; margin-bottom: 1.5rem;">
-                <h2 style="margin-bottom: 1rem;">📸 Screenshots</h2>
-                <p style="color: var(--text-secondary); margin: 0;">No screenshots available for this trade.</p>
+            <div class="trade-card compact">
+                <h2>📸 Screenshots</h2>
+                <p class="trade-empty">No screenshots available for this trade.</p>
             </div>
             """
 
-    # Generate full HTML template
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0, viewport-fit=cover">
-  <meta name="description" content="Trade #{trade_number} - {ticker} details and analysis">
-  <meta name="theme-color" content="#00ff88">
-  
-  <title>Trade #{trade_number} - {ticker} - SFTi-Pennies</title>
-  
-  <!-- Fonts -->
-  <link rel="preconnect" href="https://fonts.googleapis.com">
-  <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-  <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&family=JetBrains+Mono:wght@400;500;600;700&display=swap" rel="stylesheet">
-  
-  <!-- Tailwind CDN -->
-  <script src="https://cdn.tailwindcss.com"></script>
-  
-  <!-- GLightbox CSS -->
-  <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/glightbox/dist/css/glightbox.min.css">
-  
-  <!-- Custom Styles -->
-  <link rel="stylesheet" href="../assets/css/main.css">
-  <link rel="stylesheet" href="../assets/css/glass-effects.css">
-  <link rel="stylesheet" href="../assets/css/glowing-bubbles.css">
-  
-  <!-- PWA Manifest -->
-  <link rel="manifest" href="../../manifest.json">
-  
-  <!-- Icons -->
-  <link rel="icon" type="image/png" sizes="192x192" href="../assets/icons/icon-192.png">
-</head>
-<body>
-  <canvas id="bg-canvas"></canvas>
-  
-{get_navbar_html("subdirectory")}
-  
-  <!-- Main Content -->
-  <main class="container">
-    <section>
-      <!-- Header -->
-      <div style="margin-bottom: 2rem;">
-        <div style="display: flex; align-items: center; gap: 1rem; margin-bottom: 0.5rem; flex-wrap: wrap;">
-          <h1 style="margin: 0;">Trade #{trade_number}: {ticker}</h1>
-          <span style="padding: 0.375rem 1rem; background: {'rgba(0,255,136,0.2)' if pnl_usd >= 0 else 'rgba(255,71,87,0.2)'}; color: {'var(--accent-green)' if pnl_usd >= 0 else 'var(--accent-red)'}; border-radius: 6px; font-weight: 700; font-size: 0.875rem; text-transform: uppercase; letter-spacing: 0.05em;">
-            {'🎯 WIN' if pnl_usd >= 0 else '❌ LOSS'}
-          </span>
-        </div>
-        <div style="display: flex; gap: 1rem; align-items: center; flex-wrap: wrap;">
-          <p style="color: var(--text-secondary); margin: 0;">{strategy} | {direction}</p>
-          <span style="color: var(--text-secondary);">•</span>
-          <p style="color: var(--text-secondary); margin: 0;">{broker}</p>
-        </div>
-      </div>
-      
-      <!-- Key Metrics Grid -->
-      <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(180px, 1fr)); gap: 1rem; margin-bottom: 2rem;">
-        <div style="background: var(--bg-secondary); padding: 1.25rem; border-radius: 8px; border: 2px solid {'var(--accent-green)' if pnl_usd >= 0 else 'var(--accent-red)'};">
-          <div style="font-size: 0.75rem; color: var(--text-secondary); text-transform: uppercase; letter-spacing: 0.05em; margin-bottom: 0.5rem;">P&L (USD)</div>
-          <div style="font-family: var(--font-mono); font-size: 2rem; font-weight: 700; color: {'var(--accent-green)' if pnl_usd >= 0 else 'var(--accent-red)'};">
-            ${pnl_usd:.2f}
-          </div>
-        </div>
-        <div style="background: var(--bg-secondary); padding: 1.25rem; border-radius: 8px;">
-          <div style="font-size: 0.75rem; color: var(--text-secondary); text-transform: uppercase; letter-spacing: 0.05em; margin-bottom: 0.5rem;">P&L (%)</div>
-          <div style="font-family: var(--font-mono); font-size: 2rem; font-weight: 700; color: {'var(--accent-green)' if pnl_percent >= 0 else 'var(--accent-red)'};">
-            {'+' if pnl_percent >= 0 else ''}{pnl_percent:.2f}%
-          </div>
-        </div>
-        <div style="background: var(--bg-secondary); padding: 1.25rem; border-radius: 8px;">
-          <div style="font-size: 0.75rem; color: var(--text-secondary); text-transform: uppercase; letter-spacing: 0.05em; margin-bottom: 0.5rem;">Position Size</div>
-          <div style="font-family: var(--font-mono); font-size: 1.5rem; font-weight: 600;">
-            {position_size} shares
-          </div>
-        </div>
-        <div style="background: var(--bg-secondary); padding: 1.25rem; border-radius: 8px;">
-          <div style="font-size: 0.75rem; color: var(--text-secondary); text-transform: uppercase; letter-spacing: 0.05em; margin-bottom: 0.5rem;">Time in Trade</div>
-          <div style="font-family: var(--font-mono); font-size: 1.5rem; font-weight: 600;">
-            {time_in_trade}
-          </div>
-        </div>
-      </div>
-      
-      <!-- Trade Details -->
-      <div style="background: var(--bg-secondary); padding: 1.5rem; border-radius: 8px; margin-bottom: 1.5rem;">
-        <h2 style="margin-bottom: 1.5rem;">📊 Trade Details</h2>
-        <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 1.5rem;">
-          <div>
-            <h3 style="font-size: 0.875rem; color: var(--accent-green); text-transform: uppercase; letter-spacing: 0.05em; margin-bottom: 0.75rem;">Entry</h3>
-            <div style="display: flex; flex-direction: column; gap: 0.5rem;">
-              <div style="display: flex; justify-content: space-between;">
-                <span style="color: var(--text-secondary);">Price:</span>
-                <span style="font-family: var(--font-mono); font-weight: 600;">${entry_price:.2f}</span>
-              </div>
-              <div style="display: flex; justify-content: space-between;">
-                <span style="color: var(--text-secondary);">Date:</span>
-                <span style="font-family: var(--font-mono);">{entry_date}</span>
-              </div>
-              <div style="display: flex; justify-content: space-between;">
-                <span style="color: var(--text-secondary);">Time:</span>
-                <span style="font-family: var(--font-mono);">{entry_time}</span>
-              </div>
-            </div>
-          </div>
-          <div>
-            <h3 style="font-size: 0.875rem; color: var(--accent-red); text-transform: uppercase; letter-spacing: 0.05em; margin-bottom: 0.75rem;">Exit</h3>
-            <div style="display: flex; flex-direction: column; gap: 0.5rem;">
-              <div style="display: flex; justify-content: space-between;">
-                <span style="color: var(--text-secondary);">Price:</span>
-                <span style="font-family: var(--font-mono); font-weight: 600;">${exit_price:.2f}</span>
-              </div>
-              <div style="display: flex; justify-content: space-between;">
-                <span style="color: var(--text-secondary);">Date:</span>
-                <span style="font-family: var(--font-mono);">{exit_date}</span>
-              </div>
-              <div style="display: flex; justify-content: space-between;">
-                <span style="color: var(--text-secondary);">Time:</span>
-                <span style="font-family: var(--font-mono);">{exit_time}</span>
-              </div>
-            </div>
-          </div>
-        </div>
-      </div>
-      
-      <!-- Risk Management -->
-      <div style="background: var(--bg-secondary); padding: 1.5rem; border-radius: 8px; margin-bottom: 1.5rem;">
-        <h2 style="margin-bottom: 1.5rem;">🎯 Risk Management</h2>
-        <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 1.5rem;">
-          <div>
-            <div style="font-size: 0.875rem; color: var(--text-secondary); margin-bottom: 0.5rem;">Stop Loss</div>
-            <div style="font-family: var(--font-mono); font-size: 1.25rem; font-weight: 600; color: var(--accent-red);">
-              ${stop_loss:.2f}
-            </div>
-          </div>
-          <div>
-            <div style="font-size: 0.875rem; color: var(--text-secondary); margin-bottom: 0.5rem;">Target Price</div>
-            <div style="font-family: var(--font-mono); font-size: 1.25rem; font-weight: 600; color: var(--accent-green);">
-              ${target_price:.2f}
-            </div>
-          </div>
-          <div>
-            <div style="font-size: 0.875rem; color: var(--text-secondary); margin-bottom: 0.5rem;">Risk:Reward Ratio</div>
-            <div style="font-family: var(--font-mono); font-size: 1.25rem; font-weight: 600; color: var(--accent-yellow);">
-              1:{risk_reward_ratio:.2f}
-            </div>
-          </div>
-        </div>
-      </div>
-      
-      <!-- Tags Section -->
-      <div style="background: var(--bg-secondary); padding: 1.5rem; border-radius: 8px; margin-bottom: 1.5rem;">
-        <h2 style="margin-bottom: 1.5rem;">🏷️ Tags & Classification</h2>
-        <div style="display: grid; gap: 1rem;">
-          <div>
-            <div style="font-size: 0.875rem; color: var(--text-secondary); margin-bottom: 0.5rem;">Strategy Tags:</div>
-            <div>{render_tags(strategy_tags, 'var(--accent-green)')}</div>
-          </div>
-          <div>
-            <div style="font-size: 0.875rem; color: var(--text-secondary); margin-bottom: 0.5rem;">Setup Tags:</div>
-            <div>{render_tags(setup_tags, 'var(--accent-blue)')}</div>
-          </div>
-          <div>
-            <div style="font-size: 0.875rem; color: var(--text-secondary); margin-bottom: 0.5rem;">Session Tags:</div>
-            <div>{render_tags(session_tags, 'var(--accent-yellow)')}</div>
-          </div>
-          <div>
-            <div style="font-size: 0.875rem; color: var(--text-secondary); margin-bottom: 0.5rem;">Market Condition Tags:</div>
-            <div>{render_tags(market_condition_tags, 'var(--accent-red)')}</div>
-          </div>
-        </div>
-      </div>
-      
-      <!-- Screenshots Gallery -->
-      {gallery_html}
-      
-      <!-- Notes Section -->
-      <div style="background: var(--bg-secondary); padding: 1.5rem; border-radius: 8px; margin-bottom: 1.5rem;">
-        <h2 style="margin-bottom: 1rem;">📝 Notes & Journal</h2>
-        <div style="line-height: 1.8; color: var(--text-primary);">
-          {notes.replace(chr(10), '<br>')}
-        </div>
-      </div>
-      
-    </section>
-  </main>
-  
-  <!-- Footer - Generated by footer.js -->
-  
-  <!-- GLightbox JS -->
-  <script src="https://cdn.jsdelivr.net/gh/mcstudios/glightbox/dist/js/glightbox.min.js"></script>
-  <script>
-    // Initialize GLightbox for image gallery
-    const lightbox = GLightbox({{
-      selector: '.glightbox',
-      touchNavigation: true,
-      loop: true,
-      autoplayVideos: true
-    }});
-  </script>
-  
-  <!-- Load shared utilities first -->
-  <script src="../assets/js/utils.js"></script>
-  <script src="../assets/js/chartConfig.js"></script>
-  
-  <!-- Application scripts -->
-  <script src="../assets/js/navbar.js"></script>
-  <script src="../assets/js/footer.js"></script>
-  <script src="../assets/js/background.js"></script>
-  <script src="../assets/js/auth.js"></script>
-  <script src="../assets/js/app.js"></script>
-  <script src="../assets/js/glowing-bubbles.js"></script>
-</body>
-</html>
-"""
+    # Render the precompiled page template
+    is_win = pnl_usd >= 0
+
+    return load_template("trade-page.html.template").render(
+        navbar=get_navbar_html("subdirectory"),
+        page_css=asset_url("trade-page.css"),
+        page_js=asset_url("trade-page.js"),
+        trade_number=trade_number,
+        ticker=ticker,
+        strategy=strategy,
+        direction=direction,
+        broker=broker,
+        result_class="win" if is_win else "loss",
+        result_tone="positive" if is_win else "negative",
+        result_label="🎯 WIN" if is_win else "❌ LOSS",
+        pnl_usd=f"{pnl_usd:.2f}",
+        pnl_percent_tone="positive" if pnl_percent >= 0 else "negative",
+        pnl_percent=f"{'+' if pnl_percent >= 0 else ''}{pnl_percent:.2f}",
+        position_size=position_size,
+        time_in_trade=time_in_trade,
+        entry_price=f"{entry_price:.2f}",
+        entry_date=entry_date,
+        entry_time=entry_time,
+        exit_price=f"{exit_price:.2f}",
+        exit_date=exit_date,
+        exit_time=exit_time,
+        stop_loss=f"{stop_loss:.2f}",
+        target_price=f"{target_price:.2f}",
+        risk_reward_ratio=f"{risk_reward_ratio:.2f}",
+        strategy_tags=render_tags(strategy_tags, "strategy"),
+        setup_tags=render_tags(setup_tags, "setup"),
+        session_tags=render_tags(session_tags, "session"),
+        market_condition_tags=render_tags(market_condition_tags, "market"),
+        gallery_html=gallery_html,
+        notes=notes.replace("\n", "<br>"),
+    )
+
+
+def trade_page_filename(trade):
+    """
+    File name of a trade's detail page
+
+    Args:
+        trade (dict): Trade dictionary
+
+    Returns:
+        str: e.g. 'trade-001-ABCD.html'
+    """
+    trade_number = trade.get("trade_number", 0)
+    ticker = trade.get("ticker", "UNKNOWN")
+    return f"trade-{trade_number:03d}-{ticker}.html"
+
+
+def render_batch(trades):
+    """
+    Render a batch of trade pages (runs in a worker process)
 
-    return html
+    Args:
+        trades (list): Trades to render
+
+    Returns:
+        list: (filename, html) pairs
+    """
+    return [
+        (trade_page_filename(trade), generate_trade_html(trade)) for trade in trades
+    ]
+
+
+def remove_stale_pages(output_dir, expected, manifest):
+    """
+    Delete trade pages that no longer belong to any trade
+
+    Args:
+        output_dir (Path): Trade pages directory
+        expected (set): File names that should exist
+        manifest (OutputManifest): Manifest to drop removed pages from
+
+    Returns:
+        int: Number of pages removed
+    """
+    removed = 0
+    for page in output_dir.glob("trade-*.html"):
+        if page.name in expected:
+            continue
+        try:
+            page.unlink()
+            removed += 1
+            print(f"Removed stale page: {page}")
+        except OSError as e:
+            print(f"Warning: Could not remove {page}: {e}")
+        manifest.discard(str(output_dir / page.name))
+
+    # Pages deleted by hand still have manifest entries
+    prefix = str(output_dir) + os.sep
+    for path in list(manifest.entries):
+        if path.startswith(prefix) and os.path.basename(path) not in expected:
+            manifest.discard(path)
+
+    return removed
 
 
 def main():
@@ -354,26 +248,73 @@ def main():
     output_dir = Path("index.directory/trades")
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Generate pages
+    # Pages reference the shared assets by content hash
+    publish_assets("trade-page.css", "trade-page.js")
+
+    # Skip pages whose trade data, page template and assets are unchanged
+    manifest = OutputManifest("trade-pages")
+    template_digest = load_template("trade-page.html.template").digest
+    assets = [asset_url("trade-page.css"), asset_url("trade-page.js")]
+    fingerprints = {}
+    pending = []
     for trade in trades:
-        trade_number = trade.get("trade_number", 0)
-        ticker = trade.get("ticker", "UNKNOWN")
+        filepath = str(output_dir / trade_page_filename(trade))
+        page_fingerprint = fingerprint(PAGE_FORMAT_VERSION, template_digest, assets, trade)
+        fingerprints[filepath] = page_fingerprint
+        if not manifest.is_fresh(filepath, page_fingerprint):
+            pending.append(trade)
 
-        # Generate HTML
-        html_content = generate_trade_html(trade)
+    print(f"{len(pending)} page(s) changed, {len(trades) - len(pending)} unchanged")
 
-        # Write file
-        filename = f"trade-{trade_number:03d}-{ticker}.html"
-        filepath = output_dir / filename
+    # Render changed pages in batches; small runs stay in-process
+    batches = [
+        pending[i : i + PAGE_BATCH_SIZE]
+        for i in range(0, len(pending), PAGE_BATCH_SIZE)
+    ]
+    if len(batches) > 1:
+        with ProcessPoolExecutor() as executor:
+            rendered = executor.map(render_batch, batches)
+            written = write_batches(rendered, output_dir, fingerprints, manifest)
+    else:
+        rendered = map(render_batch, batches)
+        written = write_batches(rendered, output_dir, fingerprints, manifest)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(html_content)
+    # Remove pages for renamed or deleted trades
+    expected = {os.path.basename(path) for path in fingerprints}
+    removed = remove_stale_pages(output_dir, expected, manifest)
 
-        print(f"Generated: {filepath}")
+    manifest.save()
 
-    print(f"\n✓ Generated {len(trades)} trade detail page(s)")
+    print(f"\n✓ Generated {written} trade detail page(s)")
+    if removed:
+        print(f"✓ Removed {removed} stale page(s)")
     print(f"Output directory: {output_dir}")
 
 
+def write_batches(rendered, output_dir, fingerprints, manifest):
+    """
+    Write rendered page batches as they arrive and record them in the manifest
+
+    Args:
+        rendered (iterable): Batches of (filename, html) pairs
+        output_dir (Path): Trade pages directory
+        fingerprints (dict): Page path -> input fingerprint
+        manifest (OutputManifest): Manifest to record written pages in
+
+    Returns:
+        int: Number of pages written
+    """
+    written = 0
+    for batch in rendered:
+        for filename, html_content in batch:
+            filepath = str(output_dir / filename)
+            with open(filepath, "w", encoding="utf-8") as f:
+                f.write(html_content)
+            manifest.record(filepath, fingerprints[filepath], html_content)
+            written += 1
+            print(f"Generated: {filepath}")
+    return written
+
+
 if __name__ == "__main__":
     main()
@@ -5,24 +5,52 @@ Creates master.trade.md files for each week folder
 
 This script:
 1. Scans all week folders in SFTi.Tradez/
-2. Aggregates trade data for each week
+2. Groups the trades already parsed into trades-index.json by week folder
+   (falls back to parsing the folder's markdown if the index is missing)
 3. Generates a master.trade.md file with week summary
 4. Includes statistics, trade list, and images
 
 Performance Optimizations:
-- Single-pass calculation for week statistics
-- Efficient tracking of wins/losses without intermediate lists
-- Combined calculation of totals and extremes
+- Week statistics come from the shared mergeable PeriodStats (utils.py)
+- No second YAML parse of the journal: trades come from the trade index
+- Folders whose trade set is unchanged are skipped (fingerprint manifest)
+- Changed folders are rendered and written in parallel
 """
 
 import os
 import sys
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 import yaml
+from globals_utils import setup_imports
+
+# Setup imports
+setup_imports(__file__)
+from utils import PeriodStats, OutputManifest, fingerprint
+from template_engine import Template, load_template
+
+# Bump when the master.trade.md layout changes to force a full regeneration
+MASTER_FORMAT_VERSION = 3
+
+# Parallel writers for changed week folders
+MAX_WRITE_WORKERS = 8
+
+# One trade in the master file's trade list, compiled once
+TRADE_ENTRY = Template(
+    """
+### {number}. {ticker} - {date}
+
+- **Direction**: {direction}
+- **Entry**: ${entry_price}
+- **Exit**: ${exit_price}
+- **P&L**: {pnl}
+{details}""",
+    "week master trade entry",
+)
 
 
 def get_repo_root():
@@ -91,6 +119,38 @@ def collect_week_trades(week_folder: Path) -> List[Dict]:
     return trades
 
 
+def load_indexed_week_trades(repo_root: Path) -> Optional[Dict[str, List[Dict]]]:
+    """
+    Group the trades from trades-index.json by their week folder
+
+    Args:
+        repo_root (Path): Repository root
+
+    Returns:
+        Optional[Dict[str, List[Dict]]]: Week folder name -> trades sorted by
+        entry date, or None if the index is not available
+    """
+    index_path = repo_root / "index.directory" / "trades-index.json"
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            index_data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        print(f"Trade index unavailable ({e}), parsing week folders directly")
+        return None
+
+    grouped = {}
+    for trade in index_data.get("trades", []):
+        folder = Path(trade.get("file_path", "")).parent.name
+        if folder.startswith("week."):
+            grouped.setdefault(folder, []).append(trade)
+
+    # Sort by date
+    for trades in grouped.values():
+        trades.sort(key=lambda x: x.get("entry_date", ""))
+
+    return grouped
+
+
 def calculate_week_stats(trades: List[Dict]) -> Dict:
     """
     Calculate statistics for a week
@@ -116,54 +176,31 @@ def calculate_week_stats(trades: List[Dict]) -> Dict:
             "profit_factor": 0.0,
         }
 
-    # Single-pass calculation for efficiency
-    total_pnl = 0.0
-    win_count = 0
-    loss_count = 0
-    breakeven = 0
-    total_wins = 0.0
-    total_losses = 0.0
-    largest_win = 0.0
-    largest_loss = 0.0
-
-    for trade in trades:
-        pnl = float(trade.get("pnl_usd", 0) or 0)
-        total_pnl += pnl
-
-        if pnl > 0:
-            win_count += 1
-            total_wins += pnl
-            if pnl > largest_win:
-                largest_win = pnl
-        elif pnl < 0:
-            loss_count += 1
-            total_losses += pnl
-            if pnl < largest_loss:
-                largest_loss = pnl
-        else:
-            breakeven += 1
+    # Same mergeable stats used for the period summaries
+    period = PeriodStats.from_trades(trades)
+    total_trades = period.total_trades
+    win_count = period.winning_trades
+    loss_count = period.losing_trades
 
-    total_trades = len(trades)
     win_rate = (win_count / total_trades * 100) if total_trades > 0 else 0.0
+    avg_win = period.gross_profit / win_count if win_count > 0 else 0.0
+    avg_loss = period.gross_loss / loss_count if loss_count > 0 else 0.0
 
-    avg_win = total_wins / win_count if win_count > 0 else 0.0
-    avg_loss = total_losses / loss_count if loss_count > 0 else 0.0
-
-    gross_profit = total_wins
-    gross_loss = abs(total_losses)
+    gross_profit = period.gross_profit
+    gross_loss = abs(period.gross_loss)
     profit_factor = gross_profit / gross_loss if gross_loss > 0 else 0.0
 
     return {
         "total_trades": total_trades,
-        "total_pnl": total_pnl,
+        "total_pnl": period.total_pnl,
         "wins": win_count,
         "losses": loss_count,
-        "breakeven": breakeven,
+        "breakeven": period.breakeven_trades,
         "win_rate": win_rate,
         "avg_win": avg_win,
         "avg_loss": avg_loss,
-        "largest_win": largest_win,
-        "largest_loss": largest_loss,
+        "largest_win": max(period.best_trade["pnl"], 0.0),
+        "largest_loss": min(period.worst_trade["pnl"], 0.0),
         "profit_factor": profit_factor,
         "gross_profit": gross_profit,
         "gross_loss": gross_loss,
@@ -190,101 +227,89 @@ def generate_master_markdown(week_name: str, stats: Dict, trades: List[Dict]) ->
     else:
         title = f"Week {week_name}"
 
-    # Generate markdown
-    md = f"""# {title} - Trading Summary
-
-## Overview
-
-This week's trading session included **{stats['total_trades']} trades** with a total P&L of **${stats['total_pnl']:.2f}**.
-
-## Performance Metrics
-
-| Metric | Value |
-|--------|-------|
-| Total Trades | {stats['total_trades']} |
-| Total P&L | ${stats['total_pnl']:.2f} |
-| Win Rate | {stats['win_rate']:.1f}% |
-| Wins | {stats['wins']} |
-| Losses | {stats['losses']} |
-| Breakeven | {stats['breakeven']} |
-| Average Win | ${stats['avg_win']:.2f} |
-| Average Loss | ${stats['avg_loss']:.2f} |
-| Largest Win | ${stats['largest_win']:.2f} |
-| Largest Loss | ${stats['largest_loss']:.2f} |
-| Profit Factor | {stats['profit_factor']:.2f} |
-| Gross Profit | ${stats['gross_profit']:.2f} |
-| Gross Loss | ${stats['gross_loss']:.2f} |
-
-## Trade List
-
-"""
-
     # Add trade list
+    entries = []
     for i, trade in enumerate(trades, 1):
-        ticker = trade.get("ticker", "N/A")
-        date = trade.get("entry_date", "N/A")
         pnl = float(trade.get("pnl_usd", 0) or 0)
-        pnl_str = f"${pnl:.2f}"
-        direction = trade.get("direction", "LONG")
-        entry = float(trade.get("entry_price", 0) or 0)
-        exit_val = float(trade.get("exit_price", 0) or 0)
-
-        md += f"\n### {i}. {ticker} - {date}\n\n"
-        md += f"- **Direction**: {direction}\n"
-        md += f"- **Entry**: ${entry:.2f}\n"
-        md += f"- **Exit**: ${exit_val:.2f}\n"
-        md += f"- **P&L**: {pnl_str}\n"
+        details = []
 
         # Add strategy tags if available
         if trade.get("strategy_tags"):
             tags = trade["strategy_tags"]
             if isinstance(tags, list):
-                md += f"- **Strategy**: {', '.join(tags)}\n"
+                details.append(f"- **Strategy**: {', '.join(tags)}\n")
             else:
-                md += f"- **Strategy**: {tags}\n"
+                details.append(f"- **Strategy**: {tags}\n")
 
         # Add setup tags if available
         if trade.get("setup_tags"):
             tags = trade["setup_tags"]
             if isinstance(tags, list):
-                md += f"- **Setup**: {', '.join(tags)}\n"
+                details.append(f"- **Setup**: {', '.join(tags)}\n")
             else:
-                md += f"- **Setup**: {tags}\n"
+                details.append(f"- **Setup**: {tags}\n")
 
-        # Add notes if available
+        # Add notes if available (skip the index's placeholder)
         if trade.get("notes"):
             notes = trade["notes"].strip()
-            if notes:
-                md += f"\n**Notes**: {notes}\n"
-
-    md += "\n\n## Weekly Reflection\n\n"
-    md += "_Add your weekly reflection, lessons learned, and improvements for next week..._\n\n"
-
-    md += "---\n\n"
-    md += f"*Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n"
-
-    return md
+            if notes and notes != "No notes recorded.":
+                details.append(f"\n**Notes**: {notes}\n")
+
+        entries.append(
+            TRADE_ENTRY.render(
+                number=i,
+                ticker=trade.get("ticker", "N/A"),
+                date=trade.get("entry_date", "N/A"),
+                direction=trade.get("direction", "LONG"),
+                entry_price=f"{float(trade.get('entry_price', 0) or 0):.2f}",
+                exit_price=f"{float(trade.get('exit_price', 0) or 0):.2f}",
+                pnl=f"${pnl:.2f}",
+                details="".join(details),
+            )
+        )
+
+    return load_template("week-master.md.template").render(
+        title=title,
+        total_trades=stats["total_trades"],
+        total_pnl=f"{stats['total_pnl']:.2f}",
+        win_rate=f"{stats['win_rate']:.1f}",
+        wins=stats["wins"],
+        losses=stats["losses"],
+        breakeven=stats["breakeven"],
+        avg_win=f"{stats['avg_win']:.2f}",
+        avg_loss=f"{stats['avg_loss']:.2f}",
+        largest_win=f"{stats['largest_win']:.2f}",
+        largest_loss=f"{stats['largest_loss']:.2f}",
+        profit_factor=f"{stats['profit_factor']:.2f}",
+        gross_profit=f"{stats['gross_profit']:.2f}",
+        gross_loss=f"{stats['gross_loss']:.2f}",
+        trade_list="".join(entries),
+        generated=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    )
 
 
-def process_week_folder(week_folder: Path) -> bool:
+def process_week_folder(
+    week_folder: Path, trades: List[Dict] = None
+) -> Optional[str]:
     """
     Process a single week folder and generate master.trade.md
 
     Args:
         week_folder (Path): Path to week folder
+        trades (List[Dict]): Trades for the week (parsed from the folder if omitted)
 
     Returns:
-        bool: True if successful
+        Optional[str]: Markdown that was written, or None on failure
     """
     week_name = week_folder.name.replace("week.", "")
-    print(f"Processing {week_folder.name}...")
 
     # Collect trades
-    trades = collect_week_trades(week_folder)
+    if trades is None:
+        trades = collect_week_trades(week_folder)
 
     if not trades:
         print(f"  No trades found in {week_folder.name}")
-        return False
+        return None
 
     # Calculate statistics
     stats = calculate_week_stats(trades)
@@ -297,11 +322,13 @@ def process_week_folder(week_folder: Path) -> bool:
     try:
         with open(master_file, "w", encoding="utf-8") as f:
             f.write(markdown_content)
-        print(f"  ✓ Generated master.trade.md with {len(trades)} trades")
-        return True
+        print(
+            f"  ✓ {week_folder.name}: generated master.trade.md with {len(trades)} trades"
+        )
+        return markdown_content
     except Exception as e:
-        print(f"  ✗ Error writing master.trade.md: {e}")
-        return False
+        print(f"  ✗ {week_folder.name}: error writing master.trade.md: {e}")
+        return None
 
 
 def main():
@@ -324,10 +351,45 @@ def main():
 
     print(f"Found {len(week_folders)} week folders\n")
 
+    indexed_trades = load_indexed_week_trades(repo_root)
+    manifest = OutputManifest("week-summaries", str(repo_root))
+
+    # Work out which folders changed since the last run
     success_count = 0
+    pending = []
     for week_folder in week_folders:
-        if process_week_folder(week_folder):
+        if indexed_trades is not None:
+            trades = indexed_trades.get(week_folder.name, [])
+        else:
+            trades = collect_week_trades(week_folder)
+
+        if not trades:
+            print(f"  No trades found in {week_folder.name}")
+            continue
+
+        master_path = str(week_folder.relative_to(repo_root) / "master.trade.md")
+        week_fingerprint = fingerprint(MASTER_FORMAT_VERSION, trades)
+        if manifest.is_fresh(master_path, week_fingerprint):
             success_count += 1
+            continue
+        pending.append((week_folder, trades, master_path, week_fingerprint))
+
+    print(f"{len(pending)} week folder(s) changed, {success_count} unchanged")
+
+    # Render and write changed folders in parallel
+    if pending:
+        workers = min(MAX_WRITE_WORKERS, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(lambda job: process_week_folder(job[0], job[1]), pending)
+            )
+
+        for (_, _, master_path, week_fingerprint), content in zip(pending, results):
+            if content is not None:
+                manifest.record(master_path, week_fingerprint, content)
+                success_count += 1
+
+    manifest.save()
 
     print(
         f"\n✓ Successfully generated {success_count}/{len(week_folders)} master.trade.md files"
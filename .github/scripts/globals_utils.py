@@ -46,6 +46,42 @@ def ensure_directory(directory_path: str) -> str:
     return directory_path
 
 
+def atomic_write_text(filepath: str, content: str, fsync: bool = True) -> None:
+    """
+    Write a text file through a temporary file and a rename.
+    
+    Readers (and a crash at any point) see either the old file or the new
+    one, never a partial write. The temporary file sits next to the target
+    so the rename stays on one filesystem.
+    
+    Args:
+        filepath: Path of the file to write
+        content: Text content
+        fsync: Flush the data to disk before the rename (default: True)
+        
+    Raises:
+        OSError: If the file cannot be written; the target is left untouched
+        
+    Example:
+        atomic_write_text("index.directory/trades-index.json", payload)
+    """
+    directory, filename = os.path.split(filepath)
+    if directory:
+        ensure_directory(directory)
+    temp_path = os.path.join(directory, f".{filename}.{os.getpid()}.tmp")
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, filepath)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
 def load_json_file(filepath: str, default: Any = None) -> Any:
     """
     Load a JSON file with error handling.
@@ -78,6 +114,8 @@ def save_json_file(filepath: str, data: Any, indent: int = 2) -> bool:
     """
     Save data to a JSON file with error handling.
     
+    The file is replaced atomically (see atomic_write_text).
+    
     Args:
         filepath: Path to save JSON file
         data: Data to serialize to JSON
@@ -90,13 +128,7 @@ def save_json_file(filepath: str, data: Any, indent: int = 2) -> bool:
         save_json_file("output.json", {"key": "value"})
     """
     try:
-        # Ensure directory exists
-        directory = os.path.dirname(filepath)
-        if directory:
-            ensure_directory(directory)
-        
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=indent, ensure_ascii=False)
+        atomic_write_text(filepath, json.dumps(data, indent=indent, ensure_ascii=False))
         return True
     except Exception as e:
         print(f"Error saving to {filepath}: {e}")
@@ -9,48 +9,425 @@ This script provides a complete import workflow:
 3. Validates trade data with broker-specific rules
 4. Creates/updates trade markdown files in index.directory/SFTi.Tradez/
 5. Updates trades-index.json with new trades
+
+With --dir, every CSV under a directory is read in parallel worker
+processes. Each broker's executions are merged across files and lot-matched
+together, so a position opened in one export and closed in the next becomes
+one trade. Trade numbers (the per-day N in MM:DD:YYYY.N.md) come from a
+persisted allocator (index.directory/.import/trade-numbers.json), so
+separate imports never reuse a number or a file name.
+
+Imports are resumable. Before any trade file is written, the numbered
+trades are recorded in a write-ahead journal
+(index.directory/.import/journal.json), and progress is checkpointed every
+--checkpoint-every trades. Trade files and the index are replaced through
+temp-and-rename, and trades-index.json is swapped once at the end. If an
+import is interrupted, the next run finishes the journal first, from the
+last checkpoint, so no trade is numbered twice and none is left out of the
+index. Each checkpoint batch is written by a thread pool (week folders
+created once, compiled templates) and flushed to disk with one os.sync().
+
+Every new execution is kept in the fills store (importers/fills_store.py)
+and trades list the ids of their fills, so rematch_fills.py can re-run lot
+matching under another policy without the original CSVs. Matching replays
+the stored fills of every symbol in the new exports first, so a position
+opened in one import and closed in a later one still becomes a trade.
+
+Usage:
+    python .github/scripts/import_csv.py path/to/trades.csv
+    python .github/scripts/import_csv.py --dir import/ --workers 4
 """
 
 import os
 import sys
 import json
 import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict
-from globals_utils import setup_imports, ensure_directory, save_json_file, load_json_file, get_week_folder, parse_date
+from globals_utils import setup_imports, ensure_directory, save_json_file, load_json_file, get_week_folder, parse_date, atomic_write_text
 
 # Setup imports
 setup_imports(__file__)
+from template_engine import Template, load_template
+from importers import detect_brokers, get_importer, list_brokers
+from importers.base_importer import read_header_sample
+from importers.dedupe_index import DedupeIndex, assign_execution_keys
+from importers.fills_store import FillsStore
+
+TRADES_INDEX_PATH = "index.directory/trades-index.json"
+
+# Import state kept between runs, committed with the imported trades
+IMPORT_STATE_DIR = "index.directory/.import"
+TRADE_NUMBER_STATE_PATH = f"{IMPORT_STATE_DIR}/trade-numbers.json"
+JOURNAL_PATH = f"{IMPORT_STATE_DIR}/journal.json"
+JOURNAL_CHECKPOINT_PATH = f"{IMPORT_STATE_DIR}/journal.checkpoint.json"
+
+# Trade files written between journal checkpoints
+JOURNAL_CHECKPOINT_INTERVAL = 100
+
+# Threads rendering and writing trade files
+MAX_WRITE_WORKERS = 8
+
+# Optional fields written to the frontmatter when present: v1.1 schema tags
+# and the ids of the fills a trade was matched from (see FillsStore)
+TRADE_OPTIONAL_FIELDS = (
+    "strategy_tags",
+    "setup_tags",
+    "session_tags",
+    "market_condition_tags",
+    "entry_fills",
+    "exit_fills",
+)
+
+# Execution fields kept per row in the journal, in order (no account ids:
+# the journal is committed with the site if an import is interrupted)
+JOURNAL_EXECUTION_FIELDS = (
+    "key",
+    "symbol",
+    "datetime",
+    "direction",
+    "quantity",
+    "price",
+    "commission",
+    "exec_id",
+)
+
+# Version 2 journals also kept the account id, before exec_id
+_JOURNAL_V2_EXECUTION_FIELDS = JOURNAL_EXECUTION_FIELDS[:-1] + ("account", "exec_id")
+
+# Trade file frontmatter; {optional} holds the optional field lines
+TRADE_FRONTMATTER = Template(
+    """---
+trade_number: {trade_number}
+ticker: {ticker}
+entry_date: {entry_date}
+entry_time: {entry_time}
+exit_date: {exit_date}
+exit_time: {exit_time}
+entry_price: {entry_price}
+exit_price: {exit_price}
+position_size: {position_size}
+direction: {direction}
+strategy: {strategy}
+stop_loss: {stop_loss}
+target_price: {target_price}
+risk_reward_ratio: {risk_reward_ratio}
+broker: {broker}
+pnl_usd: {pnl_usd}
+pnl_percent: {pnl_percent}{optional}
+screenshots:
+  - {screenshot}
+---""",
+    "trade frontmatter",
+)
 
 
-def detect_broker(csv_content: str) -> str:
+class TradeNumberAllocator:
+    """
+    Hands out trade numbers that stay unique across imports
+
+    A trade number is the trade's sequence within its entry date (the N in
+    MM:DD:YYYY.N.md). The last number used per date is persisted in
+    TRADE_NUMBER_STATE_PATH and never falls behind trades-index.json or the
+    trade files already on disk, so trades added by hand are respected too.
+    """
+
+    def __init__(
+        self,
+        output_dir="index.directory/SFTi.Tradez",
+        path=TRADE_NUMBER_STATE_PATH,
+        index_path=TRADES_INDEX_PATH,
+    ):
+        """
+        Args:
+            output_dir (str): Trade markdown directory (week folders)
+            path (str): Allocator state file
+            index_path (str): Trades index consulted for numbers in use
+        """
+        self.path = path
+        state = load_json_file(path, {}) if os.path.exists(path) else {}
+        self.last_numbers = dict(state.get("last", {}))
+
+        if os.path.exists(index_path):
+            for trade in load_json_file(index_path, {}).get("trades", []):
+                entry_date = str(trade.get("entry_date", ""))[:10]
+                self._observe(entry_date, trade.get("trade_number"))
+
+        # Existing files: week.*/MM:DD:YYYY.N.md
+        for filepath in Path(output_dir).glob("week.*/*.md"):
+            parts = filepath.stem.split(".")
+            if len(parts) == 2:
+                try:
+                    date_obj = datetime.strptime(parts[0], "%m:%d:%Y")
+                except ValueError:
+                    continue
+                self._observe(date_obj.strftime("%Y-%m-%d"), parts[1])
+
+    def _observe(self, entry_date, number):
+        """Record that a number is in use on a date"""
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            return
+        if entry_date and number > self.last_numbers.get(entry_date, 0):
+            self.last_numbers[entry_date] = number
+
+    def assign(self, trades: List[Dict]) -> List[Dict]:
+        """
+        Number trades in one deterministic pass
+
+        Args:
+            trades (List[Dict]): Trades from any number of files and brokers
+
+        Returns:
+            List[Dict]: The trades in numbering order (entry, exit, ticker, broker)
+        """
+        ordered = sorted(
+            trades,
+            key=lambda t: (
+                t.get("entry_date", ""),
+                t.get("entry_time", ""),
+                t.get("exit_date", ""),
+                t.get("exit_time", ""),
+                t.get("ticker", ""),
+                t.get("broker", ""),
+            ),
+        )
+        for trade in ordered:
+            entry_date = trade.get("entry_date", "")
+            number = self.last_numbers.get(entry_date, 0) + 1
+            self.last_numbers[entry_date] = number
+            trade["trade_number"] = number
+        return ordered
+
+    def save(self) -> bool:
+        """Persist the last number used per date"""
+        return save_json_file(
+            self.path, {"version": 1, "last": dict(sorted(self.last_numbers.items()))}
+        )
+
+
+class ImportJournal:
+    """
+    Write-ahead journal of one import
+
+    The plan (numbered trades, output directory and the new executions to
+    record for de-duplication and in the fills store) is written once,
+    before any trade file. A
+    small checkpoint file holds how many trade files are known to be
+    written. Every step after the plan is idempotent: files are rewritten
+    with the same content, executions are inserted with INSERT OR IGNORE,
+    and the index skips trades it already has. Replaying from the last
+    checkpoint is therefore safe. Removing the journal marks the import
+    as complete.
     """
-    Auto-detect broker from CSV content
+
+    def __init__(self, path=JOURNAL_PATH, checkpoint_path=JOURNAL_CHECKPOINT_PATH):
+        """
+        Args:
+            path (str): Journal (plan) file
+            checkpoint_path (str): Checkpoint file
+        """
+        self.path = path
+        self.checkpoint_path = checkpoint_path
+        self.plan = {}
+        self.written = 0
+
+    @classmethod
+    def pending(cls, path=JOURNAL_PATH, checkpoint_path=JOURNAL_CHECKPOINT_PATH):
+        """
+        Load an unfinished journal, if there is one
+
+        Returns:
+            ImportJournal or None
+        """
+        if not os.path.exists(path):
+            return None
+        journal = cls(path, checkpoint_path)
+        journal.plan = load_json_file(path, {})
+        if not journal.plan.get("trades"):
+            print(f"Ignoring unreadable import journal: {path}")
+            return None
+        if os.path.exists(checkpoint_path):
+            journal.written = load_json_file(checkpoint_path, {}).get("written", 0)
+        return journal
+
+    @property
+    def trades(self) -> List[Dict]:
+        """Planned trades, numbered, in writing order"""
+        return self.plan.get("trades", [])
+
+    @property
+    def output_dir(self) -> str:
+        """Trade markdown directory of the planned import"""
+        return self.plan.get("output_dir", "index.directory/SFTi.Tradez")
+
+    def executions(self) -> Dict[str, List[Dict]]:
+        """
+        New executions per broker, as DedupeIndex.record() and
+        FillsStore.append() take them
+
+        Version 1 journals kept only key, symbol and time, so their
+        executions have no fill fields.
+        """
+        fields = (
+            _JOURNAL_V2_EXECUTION_FIELDS
+            if self.plan.get("version") == 2
+            else JOURNAL_EXECUTION_FIELDS
+        )
+        return {
+            broker: [dict(zip(fields, row)) for row in rows]
+            for broker, rows in self.plan.get("executions", {}).items()
+        }
+
+    def begin(self, trades: List[Dict], output_dir: str, new_executions: Dict) -> bool:
+        """
+        Record the plan before anything is written
+
+        Args:
+            trades (List[Dict]): Numbered trades in writing order
+            output_dir (str): Trade markdown directory
+            new_executions (Dict): Broker -> executions to record once imported
+
+        Returns:
+            bool: True if the journal was written
+        """
+        self.plan = {
+            "version": 3,
+            "started_at": datetime.now().isoformat(timespec="seconds"),
+            "output_dir": output_dir,
+            "trades": trades,
+            "executions": {
+                broker: [
+                    [
+                        e["datetime"].isoformat()
+                        if field == "datetime" and isinstance(e["datetime"], datetime)
+                        else e.get(field)
+                        for field in JOURNAL_EXECUTION_FIELDS
+                    ]
+                    for e in executions
+                ]
+                for broker, executions in new_executions.items()
+            },
+        }
+        self.written = 0
+        if os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+        return save_json_file(self.path, self.plan, indent=None)
+
+    def checkpoint(self, written: int) -> bool:
+        """
+        Record that the first `written` planned trade files are on disk
+
+        Args:
+            written (int): Number of trade files written so far
+
+        Returns:
+            bool: True if the checkpoint was saved
+        """
+        self.written = written
+        return save_json_file(self.checkpoint_path, {"written": written}, indent=None)
+
+    def finish(self):
+        """Remove the journal: the import is complete"""
+        for path in (self.checkpoint_path, self.path):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def write_journal_files(journal: ImportJournal, checkpoint_every: int = JOURNAL_CHECKPOINT_INTERVAL) -> int:
+    """
+    Write a journal's remaining trade files, checkpointing as it goes
 
     Args:
-        csv_content (str): Raw CSV content
+        journal (ImportJournal): Journal with a plan
+        checkpoint_every (int): Trade files written between checkpoints
 
     Returns:
-        str: Detected broker name or None
+        int: Number of trade files written in this call
     """
-    import sys
+    trades = journal.trades
+    start = min(journal.written, len(trades))
+    if start:
+        print(f"  Resuming after {start} of {len(trades)} trade file(s)")
+
+    def checkpoint(written):
+        journal.checkpoint(start + written)
+        print(f"  Wrote {start + written}/{len(trades)} trade file(s)")
 
-    sys.path.insert(0, os.path.dirname(__file__))
-    from importers import list_brokers, get_importer
+    try:
+        write_trade_files(
+            trades[start:],
+            journal.output_dir,
+            batch_size=checkpoint_every,
+            on_batch=checkpoint,
+        )
+    except OSError as e:
+        print(f"Error writing trade files: {e}")
+        print(f"Progress is saved in {journal.path}; re-run the import to resume")
+        sys.exit(1)
+    journal.checkpoint(len(trades))
+    return len(trades) - start
 
-    for broker_name in list_brokers():
-        importer = get_importer(broker_name)
-        if importer and importer.detect_format(csv_content):
-            return broker_name
 
-    return None
+def complete_journal(journal: ImportJournal):
+    """
+    Record a journal's executions, swap in the trades index, remove the journal
+
+    Args:
+        journal (ImportJournal): Journal whose trade files are all written
+    """
+    record_executions(journal.executions())
+    update_trades_index(journal.trades)
+    journal.finish()
+
+
+def record_executions(executions_by_broker: Dict[str, List[Dict]]):
+    """
+    Remember new executions so a re-import skips them, and keep their fills
+
+    Every new execution is recorded, including ones that only opened a
+    position: later imports replay the stored fills, so the trade is
+    produced when a closing execution arrives.
+
+    Args:
+        executions_by_broker (Dict[str, List[Dict]]): Broker -> new executions
+    """
+    dedupe_index = DedupeIndex()
+    fills_store = FillsStore()
+    for broker, executions in executions_by_broker.items():
+        dedupe_index.record(broker, executions)
+        fills = [e for e in executions if "direction" in e]
+        added = fills_store.append(broker, fills)
+        if fills:
+            print(f"  Stored {added} new fill(s) for {broker}")
+    dedupe_index.close()
+    fills_store.close()
+
+
+def detect_broker(csv_content: str) -> str:
+    """
+    Auto-detect broker from CSV content
+
+    Args:
+        csv_content (str): Raw CSV content or a header sample of it
+
+    Returns:
+        str: Best matching broker name or None
+    """
+    ranked = detect_brokers(csv_content)
+    return ranked[0][0] if ranked else None
 
 
 def parse_csv_file(csv_path: str, broker: str = None) -> List[Dict]:
     """
     Parse a CSV file into trades
 
+    The file is streamed: detection reads only a header sample and rows are
+    parsed one at a time, so memory does not grow with the file size.
+
     Args:
         csv_path (str): Path to CSV file
         broker (str, optional): Broker name (auto-detect if None)
@@ -58,40 +435,157 @@ def parse_csv_file(csv_path: str, broker: str = None) -> List[Dict]:
     Returns:
         List[Dict]: List of parsed trades
     """
-    try:
-        with open(csv_path, "r", encoding="utf-8") as f:
-            csv_content = f.read()
-    except Exception as e:
-        print(f"Error reading CSV file: {e}")
-        return []
-
     # Detect broker if not specified
     if not broker:
-        broker = detect_broker(csv_content)
-        if not broker:
+        try:
+            ranked = detect_brokers(read_header_sample(csv_path))
+        except Exception as e:
+            print(f"Error reading CSV file: {e}")
+            return []
+
+        if not ranked:
             print("Could not auto-detect broker. Please specify with --broker flag")
             return []
-        print(f"Detected broker: {broker}")
+        broker = ranked[0][0]
+        print(f"Detected broker: {describe_ranking(ranked)}")
 
     # Get importer and parse
-    import sys
-
-    sys.path.insert(0, os.path.dirname(__file__))
-    from importers import get_importer
-
     importer = get_importer(broker)
     if not importer:
         print(f"No importer found for broker: {broker}")
         return []
 
     try:
-        trades = importer.parse_csv(csv_content)
+        trades = importer.parse_file(csv_path)
         return trades
     except Exception as e:
         print(f"Error parsing CSV: {e}")
         return []
 
 
+def describe_ranking(ranked) -> str:
+    """'ibkr (78% of indicators); also schwab 57%' for a detect_brokers() result"""
+    text = f"{ranked[0][0]} ({ranked[0][1]:.0%} of indicators)"
+    if len(ranked) > 1:
+        text += "; also " + ", ".join(f"{name} {score:.0%}" for name, score in ranked[1:])
+    return text
+
+
+def read_file_executions(job: tuple) -> tuple:
+    """
+    Detect the broker of one CSV file and read its executions
+
+    Runs in a worker process for --dir imports, so it returns messages
+    instead of printing them. Executions get their dedupe 'key' here.
+
+    Args:
+        job (tuple): (csv_path, broker name or None to auto-detect)
+
+    Returns:
+        tuple: (csv_path, broker or None, executions or None, message)
+    """
+    csv_path, broker = job
+    try:
+        message = ""
+        if not broker:
+            ranked = detect_brokers(read_header_sample(csv_path))
+            if not ranked:
+                return csv_path, None, None, "could not auto-detect broker"
+            broker = ranked[0][0]
+            message = describe_ranking(ranked)
+
+        importer = get_importer(broker)
+        if not importer:
+            return csv_path, broker, None, f"no importer for broker {broker}"
+        executions = assign_execution_keys(broker, importer.load_transactions(csv_path))
+        return csv_path, broker, executions, message or broker
+    except Exception as e:
+        return csv_path, broker, None, f"error reading CSV: {e}"
+
+
+def collect_executions(csv_paths: List[str], broker: str = None, workers: int = None) -> Dict:
+    """
+    Read the executions of many CSV files, in parallel worker processes
+
+    Args:
+        csv_paths (List[str]): CSV files
+        broker (str, optional): Broker for every file (auto-detect if None)
+        workers (int, optional): Worker processes (default: one per CPU)
+
+    Returns:
+        Dict: broker name -> executions, files in path order
+    """
+    jobs = [(path, broker) for path in sorted(csv_paths)]
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        results = [read_file_executions(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map() keeps job order, so the merge is the same for any worker count
+            results = list(pool.map(read_file_executions, jobs))
+
+    executions_by_broker = {}
+    for csv_path, file_broker, executions, message in results:
+        if executions is None:
+            print(f"  ✗ {csv_path}: {message}")
+            continue
+        print(f"  {csv_path}: {message}, {len(executions)} execution(s)")
+        executions_by_broker.setdefault(file_broker, []).extend(executions)
+    return executions_by_broker
+
+
+def split_new_executions(executions: List[Dict], dedupe_index: DedupeIndex) -> tuple:
+    """
+    Drop repeated executions and find the ones not imported before
+
+    Args:
+        executions (List[Dict]): One broker's executions, with 'key' set
+        dedupe_index (DedupeIndex): Keys of previously imported executions
+
+    Returns:
+        tuple: (unique executions, new executions, set of imported keys)
+    """
+    # Overlapping exports in one run repeat rows; keep the first copy
+    seen = set()
+    unique = []
+    for execution in executions:
+        if execution["key"] not in seen:
+            seen.add(execution["key"])
+            unique.append(execution)
+
+    imported = dedupe_index.known_keys(seen)
+    new = [e for e in unique if e["key"] not in imported]
+    return unique, new, imported
+
+
+def with_stored_fills(stored: List[Dict], executions: List[Dict]) -> List[Dict]:
+    """
+    Stored fills followed by the executions read that are not among them
+
+    Args:
+        stored (List[Dict]): Fills from FillsStore.fills(), in stored order
+        executions (List[Dict]): Unique executions read from the exports
+
+    Returns:
+        List[Dict]: Executions to replay through the lot matcher
+    """
+    stored_keys = {fill["key"] for fill in stored}
+    return stored + [e for e in executions if e["key"] not in stored_keys]
+
+
+def find_csv_files(directory: str) -> List[str]:
+    """
+    CSV files under a directory, recursively, in path order
+
+    Args:
+        directory (str): Directory to search
+
+    Returns:
+        List[str]: CSV file paths
+    """
+    return sorted(str(p) for p in Path(directory).rglob("*.csv") if p.is_file())
+
+
 def validate_trades(trades: List[Dict], broker: str) -> tuple[List[Dict], List[Dict]]:
     """
     Validate parsed trades
@@ -103,11 +597,6 @@ def validate_trades(trades: List[Dict], broker: str) -> tuple[List[Dict], List[D
     Returns:
         tuple: (valid_trades, invalid_trades_with_errors)
     """
-    import sys
-
-    sys.path.insert(0, os.path.dirname(__file__))
-    from importers import get_importer
-
     importer = get_importer(broker)
     if not importer:
         # If no importer, return all as valid (basic validation)
@@ -126,23 +615,21 @@ def validate_trades(trades: List[Dict], broker: str) -> tuple[List[Dict], List[D
     return valid, invalid
 
 
-def create_trade_markdown(trade: Dict, output_dir: str) -> str:
+def trade_file_path(trade: Dict, output_dir: str) -> str:
     """
-    Create a markdown file for a trade using the existing template format
+    Path of a trade's markdown file
 
     Args:
         trade (Dict): Trade dictionary
         output_dir (str): Output directory (e.g., index.directory/SFTi.Tradez)
 
     Returns:
-        str: Path to created file
-
-    Uses the format: index.directory/SFTi.Tradez/week.YYYY.WW/MM:DD:YYYY.N.md
+        str: index.directory/SFTi.Tradez/week.YYYY.WW/MM:DD:YYYY.N.md
     """
     # Determine week folder and filename from entry date
     entry_date = trade.get("entry_date", datetime.now().isoformat())
     date_obj = parse_date(entry_date)
-    
+
     if date_obj:
         week_folder = get_week_folder(date_obj)
         # Format: MM:DD:YYYY.N.md (N is the trade sequence for that day)
@@ -153,134 +640,174 @@ def create_trade_markdown(trade: Dict, output_dir: str) -> str:
         week_folder = "week.000"
         filename = f"trade-{trade.get('trade_number', 0):03d}.md"
 
-    # Create week directory if needed
-    week_path = os.path.join(output_dir, week_folder)
-    ensure_directory(week_path)
-
-    filepath = os.path.join(week_path, filename)
-
-    # Generate markdown content using existing template format
-    try:
-        # Helper function to convert absolute paths to relative paths
-        def _convert_to_relative_path(absolute_path):
-            """Convert absolute path to relative path from markdown file location"""
-            # Remove leading repo name if present (e.g., /SFTi-Pennies/)
-            if absolute_path.startswith("/"):
-                # Extract the part after the repo name
-                parts = absolute_path.split("/")
-                # Find 'assets' in the path
-                try:
-                    assets_index = parts.index("assets")
-                    # Reconstruct path from assets onwards
-                    relative_parts = parts[assets_index:]
-                    return "../../" + "/".join(relative_parts)
-                except ValueError:
-                    # If 'assets' not found, just use the path as-is with relative prefix
-                    return "../../" + absolute_path.lstrip("/")
-            else:
-                # Already relative, ensure it has the correct prefix
-                if absolute_path.startswith("assets/"):
-                    return "../../" + absolute_path
-                else:
-                    return absolute_path
-
-        # Load template
-        template_path = ".github/templates/trade.md.template"
-        with open(template_path, "r", encoding="utf-8") as f:
-            template = f.read()
-
-        # Prepare data for template
-        screenshots_list = trade.get("screenshots", [])
-        if not screenshots_list or screenshots_list == [""]:
-            screenshots_str = "No screenshots uploaded."
+    return os.path.join(output_dir, week_folder, filename)
+
+
+def _relative_screenshot_path(absolute_path: str) -> str:
+    """Convert a screenshot path to a path relative to the trade markdown file"""
+    # Remove leading repo name if present (e.g., /SFTi-Pennies/)
+    if absolute_path.startswith("/"):
+        # Extract the part after the repo name
+        parts = absolute_path.split("/")
+        # Find 'assets' in the path
+        try:
+            assets_index = parts.index("assets")
+            # Reconstruct path from assets onwards
+            relative_parts = parts[assets_index:]
+            return "../../" + "/".join(relative_parts)
+        except ValueError:
+            # If 'assets' not found, just use the path as-is with relative prefix
+            return "../../" + absolute_path.lstrip("/")
+    else:
+        # Already relative, ensure it has the correct prefix
+        if absolute_path.startswith("assets/"):
+            return "../../" + absolute_path
         else:
-            # Convert paths to relative format and generate HTML img tags
-            screenshots_str = "\n\n".join(
-                [
-                    f'<img width="2048" height="1679" alt="image" src="{_convert_to_relative_path(s)}"/>'
-                    for s in screenshots_list
-                ]
-            )
+            return absolute_path
 
-        # Build frontmatter
-        frontmatter = f"""---
-trade_number: {trade.get('trade_number', '')}
-ticker: {trade.get('ticker', '')}
-entry_date: {trade.get('entry_date', '')}
-entry_time: {trade.get('entry_time', '')}
-exit_date: {trade.get('exit_date', '')}
-exit_time: {trade.get('exit_time', '')}
-entry_price: {trade.get('entry_price', '')}
-exit_price: {trade.get('exit_price', '')}
-position_size: {trade.get('position_size', '')}
-direction: {trade.get('direction', 'LONG')}
-strategy: {trade.get('strategy', '')}
-stop_loss: {trade.get('stop_loss', '')}
-target_price: {trade.get('target_price', '')}
-risk_reward_ratio: {trade.get('risk_reward_ratio', '')}
-broker: {trade.get('broker', '')}
-pnl_usd: {trade.get('pnl_usd', '')}
-pnl_percent: {trade.get('pnl_percent', '')}"""
-
-        # Add new fields for v1.1 schema if present
-        if "strategy_tags" in trade:
-            frontmatter += f"\nstrategy_tags: {trade.get('strategy_tags', [])}"
-        if "setup_tags" in trade:
-            frontmatter += f"\nsetup_tags: {trade.get('setup_tags', [])}"
-        if "session_tags" in trade:
-            frontmatter += f"\nsession_tags: {trade.get('session_tags', [])}"
-        if "market_condition_tags" in trade:
-            frontmatter += (
-                f"\nmarket_condition_tags: {trade.get('market_condition_tags', [])}"
-            )
 
-        frontmatter += f"""
-screenshots:
-  - {screenshots_list[0] if screenshots_list and screenshots_list[0] else 'None'}
----
+def render_trade_markdown(trade: Dict) -> str:
+    """
+    Render a trade's markdown file using the existing template format
 
-# Trade #{trade.get('trade_number', '')} - {trade.get('ticker', '')}
+    The frontmatter and the body (trade.md.template) are both compiled
+    templates, loaded once per process.
 
-## Trade Details
+    Args:
+        trade (Dict): Trade dictionary
 
-- **Ticker**: {trade.get('ticker', '')}
-- **Direction**: {trade.get('direction', 'LONG')}
-- **Entry**: ${trade.get('entry_price', '')} on {trade.get('entry_date', '')} at {trade.get('entry_time', '')}
-- **Exit**: ${trade.get('exit_price', '')} on {trade.get('exit_date', '')} at {trade.get('exit_time', '')}
-- **Position Size**: {trade.get('position_size', '')} shares
-- **Strategy**: {trade.get('strategy', '')}
-- **Broker**: {trade.get('broker', '')}
+    Returns:
+        str: Markdown content
+    """
+    screenshots_list = trade.get("screenshots", [])
+    if not screenshots_list or screenshots_list == [""]:
+        screenshots_str = "No screenshots uploaded."
+    else:
+        # Convert paths to relative format and generate HTML img tags
+        screenshots_str = "\n\n".join(
+            [
+                f'<img width="2048" height="1679" alt="image" src="{_relative_screenshot_path(s)}"/>'
+                for s in screenshots_list
+            ]
+        )
+
+    # Add v1.1 schema tags and fill ids if present
+    optional = "".join(
+        f"\n{field}: {trade.get(field, [])}"
+        for field in TRADE_OPTIONAL_FIELDS
+        if field in trade
+    )
 
-## Risk Management
+    fields = {
+        "trade_number": trade.get("trade_number", ""),
+        "ticker": trade.get("ticker", ""),
+        "entry_date": trade.get("entry_date", ""),
+        "entry_time": trade.get("entry_time", ""),
+        "exit_date": trade.get("exit_date", ""),
+        "exit_time": trade.get("exit_time", ""),
+        "entry_price": trade.get("entry_price", ""),
+        "exit_price": trade.get("exit_price", ""),
+        "position_size": trade.get("position_size", ""),
+        "direction": trade.get("direction", "LONG"),
+        "strategy": trade.get("strategy", ""),
+        "stop_loss": trade.get("stop_loss", ""),
+        "target_price": trade.get("target_price", ""),
+        "risk_reward_ratio": trade.get("risk_reward_ratio", ""),
+        "broker": trade.get("broker", ""),
+        "pnl_usd": trade.get("pnl_usd", ""),
+        "pnl_percent": trade.get("pnl_percent", ""),
+    }
+    frontmatter = TRADE_FRONTMATTER.render(
+        optional=optional,
+        screenshot=screenshots_list[0] if screenshots_list and screenshots_list[0] else "None",
+        **fields,
+    )
 
-- **Stop Loss**: ${trade.get('stop_loss', '')}
-- **Target Price**: ${trade.get('target_price', '')}
-- **Risk:Reward Ratio**: 1:{trade.get('risk_reward_ratio', '')}
+    # Body comes from the shared trade template (compiled once per run)
+    body = load_template("trade.md.template", strip_frontmatter=True).render(
+        notes=trade.get("notes", "Imported from CSV"),
+        screenshots=screenshots_str,
+        **fields,
+    )
+    return frontmatter + body
 
-## Results
 
-- **P&L (USD)**: ${trade.get('pnl_usd', '')}
-- **P&L (%)**: {trade.get('pnl_percent', '')}%
+def create_trade_markdown(trade: Dict, output_dir: str) -> str:
+    """
+    Create a markdown file for a trade using the existing template format
 
-## Notes
+    Args:
+        trade (Dict): Trade dictionary
+        output_dir (str): Output directory (e.g., index.directory/SFTi.Tradez)
 
-{trade.get('notes', 'Imported from CSV')}
+    Returns:
+        str: Path to created file
 
-## Screenshots
+    Uses the format: index.directory/SFTi.Tradez/week.YYYY.WW/MM:DD:YYYY.N.md
+    """
+    filepath = trade_file_path(trade, output_dir)
+    ensure_directory(os.path.dirname(filepath))
+    # Temp-and-rename, so a crash never leaves half a file
+    atomic_write_text(filepath, render_trade_markdown(trade))
+    print(f"Created trade file: {filepath}")
+    return filepath
+
+
+def _write_trade_file(job: tuple) -> str:
+    """Render and write one (trade, path) pair; runs in a writer thread"""
+    trade, filepath = job
+    # Flushed to disk per batch by write_trade_files, not per file
+    atomic_write_text(filepath, render_trade_markdown(trade), fsync=False)
+    return filepath
+
+
+def write_trade_files(
+    trades: List[Dict],
+    output_dir: str,
+    workers: int = MAX_WRITE_WORKERS,
+    batch_size: int = None,
+    on_batch=None,
+) -> List[str]:
+    """
+    Write many trade markdown files in batches through a thread pool
 
-{screenshots_str}
-"""
+    Trades are grouped by week folder and each folder is created once.
+    Within a batch, files are rendered and written concurrently, then
+    flushed to disk with one os.sync() instead of an fsync per file. Only
+    then is on_batch called, so a checkpoint taken there never counts a
+    file that is not on disk.
 
-        # Write to file
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(frontmatter)
+    Args:
+        trades (List[Dict]): Numbered trades
+        output_dir (str): Output directory (e.g., index.directory/SFTi.Tradez)
+        workers (int): Writer threads (default: MAX_WRITE_WORKERS)
+        batch_size (int): Trades per batch (default: all at once)
+        on_batch (Callable): Called with the number of trades written so far
 
-        print(f"Created trade file: {filepath}")
-        return filepath
+    Returns:
+        List[str]: File paths, in trade order
 
-    except Exception as e:
-        print(f"Error creating trade markdown: {e}")
-        return filepath
+    Raises:
+        OSError: If a file cannot be written
+    """
+    paths = [trade_file_path(trade, output_dir) for trade in trades]
+    for folder in sorted({os.path.dirname(path) for path in paths}):
+        ensure_directory(folder)
+
+    batch_size = batch_size or max(len(trades), 1)
+    workers = max(1, min(workers, len(trades)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for offset in range(0, len(trades), batch_size):
+            jobs = list(zip(trades[offset : offset + batch_size], paths[offset : offset + batch_size]))
+            # Week by week within the batch, so each directory is written in one run
+            jobs.sort(key=lambda job: os.path.dirname(job[1]))
+            for _ in executor.map(_write_trade_file, jobs):
+                pass
+            if hasattr(os, "sync"):
+                os.sync()
+            if on_batch:
+                on_batch(offset + len(jobs))
+    return paths
 
 
 def update_trades_index(new_trades: List[Dict]):
@@ -290,23 +817,23 @@ def update_trades_index(new_trades: List[Dict]):
     Args:
         new_trades (List[Dict]): List of new trades to add
     """
-    index_path = "index.directory/trades-index.json"
+    index_path = TRADES_INDEX_PATH
 
     # Load existing index
     index_data = load_json_file(index_path, {"trades": [], "statistics": {}, "version": "1.0"})
     
     existing_trades = index_data.get("trades", [])
 
-    # Create a set of existing trade identifiers (date + ticker)
-    existing_ids = set()
-    for trade in existing_trades:
-        trade_id = f"{trade.get('entry_date', '')}_{trade.get('ticker', '')}"
-        existing_ids.add(trade_id)
+    # Imports are de-duplicated per execution (DedupeIndex) before matching;
+    # here a trade is identified by its file: entry date + trade number
+    existing_ids = {
+        (trade.get("entry_date", ""), trade.get("trade_number")) for trade in existing_trades
+    }
 
     # Add new trades, checking for duplicates
     added_count = 0
     for trade in new_trades:
-        trade_id = f"{trade.get('entry_date', '')}_{trade.get('ticker', '')}"
+        trade_id = (trade.get("entry_date", ""), trade.get("trade_number"))
         if trade_id not in existing_ids:
             existing_trades.append(trade)
             existing_ids.add(trade_id)
@@ -329,10 +856,18 @@ def update_trades_index(new_trades: List[Dict]):
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description="Import trades from broker CSV files")
-    parser.add_argument("csv_file", help="Path to CSV file to import")
+    parser.add_argument("csv_file", nargs="?", help="Path to CSV file to import")
+    parser.add_argument(
+        "--dir", help="Import every CSV file under this directory (recursively)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for --dir (default: one per CPU)",
+    )
     parser.add_argument(
         "--broker",
-        choices=["ibkr", "schwab", "robinhood", "webull"],
+        choices=list_brokers(),
         help="Broker name (auto-detect if not specified)",
     )
     parser.add_argument(
@@ -343,36 +878,99 @@ def main():
         default="index.directory/SFTi.Tradez",
         help="Output directory for trade files",
     )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=JOURNAL_CHECKPOINT_INTERVAL,
+        help=f"Trade files written between journal checkpoints (default: {JOURNAL_CHECKPOINT_INTERVAL})",
+    )
 
     args = parser.parse_args()
+    if bool(args.csv_file) == bool(args.dir):
+        parser.error("give either a CSV file or --dir")
+    if args.checkpoint_every < 1:
+        parser.error("--checkpoint-every must be at least 1")
 
     print("=" * 60)
     print("SFTi-Pennies CSV Importer")
     print("=" * 60)
-    print(f"CSV File: {args.csv_file}")
+    print(f"CSV File: {args.csv_file or args.dir + '/**/*.csv'}")
     print(f"Broker: {args.broker or 'auto-detect'}")
     print(f"Dry Run: {args.dry_run}")
     print(f"Output: {args.output_dir}")
     print("=" * 60)
 
-    # Check if CSV file exists
-    if not os.path.exists(args.csv_file):
-        print(f"Error: CSV file not found: {args.csv_file}")
-        sys.exit(1)
-
-    # Parse CSV
-    print("\n[Step 1/4] Parsing CSV file...")
-    trades = parse_csv_file(args.csv_file, args.broker)
-
-    if not trades:
-        print("No trades found in CSV file")
+    # Finish an interrupted import before starting a new one
+    pending = ImportJournal.pending()
+    if pending and args.dry_run:
+        print(f"\nNote: an interrupted import is pending ({JOURNAL_PATH}); run without --dry-run to finish it")
+    elif pending:
+        print(
+            f"\nFinishing interrupted import from {pending.plan.get('started_at', 'unknown time')} "
+            f"({len(pending.trades)} trade(s))..."
+        )
+        written = write_journal_files(pending, args.checkpoint_every)
+        complete_journal(pending)
+        print(f"  Interrupted import complete ({written} trade file(s) written)")
+
+    if args.dir:
+        if not os.path.isdir(args.dir):
+            print(f"Error: directory not found: {args.dir}")
+            sys.exit(1)
+        csv_paths = find_csv_files(args.dir)
+    else:
+        # Check if CSV file exists
+        if not os.path.exists(args.csv_file):
+            print(f"Error: CSV file not found: {args.csv_file}")
+            sys.exit(1)
+        csv_paths = [args.csv_file]
+
+    # Parse CSV: read executions, then match each broker's executions together
+    print(f"\n[Step 1/4] Parsing {len(csv_paths)} CSV file(s)...")
+    executions_by_broker = collect_executions(csv_paths, args.broker, args.workers)
+
+    # Match everything read after the stored fills of the same symbols (lots
+    # left open by earlier imports), but skip trades closed by already-imported
+    # executions
+    dedupe_index = DedupeIndex()
+    fills_store = FillsStore()
+    new_executions = {}
+    trades_by_broker = {}
+    for broker, executions in executions_by_broker.items():
+        unique, new, imported = split_new_executions(executions, dedupe_index)
+        new_executions[broker] = new
+        print(
+            f"  {broker}: {len(new)} new execution(s), "
+            f"{len(executions) - len(new)} already imported or repeated"
+        )
+        if not new:
+            continue
+        stored = fills_store.fills(broker, symbols={e["symbol"] for e in new})
+        imported_keys = frozenset(imported).union(fill["key"] for fill in stored)
+        trades_by_broker[broker] = get_importer(broker).match_executions(
+            with_stored_fills(stored, unique), imported_keys
+        )
+    dedupe_index.close()
+    fills_store.close()
+    trade_count = sum(len(trades) for trades in trades_by_broker.values())
+
+    if not trade_count:
+        print("No new trades found in CSV file(s)")
+        if not args.dry_run and any(new_executions.values()):
+            # Opening fills still count: a later import may close them
+            record_executions(new_executions)
         sys.exit(0)
 
-    print(f"Found {len(trades)} potential trade(s)")
+    print(f"Found {trade_count} potential trade(s)")
 
     # Validate trades
     print("\n[Step 2/4] Validating trades...")
-    valid_trades, invalid_trades = validate_trades(trades, args.broker or "unknown")
+    valid_trades = []
+    invalid_trades = []
+    for broker, trades in trades_by_broker.items():
+        valid, invalid = validate_trades(trades, broker)
+        valid_trades.extend(valid)
+        invalid_trades.extend(invalid)
 
     print(f"Valid trades: {len(valid_trades)}")
     print(f"Invalid trades: {len(invalid_trades)}")
@@ -384,30 +982,37 @@ def main():
 
     if not valid_trades:
         print("No valid trades to import")
+        if not args.dry_run:
+            record_executions(new_executions)
         sys.exit(0)
 
     if args.dry_run:
         print(f"\n[DRY RUN] Would import {len(valid_trades)} trade(s)")
         sys.exit(0)
 
+    # Number all trades in one pass and journal the plan before writing anything
+    allocator = TradeNumberAllocator(args.output_dir)
+    valid_trades = allocator.assign(valid_trades)
+    journal = ImportJournal()
+    if not journal.begin(valid_trades, args.output_dir, new_executions):
+        print("Error: could not write the import journal")
+        sys.exit(1)
+    allocator.save()
+
     # Create trade files
     print("\n[Step 3/4] Creating trade markdown files...")
-    created_files = []
-    for trade in valid_trades:
-        filepath = create_trade_markdown(trade, args.output_dir)
-        created_files.append(filepath)
+    created = write_journal_files(journal, args.checkpoint_every)
+    print(f"Created {created} trade file(s)")
 
-    print(f"Created {len(created_files)} trade file(s)")
-
-    # Update index
+    # Record executions and swap in the updated index
     print("\n[Step 4/4] Updating trades index...")
-    update_trades_index(valid_trades)
+    complete_journal(journal)
 
     print("\n" + "=" * 60)
     print("Import complete!")
     print("=" * 60)
     print(f"Imported {len(valid_trades)} trade(s)")
-    print(f"Created {len(created_files)} file(s)")
+    print(f"Created {created} file(s)")
     print("\nNext steps:")
     print("1. Run: python .github/scripts/parse_trades.py")
     print("2. Run: python .github/scripts/generate_charts.py")
@@ -2,11 +2,33 @@
 """
 Broker CSV Importers Package
 Registry and management for broker-specific CSV importers
+
+Importer instances are created lazily, once per broker, and reused. Broker
+detection scores every registered importer in a single pass over the CSV
+header's column names, using an indicator index built on first use.
+
+Brokers are described by column mappings in importers/mappings/. A mapping
+with no importer class of its own is registered as a MappedImporter, so a new
+broker can be added with a JSON file alone.
 """
 
+from functools import partial
+
+from .base_importer import header_tokens
+from .mapped_importer import MappedImporter, list_mappings
+
 # Registry of available broker importers
 BROKER_REGISTRY = {}
 
+# Broker name -> importer instance, created on first use
+_INSTANCES = {}
+
+# Indicator column -> [(broker name, profile position)], built on first use
+_INDICATOR_INDEX = None
+
+# (broker name, profile position) -> (indicator count, minimum matches)
+_PROFILE_SIZES = {}
+
 
 def register_broker(name, importer_class):
     """
@@ -16,23 +38,32 @@ def register_broker(name, importer_class):
         name (str): Broker name (e.g., 'ibkr', 'schwab')
         importer_class: Importer class that extends BaseImporter
     """
+    global _INDICATOR_INDEX
     BROKER_REGISTRY[name.lower()] = importer_class
+    _INSTANCES.pop(name.lower(), None)
+    _INDICATOR_INDEX = None
 
 
 def get_importer(broker_name):
     """
     Get importer instance for a broker
 
+    The instance is created on the first call and reused afterwards.
+
     Args:
         broker_name (str): Broker name
 
     Returns:
         BaseImporter instance or None if not found
     """
-    importer_class = BROKER_REGISTRY.get(broker_name.lower())
-    if importer_class:
-        return importer_class()
-    return None
+    key = broker_name.lower()
+    importer = _INSTANCES.get(key)
+    if importer is None:
+        importer_class = BROKER_REGISTRY.get(key)
+        if not importer_class:
+            return None
+        importer = _INSTANCES[key] = importer_class()
+    return importer
 
 
 def list_brokers():
@@ -45,6 +76,53 @@ def list_brokers():
     return list(BROKER_REGISTRY.keys())
 
 
+def _indicator_index():
+    """Indicator column -> [(broker, profile position)] over all brokers"""
+    global _INDICATOR_INDEX
+    if _INDICATOR_INDEX is None:
+        index = {}
+        _PROFILE_SIZES.clear()
+        for broker_name in BROKER_REGISTRY:
+            profiles = get_importer(broker_name).detection_profiles
+            for position, (indicators, min_matches) in enumerate(profiles):
+                key = (broker_name, position)
+                _PROFILE_SIZES[key] = (len(indicators), min_matches)
+                for indicator in indicators:
+                    index.setdefault(indicator, []).append(key)
+        _INDICATOR_INDEX = index
+    return _INDICATOR_INDEX
+
+
+def detect_brokers(csv_content):
+    """
+    Rank registered brokers by how well a CSV header matches their formats
+
+    Args:
+        csv_content (str): Raw CSV content or a header sample of it
+
+    Returns:
+        list: [(broker name, confidence 0-1)] for brokers whose format
+              matches, best first (ties keep registration order)
+    """
+    index = _indicator_index()
+
+    # One pass over the header columns counts matches for every profile
+    matches = {}
+    for token in header_tokens(csv_content):
+        for key in index.get(token, ()):
+            matches[key] = matches.get(key, 0) + 1
+
+    confidence = {}
+    for (broker_name, position), count in matches.items():
+        size, min_matches = _PROFILE_SIZES[(broker_name, position)]
+        if count >= min_matches:
+            score = count / size
+            confidence[broker_name] = max(confidence.get(broker_name, 0.0), score)
+
+    order = {name: i for i, name in enumerate(BROKER_REGISTRY)}
+    return sorted(confidence.items(), key=lambda item: (-item[1], order[item[0]]))
+
+
 # Import and register broker implementations
 from .ibkr import IBKRImporter
 from .schwab import SchwabImporter
@@ -55,3 +133,8 @@ register_broker("ibkr", IBKRImporter)
 register_broker("schwab", SchwabImporter)
 register_broker("robinhood", RobinhoodImporter)
 register_broker("webull", WebullImporter)
+
+# Brokers defined only by a mapping file
+for _mapping_name in list_mappings():
+    if _mapping_name not in BROKER_REGISTRY:
+        register_broker(_mapping_name, partial(MappedImporter.from_mapping, _mapping_name))
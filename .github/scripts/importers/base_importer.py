@@ -2,11 +2,402 @@
 """
 Base Importer Class
 Abstract interface for broker CSV importers
+
+Importers work on a stream of CSV lines: detection looks only at a header
+sample, and iter_transactions() yields one execution per row, so a file is
+never held in memory as a whole.
+
+Timestamps are parsed with the layout sniffed once per file from a sample
+of its values (sniff_timestamp_format). Fixed-width layouts are parsed by
+slicing digits instead of strptime, and repeated strings come from an LRU
+cache, so the per-row cost is a slice and a few int() calls at most.
 """
 
+import csv
+import re
 from abc import ABC, abstractmethod
+from collections import deque
 from datetime import datetime
-from typing import List, Dict, Optional
+from functools import lru_cache
+from operator import itemgetter
+from io import StringIO
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .fills_store import fill_id
+
+# Characters read from the start of a file for format detection
+HEADER_SAMPLE_SIZE = 8192
+
+# First non-blank line of a CSV sample
+_HEADER_LINE_PATTERN = re.compile(r"\s*([^\n]*)")
+
+
+# Lot relief policies supported by LotMatcher
+LOT_POLICIES = ("fifo", "lifo", "average")
+
+# Quantities below this are treated as zero (fractional-share rounding)
+QUANTITY_EPSILON = 1e-9
+
+# Timestamp values sampled per file to pick its format
+TIMESTAMP_SAMPLE_SIZE = 50
+
+# Distinct timestamp strings remembered per file
+TIMESTAMP_CACHE_SIZE = 4096
+
+# strptime directive -> width of its zero-padded field
+_FIXED_WIDTHS = {"Y": 4, "m": 2, "d": 2, "H": 2, "M": 2, "S": 2}
+
+# datetime() argument order of the fixed-width directives
+_FIXED_ORDER = "YmdHMS"
+
+
+def read_header_sample(path: str, size: int = HEADER_SAMPLE_SIZE) -> str:
+    """
+    Read the start of a CSV file for format detection
+
+    Args:
+        path (str): CSV file path
+        size (int): Number of characters to read
+
+    Returns:
+        str: The first `size` characters of the file
+    """
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        return f.read(size)
+
+
+def header_tokens(csv_content: str) -> frozenset:
+    """
+    Lowercased column names of the first non-blank line
+
+    Args:
+        csv_content (str): Raw CSV content or a sample of its first lines
+
+    Returns:
+        frozenset: Column names, stripped and lowercased
+    """
+    header = _HEADER_LINE_PATTERN.match(csv_content).group(1)
+    columns = next(csv.reader([header]), [])
+    return frozenset(c.strip().lower() for c in columns if c.strip())
+
+
+def fixed_layout_parser(fmt: str):
+    """
+    Compile a zero-padded strptime format into a slicing parser
+
+    '%m/%d/%Y %H:%M:%S' becomes: check the length and the separators at
+    their positions, slice out the digit fields and hand them to
+    datetime.fromisoformat() as 'YYYY-MM-DDTHH:MM:SS' (C-speed, validates
+    ranges). Values that do not fit the layout exactly (e.g. '1/5/2025'
+    for '%m/%d/%Y') return None.
+
+    Args:
+        fmt (str): strptime format using only %Y %m %d %H %M %S and literals
+
+    Returns:
+        Callable or None: value -> datetime or None; None if the format
+        has other directives
+    """
+    slices = {}
+    literals = []
+    position = 0
+    i = 0
+    while i < len(fmt):
+        if fmt[i] == "%":
+            directive = fmt[i + 1 : i + 2]
+            width = _FIXED_WIDTHS.get(directive)
+            if width is None or directive in slices:
+                return None
+            slices[directive] = slice(position, position + width)
+            position += width
+            i += 2
+        else:
+            literals.append((position, fmt[i]))
+            position += 1
+            i += 1
+    if not all(d in slices for d in "Ymd"):
+        return None
+
+    length = position
+    get_fields = itemgetter(*(slices[d] for d in _FIXED_ORDER if d in slices))
+    # ISO template with the fields in Y m d H M S order; absent time parts are 00
+    iso_template = "%s-%s-%s"
+    if any(d in slices for d in "HMS"):
+        iso_template += "T" + ":".join("%s" if d in slices else "00" for d in "HMS")
+    positions = [index for index, _ in literals]
+    expected = [char for _, char in literals]
+
+    def parse(value: str) -> Optional[datetime]:
+        if len(value) != length:
+            return None
+        if [value[index] for index in positions] != expected:
+            return None
+        try:
+            # fromisoformat only accepts ASCII digits in each field
+            return datetime.fromisoformat(iso_template % get_fields(value))
+        except ValueError:
+            return None
+
+    return parse
+
+
+def strptime_parser(fmt: str):
+    """
+    strptime-based parser for formats without a fixed layout
+
+    Args:
+        fmt (str): strptime format
+
+    Returns:
+        Callable: value -> datetime or None
+    """
+
+    def parse(value: str) -> Optional[datetime]:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            return None
+
+    return parse
+
+
+def format_parser(fmt: str):
+    """
+    Parser for one format: fixed layout first, strptime for the rest
+
+    strptime still handles what the fixed layout rejects, such as
+    non-padded fields ('1/5/2025'), so results match strptime exactly.
+
+    Args:
+        fmt (str): strptime format
+
+    Returns:
+        Callable: value -> datetime or None
+    """
+    fast = fixed_layout_parser(fmt)
+    slow = strptime_parser(fmt)
+    if fast is None:
+        return slow
+
+    def parse(value: str) -> Optional[datetime]:
+        parsed = fast(value)
+        return parsed if parsed is not None else slow(value)
+
+    return parse
+
+
+def sniff_timestamp_format(samples: Iterable[str], formats: List[str]) -> Optional[str]:
+    """
+    Pick the format that parses the most sample values
+
+    Ties go to the earlier format, so an ambiguous file (every day <= 12)
+    keeps the order the mapping lists, while '25/01/2025' in the sample
+    rules '%m/%d/%Y' out for the whole file.
+
+    Args:
+        samples (Iterable[str]): Stripped, non-empty values from the file
+        formats (List[str]): Candidate strptime formats, preferred first
+
+    Returns:
+        str or None: Best format, or None if no format parses any sample
+    """
+    samples = list(samples)
+    best, best_count = None, 0
+    for fmt in formats:
+        parse = format_parser(fmt)
+        count = sum(1 for value in samples if parse(value) is not None)
+        if count > best_count:
+            best, best_count = fmt, count
+    return best
+
+
+def timestamp_parser(samples: Iterable[str], formats: List[str]):
+    """
+    Per-file timestamp parser: sniffed format first, memoized
+
+    The sniffed format's fast parser handles the common case. A value it
+    rejects falls back to every format in order, then to the first
+    whitespace-separated token (date-only), so rows that differ from the
+    sample still parse as before.
+
+    Args:
+        samples (Iterable[str]): Stripped, non-empty values from the file
+        formats (List[str]): Candidate strptime formats, preferred first
+
+    Returns:
+        Callable: value -> datetime or None (cache_info() for statistics)
+    """
+    parsers = [format_parser(fmt) for fmt in formats]
+    sniffed = sniff_timestamp_format(samples, formats)
+    primary = parsers[formats.index(sniffed)] if sniffed else None
+
+    @lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+    def parse(value: str) -> Optional[datetime]:
+        if primary is not None:
+            parsed = primary(value)
+            if parsed is not None:
+                return parsed
+        tokens = value.split()
+        for candidate in (value, tokens[0] if tokens else value):
+            for parser in parsers:
+                parsed = parser(candidate)
+                if parsed is not None:
+                    return parsed
+        return None
+
+    return parse
+
+
+class LotMatcher:
+    """
+    Matches executions against open lots, one deque of lots per symbol
+
+    Executions must arrive in chronological order. A BUY first covers open
+    short lots, a SELL first closes open long lots; whatever is left opens
+    a new lot, so a fill can flip a position through zero and a SELL with
+    no open position starts a short. Each (lot, closing execution) pair is
+    one closed piece. Commissions are split pro rata by quantity between
+    the pieces and any new lot an execution produces.
+
+    Policies:
+    - fifo: close the oldest open lot first
+    - lifo: close the newest open lot first
+    - average: keep one lot per symbol at the average cost of the position
+
+    Each execution opens at most one lot and closes every lot it touches
+    except the last, so matching is O(n) after the O(n log n) sort.
+
+    Lots remember the keys of the executions that opened them, so every
+    piece names its entry fills and exit fill (see fills_store).
+    """
+
+    def __init__(self, policy: str = "fifo"):
+        """
+        Args:
+            policy (str): One of LOT_POLICIES
+
+        Raises:
+            ValueError: If the policy is unknown
+        """
+        if policy not in LOT_POLICIES:
+            raise ValueError(f"Unknown lot policy: {policy}")
+        self.policy = policy
+        # symbol -> (side, deque of lots); side is 1 for long, -1 for short
+        self.positions = {}
+
+    def add(self, execution: Dict) -> List[Dict]:
+        """
+        Apply one execution
+
+        Args:
+            execution (Dict): {'symbol', 'datetime', 'quantity', 'price',
+                               'direction' ('BUY' or 'SELL'), 'commission',
+                               optional 'key'}
+
+        Returns:
+            List[Dict]: Closed pieces: {'symbol', 'side', 'quantity',
+                        'entry_datetime', 'entry_price', 'exit_datetime',
+                        'exit_price', 'commission', 'entry_fills' (keys of
+                        the lot's executions), 'exit_fill' (this key)}
+        """
+        quantity = abs(float(execution["quantity"]))
+        if quantity <= QUANTITY_EPSILON:
+            return []
+
+        symbol = execution["symbol"]
+        side = 1 if execution["direction"] == "BUY" else -1
+        commission_per_share = float(execution.get("commission") or 0) / quantity
+        position_side, lots = self.positions.get(symbol, (side, None))
+        if lots is None:
+            lots = deque()
+            self.positions[symbol] = (side, lots)
+
+        closed = []
+        remaining = quantity
+        if lots and position_side != side:
+            # Opposite side: relieve open lots
+            while remaining > QUANTITY_EPSILON and lots:
+                lot = lots[-1] if self.policy == "lifo" else lots[0]
+                taken = min(lot["quantity"], remaining)
+                commission = (lot["commission_per_share"] + commission_per_share) * taken
+                closed.append(
+                    {
+                        "symbol": symbol,
+                        "side": position_side,
+                        "quantity": taken,
+                        "entry_datetime": lot["datetime"],
+                        "entry_price": lot["price"],
+                        "exit_datetime": execution["datetime"],
+                        "exit_price": float(execution["price"]),
+                        "commission": commission,
+                        "entry_fills": list(lot["fills"]),
+                        "exit_fill": execution.get("key"),
+                    }
+                )
+                lot["quantity"] -= taken
+                remaining -= taken
+                if lot["quantity"] <= QUANTITY_EPSILON:
+                    if self.policy == "lifo":
+                        lots.pop()
+                    else:
+                        lots.popleft()
+
+        if remaining > QUANTITY_EPSILON:
+            if not lots:
+                # Flat (or flipped through zero): the rest opens on this side
+                self.positions[symbol] = (side, lots)
+            self._open_lot(lots, execution, remaining, commission_per_share)
+
+        return closed
+
+    def _open_lot(self, lots, execution, quantity, commission_per_share):
+        """Add a lot, or fold it into the single average-cost lot"""
+        price = float(execution["price"])
+        if self.policy == "average" and lots:
+            lot = lots[0]
+            total = lot["quantity"] + quantity
+            lot["price"] = (lot["price"] * lot["quantity"] + price * quantity) / total
+            lot["commission_per_share"] = (
+                lot["commission_per_share"] * lot["quantity"]
+                + commission_per_share * quantity
+            ) / total
+            lot["quantity"] = total
+            if execution.get("key") is not None:
+                lot["fills"].append(execution["key"])
+            return
+        lots.append(
+            {
+                "datetime": execution["datetime"],
+                "quantity": quantity,
+                "price": price,
+                "commission_per_share": commission_per_share,
+                "fills": [] if execution.get("key") is None else [execution["key"]],
+            }
+        )
+
+    def open_lots(self) -> Dict[str, List[Dict]]:
+        """
+        Lots still open, per symbol
+
+        Returns:
+            Dict[str, List[Dict]]: symbol -> [{'side', 'datetime', 'quantity',
+                                   'price', 'commission', 'fills'}] in open order
+        """
+        result = {}
+        for symbol, (side, lots) in self.positions.items():
+            if lots:
+                result[symbol] = [
+                    {
+                        "side": side,
+                        "datetime": lot["datetime"],
+                        "quantity": lot["quantity"],
+                        "price": lot["price"],
+                        "commission": lot["commission_per_share"] * lot["quantity"],
+                        "fills": list(lot["fills"]),
+                    }
+                    for lot in lots
+                ]
+        return result
 
 
 class BaseImporter(ABC):
@@ -21,21 +412,134 @@ class BaseImporter(ABC):
         """Initialize the importer"""
         self.broker_name = "Unknown"
         self.supported_formats = []
+        # Lot relief policy used to match executions into trades
+        self.lot_policy = "fifo"
+        # Note written on imported trades (default: "Imported from <broker> CSV")
+        self.import_note = None
+        # [(indicator column names, minimum matches)]; any profile that
+        # reaches its minimum identifies the broker's format
+        self.detection_profiles = []
 
-    @abstractmethod
     def detect_format(self, csv_content: str) -> bool:
         """
         Detect if CSV matches this broker's format
 
+        Only the header line is inspected, so a sample from
+        read_header_sample() is enough.
+
         Args:
-            csv_content (str): Raw CSV content
+            csv_content (str): Raw CSV content or a sample of its first lines
 
         Returns:
             bool: True if format matches, False otherwise
         """
-        pass
+        return self.score_header(header_tokens(csv_content)) > 0
+
+    def score_header(self, tokens: frozenset) -> float:
+        """
+        Confidence that a header belongs to this broker
+
+        Args:
+            tokens (frozenset): Lowercased column names from header_tokens()
+
+        Returns:
+            float: Fraction of the best matching profile's indicators present,
+                   or 0.0 if no profile reaches its minimum
+        """
+        best = 0.0
+        for indicators, min_matches in self.detection_profiles:
+            matches = sum(1 for indicator in indicators if indicator in tokens)
+            if matches >= min_matches:
+                best = max(best, matches / len(indicators))
+        return best
+
+    def timestamp_parser(self, samples: Iterable[str], formats: List[str]):
+        """
+        Timestamp parser for one file, sniffed from a sample of its values
+
+        Importers call this once per file, after reading the first rows,
+        and use the returned callable for every row.
+
+        Args:
+            samples (Iterable[str]): Stripped, non-empty timestamp values
+            formats (List[str]): Candidate strptime formats, preferred first
+
+        Returns:
+            Callable: value -> datetime or None
+        """
+        return timestamp_parser(samples, formats)
 
     @abstractmethod
+    def iter_transactions(self, lines: Iterable[str]) -> Iterator[Dict]:
+        """
+        Yield executions from CSV lines, one row at a time
+
+        Args:
+            lines (Iterable[str]): CSV lines, e.g. an open file object
+
+        Yields:
+            Dict: {'symbol', 'datetime', 'quantity', 'price', 'direction'
+                   ('BUY' or 'SELL'), 'commission'}, plus 'account' and
+                   'exec_id' when the export has them
+        """
+        pass
+
+    def parse_file(self, path: str) -> List[Dict]:
+        """
+        Parse a CSV file into standardized trades, streaming its rows
+
+        Args:
+            path (str): CSV file path
+
+        Returns:
+            List[Dict]: List of trade dictionaries in standard format
+        """
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            return self.parse_lines(f)
+
+    def load_transactions(self, path: str) -> List[Dict]:
+        """
+        Read the executions of a CSV file without matching them
+
+        Used to merge several files before matching (import_csv.py --dir).
+
+        Args:
+            path (str): CSV file path
+
+        Returns:
+            List[Dict]: Executions in file order
+        """
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            return list(self.iter_transactions(f))
+
+    def match_executions(
+        self, transactions: Iterable[Dict], imported_keys: frozenset = frozenset()
+    ) -> List[Dict]:
+        """
+        Match executions (from one or more files) into trades
+
+        Args:
+            transactions (Iterable[Dict]): Executions from iter_transactions()
+            imported_keys (frozenset): Keys of executions imported in an earlier
+                run; pieces they close were already imported and are skipped
+
+        Returns:
+            List[Dict]: List of trade dictionaries in standard format
+        """
+        return self._match_transactions(transactions, imported_keys)
+
+    def parse_lines(self, lines: Iterable[str]) -> List[Dict]:
+        """
+        Parse CSV lines into standardized trades
+
+        Args:
+            lines (Iterable[str]): CSV lines, e.g. an open file object
+
+        Returns:
+            List[Dict]: List of trade dictionaries in standard format
+        """
+        return self._match_transactions(self.iter_transactions(lines))
+
     def parse_csv(self, csv_content: str) -> List[Dict]:
         """
         Parse CSV content into standardized trade format
@@ -65,7 +569,7 @@ class BaseImporter(ABC):
             'notes': str (optional)
         }
         """
-        pass
+        return self.parse_lines(StringIO(csv_content))
 
     @abstractmethod
     def validate_trade(self, trade: Dict) -> tuple[bool, List[str]]:
@@ -80,6 +584,92 @@ class BaseImporter(ABC):
         """
         pass
 
+    def _match_transactions(
+        self, transactions: Iterable[Dict], imported_keys: frozenset = frozenset()
+    ) -> List[Dict]:
+        """
+        Match executions into complete trades with a LotMatcher
+
+        Executions are replayed in time order (stable, so same-time rows keep
+        file order). Every closed piece becomes a trade, numbered by entry time;
+        positions still open at the end of the file produce no trade.
+
+        Args:
+            transactions (Iterable[Dict]): Executions from iter_transactions()
+            imported_keys (frozenset): Keys of previously imported executions;
+                pieces closed by one of them are left out
+
+        Returns:
+            List[Dict]: List of trade dictionaries in standard format
+        """
+        matcher = LotMatcher(self.lot_policy)
+        pieces = []
+        for execution in sorted(transactions, key=lambda t: t["datetime"]):
+            closed = matcher.add(execution)
+            if imported_keys and execution.get("key") in imported_keys:
+                continue
+            pieces.extend(closed)
+
+        # Stable sort keeps same-entry pieces in close order
+        pieces.sort(key=lambda p: p["entry_datetime"])
+        note = self.import_note or f"Imported from {self.broker_name} CSV"
+        return [
+            self._piece_to_trade(piece, number, note)
+            for number, piece in enumerate(pieces, 1)
+        ]
+
+    def _piece_to_trade(self, piece: Dict, trade_number: int, note: str) -> Dict:
+        """
+        Convert a LotMatcher piece into a standard trade
+
+        pnl_usd is net of the piece's commission, which is kept as 'fees'.
+        When the executions carried keys, the trade lists its fill ids as
+        'entry_fills' and 'exit_fills'.
+
+        Args:
+            piece (Dict): Closed piece from LotMatcher.add()
+            trade_number (int): Sequential trade number
+            note (str): Trade notes
+
+        Returns:
+            Dict: Trade in standard format
+        """
+        quantity = piece["quantity"]
+        if abs(quantity - round(quantity)) <= QUANTITY_EPSILON:
+            quantity = int(round(quantity))
+        else:
+            quantity = round(quantity, 6)
+
+        entry_price = piece["entry_price"]
+        exit_price = piece["exit_price"]
+        fees = round(piece["commission"], 2)
+        gross = (exit_price - entry_price) * piece["quantity"] * piece["side"]
+        pnl_usd = round(gross - piece["commission"], 2)
+        cost = entry_price * piece["quantity"]
+
+        trade = {
+            "trade_number": trade_number,
+            "ticker": piece["symbol"],
+            "entry_date": piece["entry_datetime"].strftime("%Y-%m-%d"),
+            "entry_time": piece["entry_datetime"].strftime("%H:%M:%S"),
+            "entry_price": round(entry_price, 6),
+            "exit_date": piece["exit_datetime"].strftime("%Y-%m-%d"),
+            "exit_time": piece["exit_datetime"].strftime("%H:%M:%S"),
+            "exit_price": exit_price,
+            "position_size": quantity,
+            "direction": "LONG" if piece["side"] == 1 else "SHORT",
+            "broker": self.broker_name,
+            "fees": fees,
+            "pnl_usd": pnl_usd,
+            "pnl_percent": round(pnl_usd / cost * 100, 2) if cost > 0 else 0,
+            "notes": note,
+        }
+        if piece["entry_fills"]:
+            trade["entry_fills"] = [fill_id(key) for key in piece["entry_fills"]]
+        if piece["exit_fill"] is not None:
+            trade["exit_fills"] = [fill_id(piece["exit_fill"])]
+        return trade
+
     def get_broker_name(self) -> str:
         """Get the broker name"""
         return self.broker_name
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Execution Dedupe Index
+Remembers every broker execution already imported, across runs
+
+Each execution gets a stable 64-bit key: a hash of (broker, account, symbol,
+timestamp, direction, quantity, price, exec id when present, occurrence).
+The occurrence counts identical rows within one file, so two real fills
+that happen to look the same are both kept, while re-importing the same
+export (or an overlapping one) maps every row to the same keys again.
+
+Keys live in a SQLite table whose INTEGER PRIMARY KEY is the key itself,
+so membership is a B-tree lookup (O(log n)) and recording an import only
+inserts the new rows.
+
+Usage:
+    from importers.dedupe_index import DedupeIndex, assign_execution_keys
+
+    assign_execution_keys("ibkr", executions)
+    index = DedupeIndex()
+    known = index.known_keys(e["key"] for e in executions)
+"""
+
+import hashlib
+import os
+import sqlite3
+from datetime import datetime
+from typing import Dict, Iterable, List, Set
+
+DEDUPE_INDEX_PATH = "index.directory/.import/executions.sqlite"
+
+# Keys per membership query (well below SQLite's bound-parameter limit)
+QUERY_CHUNK_SIZE = 500
+
+
+def execution_key(broker: str, execution: Dict, occurrence: int = 0) -> int:
+    """
+    Stable signed 64-bit key of an execution
+
+    Args:
+        broker (str): Registry broker name, e.g. 'ibkr'
+        execution (Dict): Execution from BaseImporter.iter_transactions()
+        occurrence (int): How many identical executions came before it in the file
+
+    Returns:
+        int: Key that fits an SQLite INTEGER
+    """
+    executed_at = execution["datetime"]
+    if isinstance(executed_at, datetime):
+        executed_at = executed_at.isoformat()
+    identity = "|".join(
+        [
+            broker.lower(),
+            str(execution.get("account") or ""),
+            str(execution["symbol"]).upper(),
+            str(executed_at),
+            str(execution["direction"]),
+            f"{float(execution['quantity']):.6f}",
+            f"{float(execution['price']):.6f}",
+            str(execution.get("exec_id") or ""),
+            str(occurrence),
+        ]
+    )
+    digest = hashlib.sha256(identity.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+def assign_execution_keys(broker: str, executions: List[Dict]) -> List[Dict]:
+    """
+    Set execution['key'] on every execution of one file
+
+    Args:
+        broker (str): Registry broker name
+        executions (List[Dict]): Executions in file order
+
+    Returns:
+        List[Dict]: The same executions
+    """
+    seen = {}
+    for execution in executions:
+        base_key = execution_key(broker, execution)
+        occurrence = seen.get(base_key, 0)
+        seen[base_key] = occurrence + 1
+        execution["key"] = (
+            base_key if occurrence == 0 else execution_key(broker, execution, occurrence)
+        )
+    return executions
+
+
+class DedupeIndex:
+    """
+    SQLite-backed set of imported execution keys
+    """
+
+    def __init__(self, path: str = DEDUPE_INDEX_PATH):
+        """
+        Args:
+            path (str): SQLite database file (created if missing)
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS executions ("
+            " key INTEGER PRIMARY KEY,"
+            " broker TEXT NOT NULL,"
+            " symbol TEXT NOT NULL,"
+            " executed_at TEXT NOT NULL,"
+            " imported_at TEXT NOT NULL)"
+        )
+
+    def known_keys(self, keys: Iterable[int]) -> Set[int]:
+        """
+        The subset of keys already recorded
+
+        Args:
+            keys (Iterable[int]): Execution keys
+
+        Returns:
+            Set[int]: Keys present in the index
+        """
+        keys = list(keys)
+        known = set()
+        for offset in range(0, len(keys), QUERY_CHUNK_SIZE):
+            chunk = keys[offset : offset + QUERY_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.connection.execute(
+                f"SELECT key FROM executions WHERE key IN ({placeholders})", chunk
+            )
+            known.update(row[0] for row in rows)
+        return known
+
+    def record(self, broker: str, executions: Iterable[Dict]) -> int:
+        """
+        Add executions (with 'key' set) to the index
+
+        Args:
+            broker (str): Registry broker name
+            executions (Iterable[Dict]): Executions to remember
+
+        Returns:
+            int: Number of keys that were not yet recorded
+        """
+        imported_at = datetime.now().isoformat(timespec="seconds")
+        before = self.connection.total_changes
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO executions VALUES (?, ?, ?, ?, ?)",
+                (
+                    (
+                        e["key"],
+                        broker,
+                        e["symbol"],
+                        e["datetime"].isoformat()
+                        if isinstance(e["datetime"], datetime)
+                        else str(e["datetime"]),
+                        imported_at,
+                    )
+                    for e in executions
+                ),
+            )
+        return self.connection.total_changes - before
+
+    def count(self) -> int:
+        """Number of recorded executions"""
+        return self.connection.execute("SELECT COUNT(*) FROM executions").fetchone()[0]
+
+    def close(self):
+        """Close the database connection"""
+        self.connection.close()
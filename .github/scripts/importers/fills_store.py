@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Fills Store
+Keeps every imported broker execution (fill) after it has been matched
+
+Matching turns executions into trades and used to drop them. The store
+keeps each fill's broker, symbol, time, side, quantity, price, commission
+and broker execution id, under the same stable key as the dedupe index
+(dedupe_index.execution_key). Broker account ids are not stored: the file
+lives in index.directory and is committed with the site. Trades reference their fills
+by id (fill_id(), the key as 16 hex digits), so fee and slippage analysis
+and re-matching under another lot policy work from the store instead of
+re-parsing CSV exports.
+
+The store is append-only: a fill is inserted once (INSERT OR IGNORE) and
+never updated. Each fill gets the next sequence number when it is stored,
+so fills with the same timestamp come back in import (file) order and
+re-matching them reproduces the imported trades. It lives in the dedupe
+index's SQLite file, in its own table, with an index on
+(symbol, executed_at) for per-symbol time scans.
+
+Usage:
+    from importers.fills_store import FillsStore
+
+    store = FillsStore()
+    fills = store.fills(broker="ibkr", symbol="AAPL")
+"""
+
+import os
+import sqlite3
+from datetime import datetime
+from typing import Dict, Iterable, List
+
+from .dedupe_index import DEDUPE_INDEX_PATH, QUERY_CHUNK_SIZE
+
+FILLS_STORE_PATH = DEDUPE_INDEX_PATH
+
+# Execution fields stored per fill, in column order after the key
+FILL_COLUMNS = (
+    "broker",
+    "symbol",
+    "executed_at",
+    "direction",
+    "quantity",
+    "price",
+    "commission",
+    "exec_id",
+)
+
+
+def fill_id(key: int) -> str:
+    """
+    Printable id of a fill: its signed 64-bit key as 16 hex digits
+
+    Kept as a string so JavaScript readers of the trades index do not
+    lose precision on 64-bit integers.
+
+    Args:
+        key (int): Execution key
+
+    Returns:
+        str: Fill id, e.g. '9f2c0a41d3b87e10'
+    """
+    return format(key & 0xFFFFFFFFFFFFFFFF, "016x")
+
+
+def fill_key(fill_id_str: str) -> int:
+    """
+    Execution key of a fill id (inverse of fill_id)
+
+    Args:
+        fill_id_str (str): Fill id
+
+    Returns:
+        int: Signed 64-bit execution key
+    """
+    key = int(fill_id_str, 16)
+    return key - (1 << 64) if key >= 1 << 63 else key
+
+
+class FillsStore:
+    """
+    Append-only SQLite store of imported fills
+    """
+
+    def __init__(self, path: str = FILLS_STORE_PATH):
+        """
+        Args:
+            path (str): SQLite database file (created if missing)
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        columns = [row[1] for row in self.connection.execute("PRAGMA table_info(fills)")]
+        if columns and "seq" not in columns:
+            self._migrate_unsequenced()
+        self._create_table()
+
+    def _create_table(self):
+        """Create the fills table and its index if missing"""
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS fills ("
+            " seq INTEGER PRIMARY KEY,"
+            " key INTEGER NOT NULL UNIQUE,"
+            " broker TEXT NOT NULL,"
+            " symbol TEXT NOT NULL,"
+            " executed_at TEXT NOT NULL,"
+            " direction TEXT NOT NULL,"
+            " quantity REAL NOT NULL,"
+            " price REAL NOT NULL,"
+            " commission REAL NOT NULL,"
+            " exec_id TEXT NOT NULL)"
+        )
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS fills_symbol_time ON fills (symbol, executed_at)"
+        )
+
+    def _migrate_unsequenced(self):
+        """
+        Rebuild a store from before sequence numbers
+
+        Its rowid was the key, so import order is lost; fills are numbered
+        by time, then key. The account column is dropped and the file is
+        vacuumed so the old values do not linger in free pages.
+        """
+        with self.connection:
+            self.connection.execute("DROP INDEX IF EXISTS fills_symbol_time")
+            self.connection.execute("ALTER TABLE fills RENAME TO fills_unsequenced")
+            self._create_table()
+            self.connection.execute(
+                f"INSERT INTO fills (key, {', '.join(FILL_COLUMNS)})"
+                f" SELECT key, {', '.join(FILL_COLUMNS)} FROM fills_unsequenced"
+                " ORDER BY executed_at, key"
+            )
+            self.connection.execute("DROP TABLE fills_unsequenced")
+        self.connection.execute("VACUUM")
+
+    def append(self, broker: str, executions: Iterable[Dict]) -> int:
+        """
+        Store executions (with 'key' set); fills already stored are kept as-is
+
+        Args:
+            broker (str): Registry broker name
+            executions (Iterable[Dict]): Executions from iter_transactions(),
+                in import order
+
+        Returns:
+            int: Number of fills added
+        """
+        before = self.connection.total_changes
+        with self.connection:
+            self.connection.executemany(
+                f"INSERT OR IGNORE INTO fills (key, {', '.join(FILL_COLUMNS)})"
+                f" VALUES ({', '.join('?' * (len(FILL_COLUMNS) + 1))})",
+                (
+                    (
+                        e["key"],
+                        broker,
+                        e["symbol"],
+                        e["datetime"].isoformat()
+                        if isinstance(e["datetime"], datetime)
+                        else str(e["datetime"]),
+                        e["direction"],
+                        float(e["quantity"]),
+                        float(e["price"]),
+                        float(e.get("commission") or 0),
+                        str(e.get("exec_id") or ""),
+                    )
+                    for e in executions
+                ),
+            )
+        return self.connection.total_changes - before
+
+    def fills(
+        self,
+        broker: str = None,
+        symbol: str = None,
+        start: str = None,
+        end: str = None,
+        symbols: Iterable[str] = None,
+    ) -> List[Dict]:
+        """
+        Stored fills as executions, in time order (import order within a timestamp)
+
+        Args:
+            broker (str): Only this broker
+            symbol (str): Only this symbol
+            start (str): Only fills at or after this ISO date/time
+            end (str): Only fills before this ISO date/time
+            symbols (Iterable[str]): Only these symbols (each symbol's fills
+                stay in order; symbols are read in chunks)
+
+        Returns:
+            List[Dict]: Executions ({'key', 'symbol', 'datetime', ...}) ready
+                        for BaseImporter.match_executions()
+        """
+        conditions = []
+        values = []
+        for column, operator, value in (
+            ("broker", "=", broker),
+            ("symbol", "=", symbol.upper() if symbol else None),
+            ("executed_at", ">=", start),
+            ("executed_at", "<", end),
+        ):
+            if value is not None:
+                conditions.append(f"{column} {operator} ?")
+                values.append(value)
+        if symbols is None:
+            rows = self._select(conditions, values)
+        else:
+            symbols = sorted({name.upper() for name in symbols})
+            rows = []
+            for offset in range(0, len(symbols), QUERY_CHUNK_SIZE):
+                chunk = symbols[offset : offset + QUERY_CHUNK_SIZE]
+                rows.extend(
+                    self._select(
+                        conditions + [f"symbol IN ({','.join('?' * len(chunk))})"],
+                        values + chunk,
+                    )
+                )
+        return [
+            {
+                "key": key,
+                "broker": broker_name,
+                "symbol": symbol_name,
+                "datetime": datetime.fromisoformat(executed_at),
+                "direction": direction,
+                "quantity": quantity,
+                "price": price,
+                "commission": commission,
+                "exec_id": exec_id,
+            }
+            for (
+                key,
+                broker_name,
+                symbol_name,
+                executed_at,
+                direction,
+                quantity,
+                price,
+                commission,
+                exec_id,
+            ) in rows
+        ]
+
+    def _select(self, conditions: List[str], values: List) -> List[tuple]:
+        """Fill rows matching all conditions, in time then import order"""
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self.connection.execute(
+            f"SELECT key, {', '.join(FILL_COLUMNS)} FROM fills{where}"
+            " ORDER BY executed_at, seq",
+            values,
+        ).fetchall()
+
+    def brokers(self) -> List[str]:
+        """Brokers with stored fills"""
+        rows = self.connection.execute("SELECT DISTINCT broker FROM fills ORDER BY broker")
+        return [row[0] for row in rows]
+
+    def count(self) -> int:
+        """Number of stored fills"""
+        return self.connection.execute("SELECT COUNT(*) FROM fills").fetchone()[0]
+
+    def close(self):
+        """Close the database connection"""
+        self.connection.close()
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Mapped Importer
+Broker importers described by a declarative column mapping
+
+A mapping (importers/mappings/<broker>.json) names, for every execution
+field, the header aliases to look for and how to convert the cell. When a
+file is opened, the mapping is compiled against its header row into a
+positional parser: each field is bound to a column index and a converter
+up front, so the row loop runs on csv.reader lists without building a dict
+per row or repeating alias lookups.
+
+Mapping keys:
+- broker_name, import_note, supported_formats
+- detection_profiles: [[indicator column names], minimum matches]
+- fields: {name: {columns, type, default, required, formats, match, values}}
+  - type text: stripped, upper-cased ('required' skips rows where empty)
+  - type raw: stripped, as-is
+  - type int / number: commas and '$' removed; 'default' on bad input
+  - type abs_number: absolute value of number
+  - type fraction: leading number of 'filled/total', e.g. '100/100'
+  - type datetime: 'formats' are candidates; the one that parses most
+    of the file's first rows is used for the file (fixed-width formats
+    are parsed by slicing, see base_importer.timestamp_parser), others
+    and the first whitespace token are fallbacks; rows that do not parse
+    are skipped
+  - type time: 'HH:MM[:SS]' applied to the datetime field
+  - type side: maps the upper-cased cell to BUY/SELL ('match': exact or
+    contains, 'values': {cell: side}); other rows are skipped
+  - 'value' instead of 'columns' makes the field a constant
+- direction: {"field": "<side field>"} or {"sign_of": "<numeric field>"}
+  (positive is BUY); quantity is then made positive
+- filters: [{"field": ..., "equals": ...}] rows must satisfy (filter
+  fields are dropped from the execution)
+
+Usage:
+    from importers.mapped_importer import MappedImporter, load_mapping
+
+    importer = MappedImporter(load_mapping("ibkr"))
+    trades = importer.parse_file("export.csv")
+"""
+
+import csv
+import json
+from itertools import chain, islice
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List
+
+from .base_importer import TIMESTAMP_SAMPLE_SIZE, BaseImporter
+
+# Directory holding <broker>.json mappings
+MAPPINGS_DIR = Path(__file__).resolve().parent / "mappings"
+
+# Returned by a converter when the row must be skipped
+SKIP = object()
+
+
+def load_mapping(name: str) -> Dict:
+    """
+    Load a mapping from importers/mappings/
+
+    Args:
+        name (str): Mapping name without extension, e.g. 'ibkr'
+
+    Returns:
+        Dict: Parsed mapping
+    """
+    with open(MAPPINGS_DIR / f"{name}.json", "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def list_mappings() -> List[str]:
+    """
+    Names of the mappings in importers/mappings/
+
+    Returns:
+        List[str]: Mapping names, sorted
+    """
+    return sorted(path.stem for path in MAPPINGS_DIR.glob("*.json"))
+
+
+def _clean_number(value: str) -> str:
+    """Strip thousands separators and currency signs"""
+    return value.replace(",", "").replace("$", "")
+
+
+def _build_converter(spec: Dict, parse_timestamp: Callable = None) -> Callable:
+    """
+    Converter for one field: cell string -> value, or SKIP
+
+    Args:
+        spec (Dict): Field mapping
+        parse_timestamp (Callable): Per-file parser for datetime fields
+
+    Returns:
+        Callable: Converter taking the raw cell
+    """
+    kind = spec.get("type", "raw")
+    required = spec.get("required", False)
+    default = spec.get("default")
+
+    if kind == "text":
+
+        def convert(cell):
+            value = cell.strip().upper()
+            return SKIP if required and not value else value
+
+    elif kind == "raw":
+
+        def convert(cell):
+            return cell.strip()
+
+    elif kind in ("int", "number", "abs_number"):
+        fallback = 0 if kind == "int" else 0.0
+        fallback = fallback if default is None else default
+
+        def convert(cell):
+            try:
+                value = float(_clean_number(cell))
+            except ValueError:
+                return fallback
+            if kind == "int":
+                return int(value)
+            return abs(value) if kind == "abs_number" else value
+
+    elif kind == "fraction":
+
+        def convert(cell):
+            try:
+                return int(cell.split("/")[0])
+            except ValueError:
+                return 0
+
+    elif kind == "datetime":
+
+        def convert(cell):
+            value = cell.strip()
+            if not value:
+                return SKIP
+            parsed = parse_timestamp(value)
+            return SKIP if parsed is None else parsed
+
+    elif kind == "time":
+
+        def convert(cell):
+            parts = cell.strip().split(":")
+            try:
+                return (
+                    int(parts[0]),
+                    int(parts[1]),
+                    int(parts[2]) if len(parts) > 2 else 0,
+                )
+            except (ValueError, IndexError):
+                return None
+
+    elif kind == "side":
+        values = {key.upper(): side for key, side in spec.get("values", {}).items()}
+        contains = spec.get("match", "exact") == "contains"
+
+        def convert(cell):
+            value = cell.strip().upper()
+            if contains:
+                for key, side in values.items():
+                    if key in value:
+                        return side
+                return SKIP
+            return values.get(value, SKIP)
+
+    else:
+        raise ValueError(f"Unknown field type: {kind}")
+
+    return convert
+
+
+class CompiledMapping:
+    """
+    A mapping bound to one file's header: positional converters per field
+    """
+
+    def __init__(
+        self,
+        mapping: Dict,
+        header: List[str],
+        sample: List[List[str]] = (),
+        timestamp_parser: Callable = None,
+    ):
+        """
+        Args:
+            mapping (Dict): Broker mapping
+            header (List[str]): Header row of the file
+            sample (List[List[str]]): First data rows, for timestamp sniffing
+            timestamp_parser (Callable): (samples, formats) -> parser, e.g.
+                BaseImporter.timestamp_parser
+        """
+        positions = {}
+        for index, column in enumerate(header):
+            positions.setdefault(column.strip(), index)
+
+        # (name, column index, converter); constants are resolved here
+        self.columns = []
+        self.constants = {}
+        for name, spec in mapping["fields"].items():
+            if "value" in spec:
+                self.constants[name] = spec["value"]
+                continue
+            index = next(
+                (positions[c] for c in spec.get("columns", []) if c in positions), None
+            )
+            parse_timestamp = None
+            if spec.get("type") == "datetime":
+                values = [
+                    row[index].strip()
+                    for row in sample
+                    if index is not None and index < len(row) and row[index].strip()
+                ]
+                formats = spec.get("formats", ["%Y-%m-%d %H:%M:%S"])
+                parse_timestamp = timestamp_parser(values, formats)
+            converter = _build_converter(spec, parse_timestamp)
+            if index is None:
+                # Column absent: the default cell applies to every row
+                value = converter(str(spec.get("default", "")))
+                if value is SKIP:
+                    self.columns = None
+                    return
+                self.constants[name] = value
+            else:
+                self.columns.append((name, index, converter))
+
+        self.filters = [(f["field"], f["equals"]) for f in mapping.get("filters", [])]
+        direction = mapping.get("direction", {})
+        self.side_field = direction.get("field")
+        self.sign_field = direction.get("sign_of")
+        self.has_time = "time" in mapping["fields"]
+
+    def rows(self, reader: Iterable[List[str]]) -> Iterator[Dict]:
+        """
+        Convert data rows into executions
+
+        Args:
+            reader (Iterable[List[str]]): csv.reader positioned after the header
+
+        Yields:
+            Dict: Execution
+        """
+        if self.columns is None:
+            # A required column is missing: no row can produce an execution
+            return
+
+        columns = self.columns
+        constants = self.constants
+        filters = self.filters
+        side_field = self.side_field
+        sign_field = self.sign_field
+        has_time = self.has_time
+
+        for row in reader:
+            if not row:
+                continue
+            width = len(row)
+            values = dict(constants)
+            skip = False
+            for name, index, converter in columns:
+                value = converter(row[index] if index < width else "")
+                if value is SKIP:
+                    skip = True
+                    break
+                values[name] = value
+            if skip:
+                continue
+            if filters:
+                if any(values.pop(field, None) != expected for field, expected in filters):
+                    continue
+
+            if has_time:
+                clock = values.pop("time")
+                if clock:
+                    try:
+                        values["datetime"] = values["datetime"].replace(
+                            hour=clock[0], minute=clock[1], second=clock[2]
+                        )
+                    except ValueError:
+                        pass
+
+            if side_field:
+                values["direction"] = values.pop(side_field)
+            else:
+                values["direction"] = "BUY" if values[sign_field] > 0 else "SELL"
+            values["quantity"] = abs(values["quantity"])
+            yield values
+
+
+class MappedImporter(BaseImporter):
+    """
+    Importer driven entirely by a mapping
+
+    Brokers with no special needs are a mapping file and nothing else;
+    subclasses add broker-specific validation.
+    """
+
+    def __init__(self, mapping: Dict):
+        """
+        Args:
+            mapping (Dict): Broker mapping (see module docstring)
+        """
+        super().__init__()
+        self.mapping = mapping
+        self.broker_name = mapping.get("broker_name", "Unknown")
+        self.supported_formats = list(self.mapping.get("supported_formats", []))
+        self.import_note = self.mapping.get("import_note")
+        self.detection_profiles = [
+            (list(indicators), minimum)
+            for indicators, minimum in self.mapping.get("detection_profiles", [])
+        ]
+
+    @classmethod
+    def from_mapping(cls, name: str) -> "MappedImporter":
+        """
+        Importer for a mapping file in importers/mappings/
+
+        Args:
+            name (str): Mapping name, e.g. 'ibkr'
+
+        Returns:
+            MappedImporter: Importer driven by that mapping
+        """
+        return cls(load_mapping(name))
+
+    def compile(self, header: List[str], sample: List[List[str]] = ()) -> CompiledMapping:
+        """
+        Bind the mapping to a header row
+
+        Args:
+            header (List[str]): Header row
+            sample (List[List[str]]): First data rows, for timestamp sniffing
+
+        Returns:
+            CompiledMapping: Positional row parser
+        """
+        return CompiledMapping(self.mapping, header, sample, self.timestamp_parser)
+
+    def iter_transactions(self, lines: Iterable[str]) -> Iterator[Dict]:
+        """
+        Yield executions from CSV lines, one row at a time
+
+        The mapping is compiled once against the header row and the first
+        rows, which pick the file's timestamp format.
+        """
+        reader = csv.reader(lines)
+        header = next(reader, None)
+        if header is None:
+            return
+        sample = list(islice(reader, TIMESTAMP_SAMPLE_SIZE))
+        yield from self.compile(header, sample).rows(chain(sample, reader))
+
+    def validate_trade(self, trade: Dict) -> tuple[bool, List[str]]:
+        """
+        Validate trade data (required fields only)
+        """
+        return self._validate_required_fields(trade)
+
+    def get_sample_mapping(self) -> Dict:
+        """
+        Broker column -> standard field, from the mapping
+
+        Returns:
+            Dict: Sample field mapping
+        """
+        sample = {}
+        for name, spec in self.mapping["fields"].items():
+            if spec.get("columns"):
+                sample[spec["columns"][0]] = name
+        return sample
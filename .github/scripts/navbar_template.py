@@ -4,7 +4,10 @@ Navbar Template Module
 Provides a consistent navbar script tag for all pages
 """
 
+from functools import lru_cache
 
+
+@lru_cache(maxsize=None)
 def get_navbar_html(level="root"):
     """
     Generate navbar script tag with appropriate relative paths
@@ -17,6 +20,8 @@ def get_navbar_html(level="root"):
 
     Returns:
         str: Comment indicating navbar is generated by navbar.js
+
+    The result is cached per level so page generators share one fragment.
     """
 
     # The navbar is now generated dynamically by navbar.js
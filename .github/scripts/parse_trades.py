@@ -9,16 +9,37 @@ Performance Optimizations:
 - Efficient cumulative P&L tracking for drawdown calculation
 - Reduced memory allocation with in-place updates
 - Optimized type conversions and validations
+- Emits a dense per-trading-day series (daily-series.json) so time-based
+  consumers aggregate days instead of re-grouping every trade
+- Parse cache (index.directory/.cache/parse-cache.json): files whose mtime and
+  size are unchanged are not re-read; later stages (search index) reuse the
+  cached trades and full markdown bodies
+- SQLite trade store (index.directory/.cache/trades.sqlite) synced from the
+  parse cache: only trade files whose stamp changed are rewritten, and
+  filtered consumers (export_csv.py) query its indexes instead of the JSON
 """
 
 import os
 import json
+import sqlite3
 import yaml
 import glob
 import re
 from pathlib import Path
 from datetime import datetime
-from globals_utils import save_json_file
+from globals_utils import setup_imports, save_json_file
+
+# Setup imports
+setup_imports(__file__)
+from utils import (
+    build_daily_series,
+    file_stamp,
+    load_parse_cache,
+    DAILY_SERIES_PATH,
+    PARSE_CACHE_PATH,
+    PARSE_CACHE_VERSION,
+)
+from trade_store import TRADE_STORE_PATH, TradeStore
 
 
 def parse_frontmatter(content):
@@ -60,6 +81,20 @@ def parse_trade_file(filepath):
     Returns:
         dict: Parsed trade data or None if parsing fails
     """
+    return parse_trade_file_with_body(filepath)[0]
+
+
+def parse_trade_file_with_body(filepath):
+    """
+    Parse a single trade markdown file, also returning its full markdown body
+
+    Args:
+        filepath (str): Path to trade markdown file
+
+    Returns:
+        tuple: (trade data or None if parsing fails, markdown body)
+    """
+    body = ""
     try:
         with open(filepath, "r", encoding="utf-8") as f:
             content = f.read()
@@ -68,7 +103,7 @@ def parse_trade_file(filepath):
 
         if not frontmatter:
             print(f"Warning: No frontmatter found in {filepath}")
-            return None
+            return None, body
 
         # Validate required fields
         required_fields = [
@@ -84,7 +119,7 @@ def parse_trade_file(filepath):
         missing_fields = [f for f in required_fields if f not in frontmatter]
         if missing_fields:
             print(f"Warning: Missing required fields in {filepath}: {missing_fields}")
-            return None
+            return None, body
 
         # Extract notes section from markdown body
         notes = ""
@@ -144,11 +179,11 @@ def parse_trade_file(filepath):
             if field in trade_data and trade_data[field] is not None:
                 trade_data[field] = str(trade_data[field])
 
-        return trade_data
+        return trade_data, body
 
     except Exception as e:
         print(f"Error parsing {filepath}: {e}")
-        return None
+        return None, body
 
 
 def calculate_statistics(trades):
@@ -278,8 +313,9 @@ def main():
         print(f"Found {len(sfti_files)} trade file(s) in index.directory/SFTi.Tradez/")
         trade_files.extend(sfti_files)
 
-    # Remove duplicates
-    trade_files = list(set(trade_files))
+    # Remove duplicates (sorted so the index order is stable between runs)
+    trade_files = sorted(set(trade_files))
+    fresh_cache = {}
 
     if not trade_files:
         print(
@@ -295,13 +331,30 @@ def main():
     else:
         print(f"Found {len(trade_files)} total trade file(s)")
 
-        # Parse all trade files
+        # Parse changed trade files; reuse cached results for the rest
+        cache = load_parse_cache()
         trades = []
+        reused = 0
         for filepath in trade_files:
-            print(f"Parsing {filepath}...")
-            trade_data = parse_trade_file(filepath)
-            if trade_data:
-                trades.append(trade_data)
+            stamp = file_stamp(filepath)
+            entry = cache.get(filepath)
+            if entry and entry.get("stamp") == stamp:
+                reused += 1
+            else:
+                print(f"Parsing {filepath}...")
+                trade_data, body = parse_trade_file_with_body(filepath)
+                entry = {"stamp": stamp, "trade": trade_data, "body": body}
+            fresh_cache[filepath] = entry
+            if entry["trade"]:
+                trades.append(entry["trade"])
+
+        if reused:
+            print(f"Reused {reused} unchanged trade file(s) from the parse cache")
+        save_json_file(
+            PARSE_CACHE_PATH,
+            {"version": PARSE_CACHE_VERSION, "files": fresh_cache},
+            indent=None,
+        )
 
         print(f"Successfully parsed {len(trades)} trade(s)")
 
@@ -324,6 +377,20 @@ def main():
     save_json_file(output_file, output)
 
     print(f"Trade index written to {output_file}")
+
+    # Sync the trade store after the index, so it is at least as new as it
+    try:
+        store = TradeStore()
+        written, removed = store.sync(fresh_cache)
+        store.close()
+        print(f"Trade store {TRADE_STORE_PATH}: {written} written, {removed} removed")
+    except sqlite3.Error as e:
+        print(f"Warning: Could not update trade store: {e}")
+
+    # Write the dense daily series used as the base for time-based outputs
+    daily_series = build_daily_series(output["trades"])
+    save_json_file(DAILY_SERIES_PATH, daily_series)
+    print(f"Daily series written to {DAILY_SERIES_PATH} ({daily_series['days']} day(s))")
     print(f"Total trades: {output['statistics']['total_trades']}")
     print(f"Win rate: {output['statistics']['win_rate']}%")
     print(f"Total P&L: ${output['statistics']['total_pnl']}")
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Date Range Query Index
+Answers stats for arbitrary [from, to] date ranges over the trade timeline
+("last 17 trading days", "since 2025-10-06", ...).
+
+Trades are placed on a timeline in the order they were realized: by
+calendar day (utils.trade_day(), the daily series' bucketing, weekends
+included), then exit time. A date range maps to a contiguous run of that
+timeline with two binary searches.
+
+- Additive columns (P&L, counts, wins, volume, fees) use per-trade prefix
+  sums: O(1) after the O(log n) date lookup
+- Best/worst day use a sparse table of argmax/argmin over the days with
+  trades: O(1)
+- Max drawdown uses a segment tree over the per-trade cumulative P&L
+  curve, so drawdowns inside a day count: O(log n)
+
+Usage:
+    python .github/scripts/range_index.py --from 2025-10-01 --to 2025-10-31
+    python .github/scripts/range_index.py --last 17 --json
+"""
+
+import argparse
+import json
+import sys
+from bisect import bisect_left, bisect_right
+from datetime import date
+
+from globals_utils import setup_imports
+
+# Setup imports
+setup_imports(__file__)
+
+from utils import (
+    DAILY_SERIES_FIELDS,
+    load_trades_index,
+    trade_day,
+    trade_series_values,
+    whole_quantity,
+)
+
+
+def time_of_day_seconds(value):
+    """
+    Seconds after midnight of a trade time, for ordering trades within a day
+
+    Args:
+        value: 'HH:MM' or 'HH:MM:SS' string, or an int of seconds (YAML
+               reads unquoted HH:MM:SS times as base-60 numbers)
+
+    Returns:
+        int: Seconds after midnight (0 if missing or unreadable)
+    """
+    if isinstance(value, int):
+        return value
+    parts = str(value or "").split(":")
+    try:
+        seconds = 0
+        for part in parts[:3]:
+            seconds = seconds * 60 + int(float(part))
+        return seconds * 60 ** (3 - min(len(parts), 3))
+    except ValueError:
+        return 0
+
+
+def build_timeline(trades):
+    """
+    Order trades by the time they were realized
+
+    Args:
+        trades (list): List of trade dictionaries
+
+    Returns:
+        list: (day ordinal, trade) in timeline order; trades without a
+              valid date are left out
+    """
+    timeline = []
+    for position, trade in enumerate(trades):
+        day = trade_day(trade)
+        if day is None:
+            continue
+        moment = time_of_day_seconds(trade.get("exit_time") or trade.get("entry_time"))
+        timeline.append((day.toordinal(), moment, position, trade))
+    timeline.sort(key=lambda item: item[:3])
+    return [(ordinal, trade) for ordinal, _, _, trade in timeline]
+
+
+class DateRangeIndex:
+    """
+    Precomputed range-query structures over the trade timeline.
+    Trade i is the i-th realized trade; day d is the d-th day with trades.
+    """
+
+    def __init__(self, trades):
+        """
+        Args:
+            trades (list): Trades from trades-index.json
+        """
+        timeline = build_timeline(trades)
+
+        # prefix[field][i] = sum of field over trades [0, i)
+        self.prefix = {field: [0] for field in DAILY_SERIES_FIELDS}
+        # Days with trades, the first trade of each, and each day's P&L
+        self.day_ordinals = []
+        self.day_start = []
+        day_pnl = []
+        for i, (ordinal, trade) in enumerate(timeline):
+            values = trade_series_values(trade)
+            for field in DAILY_SERIES_FIELDS:
+                column = self.prefix[field]
+                column.append(column[-1] + values[field])
+            if not self.day_ordinals or self.day_ordinals[-1] != ordinal:
+                self.day_ordinals.append(ordinal)
+                self.day_start.append(i)
+                day_pnl.append(0.0)
+            day_pnl[-1] += values["pnl"]
+        self.trades = len(timeline)
+        self.days = len(self.day_ordinals)
+        # Sentinel: trades of day d are [day_start[d], day_start[d + 1])
+        self.day_start.append(self.trades)
+
+        self._pnl = [round(value, 2) for value in day_pnl]
+        self._best = self._build_sparse_table(self._pnl, lambda a, b: a >= b)
+        self._worst = self._build_sparse_table(self._pnl, lambda a, b: a <= b)
+
+        # Segment tree over the cumulative curve prefix["pnl"][0..trades]
+        self._size = 1
+        while self._size < self.trades + 1:
+            self._size *= 2
+        self._tree = [None] * (2 * self._size)
+        for i, value in enumerate(self.prefix["pnl"]):
+            self._tree[self._size + i] = (value, value, 0.0)
+        for node in range(self._size - 1, 0, -1):
+            self._tree[node] = self._merge(self._tree[2 * node], self._tree[2 * node + 1])
+
+    @staticmethod
+    def _build_sparse_table(values, prefer):
+        """
+        Build a sparse table of winning indices for O(1) range selection
+
+        Args:
+            values (list): Values to select from
+            prefer (callable): prefer(a, b) is True when a should win over b
+
+        Returns:
+            list: table[k][i] = winning index in values[i : i + 2**k]
+        """
+        table = [list(range(len(values)))]
+        span = 1
+        while 2 * span <= len(values):
+            previous = table[-1]
+            level = []
+            for i in range(len(values) - 2 * span + 1):
+                left, right = previous[i], previous[i + span]
+                level.append(left if prefer(values[left], values[right]) else right)
+            table.append(level)
+            span *= 2
+        return table
+
+    def _sparse_query(self, table, prefer, lo, hi):
+        """Winning index in values[lo..hi] (inclusive)"""
+        level = (hi - lo + 1).bit_length() - 1
+        left = table[level][lo]
+        right = table[level][hi - (1 << level) + 1]
+        return left if prefer(self._pnl[left], self._pnl[right]) else right
+
+    @staticmethod
+    def _merge(left, right):
+        """
+        Combine two segment tree nodes of (max, min, max_drop), where
+        max_drop is the largest fall from an earlier point to a later one.
+        """
+        if left is None:
+            return right
+        if right is None:
+            return left
+        return (
+            max(left[0], right[0]),
+            min(left[1], right[1]),
+            max(left[2], right[2], left[0] - right[1]),
+        )
+
+    def _max_drop(self, lo, hi):
+        """Largest peak-to-trough fall over cumulative points [lo..hi]"""
+        left_node, right_node = None, None
+        lo += self._size
+        hi += self._size + 1
+        while lo < hi:
+            if lo & 1:
+                left_node = self._merge(left_node, self._tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                right_node = self._merge(self._tree[hi], right_node)
+            lo //= 2
+            hi //= 2
+        node = self._merge(left_node, right_node)
+        return node[2] if node else 0.0
+
+    def _day_bounds(self, start, end):
+        """
+        Convert a date range to inclusive day offsets
+
+        Returns:
+            tuple: (lo, hi) offsets into the days with trades, or None if
+                   no trade was realized in the range
+        """
+        lo = 0 if start is None else bisect_left(self.day_ordinals, start.toordinal())
+        hi = (
+            self.days - 1
+            if end is None
+            else bisect_right(self.day_ordinals, end.toordinal()) - 1
+        )
+        if lo > hi:
+            return None
+        return lo, hi
+
+    def query(self, start=None, end=None):
+        """
+        Stats for trades closed between start and end (inclusive)
+
+        Args:
+            start (date): First calendar date, or None for the beginning
+            end (date): Last calendar date, or None for the end
+
+        Returns:
+            dict: Range statistics
+        """
+        bounds = self._day_bounds(start, end)
+        if bounds is None:
+            return self._empty_stats(start, end)
+        return self._range_stats(*bounds)
+
+    def last(self, count):
+        """
+        Stats for the last `count` trading days (days with trades)
+
+        Args:
+            count (int): Number of trading days
+
+        Returns:
+            dict: Range statistics
+        """
+        if not self.days or count <= 0:
+            return self._empty_stats(None, None)
+        return self._range_stats(max(self.days - count, 0), self.days - 1)
+
+    def _range_stats(self, lo, hi):
+        """Assemble stats for inclusive day offsets [lo, hi]"""
+        first = self.day_start[lo]
+        stop = self.day_start[hi + 1]
+        totals = {
+            field: self.prefix[field][stop] - self.prefix[field][first]
+            for field in DAILY_SERIES_FIELDS
+        }
+        for field in ("pnl", "gross_win", "gross_loss", "fees"):
+            totals[field] = round(totals[field], 2)
+        totals["volume"] = whole_quantity(round(totals["volume"], 4))
+
+        trade_count = totals["trade_count"]
+        gross_loss = abs(totals["gross_loss"])
+        best = self._sparse_query(self._best, lambda a, b: a >= b, lo, hi)
+        worst = self._sparse_query(self._worst, lambda a, b: a <= b, lo, hi)
+
+        stats = {
+            "from": date.fromordinal(self.day_ordinals[lo]).isoformat(),
+            "to": date.fromordinal(self.day_ordinals[hi]).isoformat(),
+            "trading_days": hi - lo + 1,
+        }
+        stats.update(totals)
+        stats.update(
+            {
+                "win_rate": round(totals["win_count"] / trade_count * 100, 2)
+                if trade_count
+                else 0,
+                "avg_pnl": round(totals["pnl"] / trade_count, 2) if trade_count else 0,
+                "profit_factor": round(totals["gross_win"] / gross_loss, 2)
+                if gross_loss
+                else 0,
+                "best_day": {
+                    "date": date.fromordinal(self.day_ordinals[best]).isoformat(),
+                    "pnl": self._pnl[best],
+                },
+                "worst_day": {
+                    "date": date.fromordinal(self.day_ordinals[worst]).isoformat(),
+                    "pnl": self._pnl[worst],
+                },
+                # Cumulative point `first` is the equity before the range
+                "max_drawdown": round(self._max_drop(first, stop), 2),
+            }
+        )
+        return stats
+
+    @staticmethod
+    def _empty_stats(start, end):
+        """Stats for a range with no trades"""
+        stats = {
+            "from": start.isoformat() if start else None,
+            "to": end.isoformat() if end else None,
+            "trading_days": 0,
+        }
+        stats.update({field: 0 for field in DAILY_SERIES_FIELDS})
+        stats.update(
+            {
+                "win_rate": 0,
+                "avg_pnl": 0,
+                "profit_factor": 0,
+                "best_day": None,
+                "worst_day": None,
+                "max_drawdown": 0,
+            }
+        )
+        return stats
+
+
+def load_range_index():
+    """
+    Build a DateRangeIndex from the trades index
+
+    Returns:
+        DateRangeIndex: Index, or None if no trade data is available
+    """
+    index_data = load_trades_index()
+    if not index_data:
+        return None
+    return DateRangeIndex(index_data.get("trades", []))
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Query trade stats for a date range")
+    parser.add_argument("--from", dest="date_from", help="Start date (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="date_to", help="End date (YYYY-MM-DD)")
+    parser.add_argument("--last", type=int, help="Last N trading days (days with trades)")
+    parser.add_argument("--json", action="store_true", help="Print stats as JSON")
+    args = parser.parse_args()
+
+    try:
+        start = date.fromisoformat(args.date_from) if args.date_from else None
+        end = date.fromisoformat(args.date_to) if args.date_to else None
+    except ValueError:
+        print("Error: Invalid date format (expected YYYY-MM-DD)")
+        sys.exit(1)
+
+    index = load_range_index()
+    if index is None:
+        sys.exit(1)
+
+    stats = index.last(args.last) if args.last else index.query(start, end)
+
+    if args.json:
+        print(json.dumps(stats, indent=2))
+        return
+
+    print("=" * 60)
+    print(f"Range: {stats['from']} to {stats['to']} ({stats['trading_days']} trading days)")
+    print("=" * 60)
+    print(f"Trades:        {stats['trade_count']}")
+    print(f"Total P&L:     ${stats['pnl']:.2f}")
+    print(f"Win Rate:      {stats['win_rate']}%")
+    print(f"Avg P&L:       ${stats['avg_pnl']:.2f}")
+    print(f"Profit Factor: {stats['profit_factor']}")
+    print(f"Max Drawdown:  ${stats['max_drawdown']:.2f}")
+    if stats["best_day"]:
+        print(f"Best Day:      {stats['best_day']['date']} (${stats['best_day']['pnl']:.2f})")
+        print(f"Worst Day:     {stats['worst_day']['date']} (${stats['worst_day']['pnl']:.2f})")
+
+
+if __name__ == "__main__":
+    main()
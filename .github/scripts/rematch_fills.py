@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Rematch Fills Script
+Re-runs lot matching over the stored fills under other lot policies
+
+Every imported execution is kept in the fills store
+(index.directory/.import/executions.sqlite). This script loads those fills
+and matches them into trades in memory with each requested policy. It
+re-parses no CSV and writes no trade files. The result is a per-broker
+comparison of trade count, gross P&L, fees and net P&L, so the effect of
+a different lot policy can be seen before switching to it.
+
+Performance Optimizations:
+- Fills come from one indexed SQLite query per broker
+- Each policy is a single O(n) LotMatcher pass over the loaded fills
+
+Usage:
+    python .github/scripts/rematch_fills.py
+    python .github/scripts/rematch_fills.py --policy lifo --broker ibkr --symbol AAPL
+    python .github/scripts/rematch_fills.py --policy average --output rematched.json
+"""
+
+import argparse
+import sys
+
+from globals_utils import setup_imports, save_json_file
+
+# Setup imports
+setup_imports(__file__)
+from importers import get_importer
+from importers.base_importer import LOT_POLICIES
+from importers.fills_store import FILLS_STORE_PATH, FillsStore
+
+
+def summarize(trades):
+    """
+    Totals of a set of matched trades
+
+    Args:
+        trades (list): Trades from BaseImporter.match_executions()
+
+    Returns:
+        dict: {'trades', 'wins', 'gross', 'fees', 'net'}
+    """
+    net = sum(trade["pnl_usd"] for trade in trades)
+    fees = sum(trade["fees"] for trade in trades)
+    return {
+        "trades": len(trades),
+        "wins": sum(1 for trade in trades if trade["pnl_usd"] > 0),
+        "gross": round(net + fees, 2),
+        "fees": round(fees, 2),
+        "net": round(net, 2),
+    }
+
+
+def main():
+    """Main rematch execution"""
+    parser = argparse.ArgumentParser(
+        description="Re-run lot matching over stored fills"
+    )
+    parser.add_argument(
+        "--policy",
+        nargs="+",
+        choices=LOT_POLICIES,
+        default=list(LOT_POLICIES),
+        help="Lot policies to match with (default: all)",
+    )
+    parser.add_argument("--broker", help="Only this broker's fills")
+    parser.add_argument("--symbol", help="Only this symbol's fills")
+    parser.add_argument("--start", help="Only fills at or after this date (YYYY-MM-DD)")
+    parser.add_argument("--end", help="Only fills before this date (YYYY-MM-DD)")
+    parser.add_argument(
+        "--store", default=FILLS_STORE_PATH, help="Fills store (SQLite file)"
+    )
+    parser.add_argument("--output", help="Write the rematched trades to this JSON file")
+    args = parser.parse_args()
+
+    store = FillsStore(args.store)
+    brokers = [args.broker] if args.broker else store.brokers()
+    results = {}
+
+    print("=" * 70)
+    print("REMATCH STORED FILLS")
+    print("=" * 70)
+    print(f"{'Broker':<12}{'Policy':<10}{'Fills':>8}{'Trades':>8}{'Wins':>6}"
+          f"{'Gross':>12}{'Fees':>10}{'Net':>12}")
+
+    for broker in brokers:
+        fills = store.fills(broker, args.symbol, args.start, args.end)
+        if not fills:
+            continue
+        importer = get_importer(broker)
+        if importer is None:
+            print(f"✗ {broker}: no importer registered")
+            continue
+        imported_policy = importer.lot_policy
+        for policy in args.policy:
+            importer.lot_policy = policy
+            trades = importer.match_executions(fills)
+            results.setdefault(broker, {})[policy] = trades
+            totals = summarize(trades)
+            print(
+                f"{broker:<12}{policy:<10}{len(fills):>8}{totals['trades']:>8}"
+                f"{totals['wins']:>6}{totals['gross']:>12,.2f}{totals['fees']:>10,.2f}"
+                f"{totals['net']:>12,.2f}"
+            )
+        importer.lot_policy = imported_policy
+    store.close()
+
+    if not results:
+        print("No stored fills match (fills are stored by import_csv.py)")
+    print("=" * 70)
+
+    if args.output:
+        if not save_json_file(args.output, results):
+            return 1
+        print(f"Rematched trades written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
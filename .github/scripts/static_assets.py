@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Static Assets
+Publishes the CSS/JS shared by generated pages as content-hashed files
+
+Trade detail pages, all-trades.html and the media validation report used to
+inline the same style blocks, style attributes and scripts in every page.
+Those now live in .github/templates/assets/ and are published as
+index.directory/assets/dist/{stem}.{hash}.{ext}. A changed source gets a new
+file name, so browsers and the service worker can cache them indefinitely.
+
+Performance Optimizations:
+- Each page carries one <link>/<script> reference instead of ~6 KB of styles
+- Hashes are computed once per process (lru_cache)
+- Unchanged assets are not rewritten; superseded versions are removed
+
+Usage:
+    python .github/scripts/static_assets.py --publish
+    python .github/scripts/static_assets.py --size-report
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+from globals_utils import setup_imports
+
+# Setup imports
+setup_imports(__file__)
+
+from utils import CACHE_DIR
+from template_engine import TEMPLATES_DIR
+
+# Asset sources
+ASSETS_DIR = TEMPLATES_DIR / "assets"
+
+# Published assets, and their URL relative to index.directory/
+DIST_DIR = "index.directory/assets/dist"
+DIST_URL = "assets/dist"
+
+# Hex digits of the content hash kept in file names
+HASH_LENGTH = 10
+
+# Generated HTML measured by --size-report
+REPORT_PAGES = [
+    "index.directory/trades/*.html",
+    "index.directory/all-trades.html",
+    "index.directory/media-validation-report.html",
+]
+SIZE_REPORT_PATH = f"{CACHE_DIR}/html-size-report.json"
+
+
+@lru_cache(maxsize=None)
+def _read_asset(name):
+    """Source bytes and published file name of an asset (once per process)"""
+    with open(ASSETS_DIR / name, "rb") as f:
+        content = f.read()
+    stem, ext = os.path.splitext(name)
+    digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+    return content, f"{stem}.{digest}{ext}"
+
+
+def asset_url(name):
+    """
+    URL of a published asset, relative to index.directory/
+
+    Args:
+        name (str): Asset source name, e.g. 'trade-page.css'
+
+    Returns:
+        str: e.g. 'assets/dist/trade-page.3f2a9c1b7e.css'
+    """
+    return f"{DIST_URL}/{_read_asset(name)[1]}"
+
+
+def publish_assets(*names):
+    """
+    Write content-hashed copies of assets and remove superseded versions
+
+    Args:
+        *names (str): Asset source names
+
+    Returns:
+        list: Published file paths
+    """
+    os.makedirs(DIST_DIR, exist_ok=True)
+    published = []
+    for name in names:
+        content, filename = _read_asset(name)
+        path = os.path.join(DIST_DIR, filename)
+        if not os.path.exists(path):
+            with open(path, "wb") as f:
+                f.write(content)
+            print(f"Published asset: {path}")
+
+        # Older hashes of the same asset are no longer referenced
+        stem, ext = os.path.splitext(name)
+        for existing in Path(DIST_DIR).glob(f"{stem}.*{ext}"):
+            old_stem, old_hash = os.path.splitext(existing.stem)
+            if (
+                old_stem == stem
+                and len(old_hash) == HASH_LENGTH + 1
+                and existing.name != filename
+            ):
+                existing.unlink()
+                print(f"Removed superseded asset: {existing}")
+        published.append(path)
+    return published
+
+
+def measure_html_size():
+    """
+    Total size of the generated HTML pages and of the published assets
+
+    Returns:
+        dict: {'pages', 'html_bytes', 'asset_bytes'}
+    """
+    pages = []
+    for pattern in REPORT_PAGES:
+        directory, glob = os.path.split(pattern)
+        pages.extend(p for p in Path(directory).glob(glob) if p.is_file())
+
+    assets = list(Path(DIST_DIR).glob("*.*")) if os.path.isdir(DIST_DIR) else []
+    return {
+        "pages": len(pages),
+        "html_bytes": sum(p.stat().st_size for p in pages),
+        "asset_bytes": sum(p.stat().st_size for p in assets),
+    }
+
+
+def print_size_report():
+    """Print the generated HTML size and its change since the previous report"""
+    current = measure_html_size()
+
+    previous = None
+    if os.path.exists(SIZE_REPORT_PATH):
+        try:
+            with open(SIZE_REPORT_PATH, "r", encoding="utf-8") as f:
+                previous = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            previous = None
+
+    print("=" * 60)
+    print("Generated HTML Size Report")
+    print("=" * 60)
+    print(f"Pages:         {current['pages']}")
+    print(f"HTML total:    {current['html_bytes']:,} bytes")
+    if current["pages"]:
+        print(f"HTML per page: {current['html_bytes'] // current['pages']:,} bytes")
+    print(f"Shared assets: {current['asset_bytes']:,} bytes (cached once)")
+
+    if previous:
+        delta = current["html_bytes"] - previous.get("html_bytes", 0)
+        print(
+            f"Since last report: {previous.get('html_bytes', 0):,} -> "
+            f"{current['html_bytes']:,} bytes ({delta:+,})"
+        )
+
+    os.makedirs(os.path.dirname(SIZE_REPORT_PATH), exist_ok=True)
+    with open(SIZE_REPORT_PATH, "w", encoding="utf-8") as f:
+        json.dump(current, f, indent=2)
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Shared static asset utilities")
+    parser.add_argument(
+        "--publish", action="store_true", help="Publish every asset in templates/assets"
+    )
+    parser.add_argument(
+        "--size-report",
+        action="store_true",
+        help="Report total generated HTML size and the change since the last report",
+    )
+    args = parser.parse_args()
+
+    if not (args.publish or args.size_report):
+        parser.print_help()
+        return 0
+
+    if args.publish:
+        publish_assets(*sorted(p.name for p in ASSETS_DIR.iterdir() if p.is_file()))
+    if args.size_report:
+        print_size_report()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Template Engine
+Precompiled template rendering shared by the HTML and markdown generators
+
+Templates live in .github/templates/ and use the same `{name}` placeholders
+as the existing content templates. Only `{identifier}` is a placeholder, so
+CSS rules and JavaScript object literals in HTML templates need no escaping.
+
+Performance Optimizations:
+- Each template is read and compiled once per process (lru_cache)
+- Compilation splits the source into literal fragments and slot positions
+- Rendering fills the slots in a copy of the fragment list and joins once
+
+Usage:
+    python .github/scripts/template_engine.py --benchmark
+    python .github/scripts/template_engine.py --benchmark --iterations 50
+"""
+
+import argparse
+import hashlib
+import re
+import sys
+import time
+from functools import lru_cache
+from pathlib import Path
+
+# Directory holding the *.template files
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+# {identifier} placeholders; any other brace is literal text
+PLACEHOLDER_PATTERN = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+
+class Template:
+    """
+    A template compiled into literal fragments and named slots
+    """
+
+    def __init__(self, source, name="<string>"):
+        """
+        Args:
+            source (str): Template text with {name} placeholders
+            name (str): Template name used in error messages
+        """
+        self.name = name
+        self.fragments = []
+        self.slots = []
+
+        position = 0
+        for match in PLACEHOLDER_PATTERN.finditer(source):
+            self.fragments.append(source[position : match.start()])
+            self.slots.append((len(self.fragments), match.group(1)))
+            self.fragments.append("")
+            position = match.end()
+        self.fragments.append(source[position:])
+
+        self.placeholders = frozenset(name for _, name in self.slots)
+
+        # Identifies the template version, e.g. for incremental output manifests
+        self.digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+    def render(self, **values):
+        """
+        Fill the template's placeholders
+
+        Args:
+            **values: One value per placeholder (converted with str())
+
+        Returns:
+            str: Rendered text
+
+        Raises:
+            KeyError: If a placeholder has no value
+        """
+        parts = self.fragments[:]
+        try:
+            for index, name in self.slots:
+                parts[index] = str(values[name])
+        except KeyError as e:
+            raise KeyError(f"{self.name}: no value for placeholder {e}") from None
+        return "".join(parts)
+
+
+@lru_cache(maxsize=None)
+def load_template(name, strip_frontmatter=False):
+    """
+    Load and compile a template from .github/templates/ (once per process)
+
+    Args:
+        name (str): Template file name, e.g. 'trade-page.html.template'
+        strip_frontmatter (bool): Compile only the text after the YAML
+                                  frontmatter block
+
+    Returns:
+        Template: Compiled template
+    """
+    with open(TEMPLATES_DIR / name, "r", encoding="utf-8") as f:
+        source = f.read()
+
+    if strip_frontmatter and source.startswith("---"):
+        closing = source.find("\n---", 3)
+        if closing != -1:
+            source = source[closing + len("\n---") :]
+
+    return Template(source, name)
+
+
+def render_template(name, **values):
+    """
+    Render a template from .github/templates/
+
+    Args:
+        name (str): Template file name
+        **values: Placeholder values
+
+    Returns:
+        str: Rendered text
+    """
+    return load_template(name).render(**values)
+
+
+def _sample_trades():
+    """Trades for the benchmark: the real index if present, else a synthetic set"""
+    from utils import load_trades_index
+
+    index_data = load_trades_index()
+    trades = index_data.get("trades", []) if index_data else []
+    if trades:
+        return trades
+
+    return [
+        {
+            "trade_number": i,
+            "ticker": "DEMO",
+            "entry_date": "2025-01-02",
+            "entry_time": "09:30",
+            "exit_date": "2025-01-02",
+            "exit_time": "10:15",
+            "entry_price": 1.25,
+            "exit_price": 1.40,
+            "position_size": 1000,
+            "direction": "LONG",
+            "strategy": "Breakout",
+            "pnl_usd": 150.0,
+            "pnl_percent": 12.0,
+            "notes": "Synthetic benchmark trade",
+        }
+        for i in range(1, 51)
+    ]
+
+
+def run_benchmark(iterations):
+    """
+    Measure render throughput of the template-backed generators
+
+    Args:
+        iterations (int): Passes over the sample trades per generator
+
+    Returns:
+        dict: {generator name: pages per second}
+    """
+    from generate_trade_pages import generate_trade_html
+    from generate_summaries import generate_summary_markdown
+    from generate_week_summaries import calculate_week_stats, generate_master_markdown
+    from utils import calculate_period_stats
+
+    trades = _sample_trades()
+    period_stats = calculate_period_stats(trades)
+    week_stats = calculate_week_stats(trades)
+
+    # Warm the template cache so compilation is not part of the measurement
+    generate_trade_html(trades[0])
+
+    cases = {
+        "trade pages": (lambda: [generate_trade_html(t) for t in trades], len(trades)),
+        "period summaries": (
+            lambda: generate_summary_markdown("2025-W01", period_stats, "week"),
+            1,
+        ),
+        "week master files": (
+            lambda: generate_master_markdown("2025.01", week_stats, trades),
+            1,
+        ),
+    }
+
+    results = {}
+    for label, (render, pages) in cases.items():
+        start = time.perf_counter()
+        for _ in range(iterations):
+            render()
+        elapsed = time.perf_counter() - start
+        results[label] = pages * iterations / elapsed if elapsed > 0 else float("inf")
+    return results
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Template engine utilities")
+    parser.add_argument(
+        "--benchmark", action="store_true", help="Report render throughput in pages/sec"
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=20, help="Benchmark passes (default: 20)"
+    )
+    args = parser.parse_args()
+
+    if not args.benchmark:
+        parser.print_help()
+        return 0
+
+    print("=" * 60)
+    print("Template Render Benchmark")
+    print("=" * 60)
+    for label, rate in run_benchmark(args.iterations).items():
+        print(f"{label:<20} {rate:>12,.0f} pages/sec")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
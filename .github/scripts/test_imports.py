@@ -78,7 +78,10 @@ def test_importers_package():
         import importers
         
         # Check registry functions
-        required_attrs = ['BROKER_REGISTRY', 'register_broker', 'get_importer', 'list_brokers']
+        required_attrs = [
+            'BROKER_REGISTRY', 'register_broker', 'get_importer', 'list_brokers',
+            'detect_brokers'
+        ]
         
         for attr in required_attrs:
             if not hasattr(importers, attr):
@@ -107,7 +110,8 @@ def test_base_importer():
         from importers.base_importer import BaseImporter
         
         required_methods = [
-            'detect_format', 'parse_csv', 'validate_trade',
+            'detect_format', 'score_header', 'iter_transactions', 'parse_csv', 'parse_lines',
+            'parse_file', 'load_transactions', 'match_executions', 'validate_trade',
             'get_broker_name', 'get_supported_formats', 'get_sample_mapping'
         ]
         
@@ -148,8 +152,21 @@ def main():
         'normalize_schema.py',
         'attach_media.py',
         'navbar_template.py',
+        'range_index.py',
+        'template_engine.py',
+        'static_assets.py',
+        'generate_search_index.py',
+        'compact_index.py',
+        'test_lot_matching.py',
+        'test_range_index.py',
+        'benchmark_imports.py',
+        'rematch_fills.py',
+        'trade_store.py',
         'importers/__init__.py',
         'importers/base_importer.py',
+        'importers/dedupe_index.py',
+        'importers/fills_store.py',
+        'importers/mapped_importer.py',
         'importers/ibkr.py',
         'importers/schwab.py',
         'importers/robinhood.py',
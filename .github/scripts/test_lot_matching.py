@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Test Lot Matching Script
+Property tests for the LotMatcher engine in importers/base_importer.py
+
+Random execution sequences (partial fills, scale-ins, flips through zero,
+short-first) are replayed under every lot policy and checked for:
+- Quantity conservation: every share bought or sold is either in a closed
+  piece or still in an open lot, on the right side
+- Commission conservation: piece commissions plus open-lot commissions equal
+  the commissions paid
+- Realized P&L of a flat book does not depend on the lot policy
+- Pieces never exit before they enter
+- Matching time grows roughly linearly with the number of executions
+
+Usage:
+    python .github/scripts/test_lot_matching.py
+    python .github/scripts/test_lot_matching.py --cases 500 --seed 7
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+from globals_utils import setup_imports
+
+# Setup imports
+setup_imports(__file__)
+from importers.base_importer import LOT_POLICIES, LotMatcher
+
+# Tolerance for float sums over fractional quantities
+TOLERANCE = 1e-6
+
+SYMBOLS = ["AAA", "BBB", "CCC"]
+
+
+def random_executions(rng, count, flatten=False):
+    """
+    Random chronological executions over a few symbols
+
+    Args:
+        rng (random.Random): Random source
+        count (int): Number of executions
+        flatten (bool): Append executions that close every position
+
+    Returns:
+        list: Execution dicts in time order
+    """
+    start = datetime(2025, 1, 2, 9, 30)
+    executions = []
+    net = {symbol: 0.0 for symbol in SYMBOLS}
+    for i in range(count):
+        symbol = rng.choice(SYMBOLS)
+        quantity = rng.choice([1, 5, 10, 50, 100, 250]) * rng.choice([1, 1, 1, 0.5])
+        direction = rng.choice(["BUY", "SELL"])
+        net[symbol] += quantity if direction == "BUY" else -quantity
+        executions.append(
+            {
+                "symbol": symbol,
+                "datetime": start + timedelta(seconds=i),
+                "quantity": quantity,
+                "price": round(rng.uniform(1, 20), 4),
+                "direction": direction,
+                "commission": round(rng.choice([0, 0, 1, 0.35 * quantity / 100]), 4),
+            }
+        )
+    if flatten:
+        for offset, (symbol, position) in enumerate(net.items(), 1):
+            if abs(position) > TOLERANCE:
+                executions.append(
+                    {
+                        "symbol": symbol,
+                        "datetime": start + timedelta(seconds=count + offset),
+                        "quantity": abs(position),
+                        "price": round(rng.uniform(1, 20), 4),
+                        "direction": "SELL" if position > 0 else "BUY",
+                        "commission": 0.0,
+                    }
+                )
+    return executions
+
+
+def replay(executions, policy):
+    """Run executions through a LotMatcher; returns (pieces, open lots)"""
+    matcher = LotMatcher(policy)
+    pieces = []
+    for execution in executions:
+        pieces.extend(matcher.add(execution))
+    return pieces, matcher.open_lots()
+
+
+def check_conservation(executions, pieces, open_lots):
+    """
+    Quantity and commission conservation per symbol and side
+
+    Returns:
+        str: Failure description, or '' if the properties hold
+    """
+    for symbol in SYMBOLS:
+        fills = [e for e in executions if e["symbol"] == symbol]
+        bought = sum(e["quantity"] for e in fills if e["direction"] == "BUY")
+        sold = sum(e["quantity"] for e in fills if e["direction"] == "SELL")
+        closed = sum(p["quantity"] for p in pieces if p["symbol"] == symbol)
+        lots = open_lots.get(symbol, [])
+        open_long = sum(lot["quantity"] for lot in lots if lot["side"] == 1)
+        open_short = sum(lot["quantity"] for lot in lots if lot["side"] == -1)
+
+        # Every closed share was bought once and sold once (long or short)
+        if abs(bought - (closed + open_long)) > TOLERANCE:
+            return f"{symbol}: bought {bought} != closed {closed} + open long {open_long}"
+        if abs(sold - (closed + open_short)) > TOLERANCE:
+            return f"{symbol}: sold {sold} != closed {closed} + open short {open_short}"
+        if open_long > TOLERANCE and open_short > TOLERANCE:
+            return f"{symbol}: long and short lots open at once"
+
+    paid = sum(e["commission"] for e in executions)
+    allocated = sum(p["commission"] for p in pieces) + sum(
+        lot["commission"] for lots in open_lots.values() for lot in lots
+    )
+    if abs(paid - allocated) > TOLERANCE:
+        return f"commission paid {paid} != allocated {allocated}"
+
+    for piece in pieces:
+        if piece["exit_datetime"] < piece["entry_datetime"]:
+            return f"{piece['symbol']}: piece exits before it enters"
+    return ""
+
+
+def realized_pnl(pieces):
+    """Gross realized P&L of closed pieces"""
+    return sum(
+        (p["exit_price"] - p["entry_price"]) * p["quantity"] * p["side"] for p in pieces
+    )
+
+
+def check_conservation_properties(cases, seed):
+    """Conservation properties for every policy"""
+    rng = random.Random(seed)
+    for case in range(cases):
+        executions = random_executions(rng, rng.randint(1, 60))
+        for policy in LOT_POLICIES:
+            pieces, open_lots = replay(executions, policy)
+            failure = check_conservation(executions, pieces, open_lots)
+            if failure:
+                return False, f"case {case} ({policy}): {failure}"
+    return True, f"{cases} random sequences conserve quantity and commission"
+
+
+def check_policy_independence(cases, seed):
+    """A book that ends flat realizes the same P&L under every policy"""
+    rng = random.Random(seed + 1)
+    for case in range(cases):
+        executions = random_executions(rng, rng.randint(1, 60), flatten=True)
+        expected = sum(
+            e["quantity"] * e["price"] * (1 if e["direction"] == "SELL" else -1)
+            for e in executions
+        )
+        for policy in LOT_POLICIES:
+            pieces, open_lots = replay(executions, policy)
+            if open_lots:
+                return False, f"case {case} ({policy}): book not flat"
+            realized = realized_pnl(pieces)
+            if abs(realized - expected) > 1e-4:
+                return False, f"case {case} ({policy}): P&L {realized} != {expected}"
+    policies = ", ".join(LOT_POLICIES)
+    return True, f"{cases} flat books realize the same P&L under {policies}"
+
+
+def check_known_sequences():
+    """Hand-checked partial fill, scale-in, flip and short-first sequences"""
+    t = [datetime(2025, 1, 2, 9, 30 + i) for i in range(6)]
+
+    def execution(i, direction, quantity, price, commission=0.0):
+        return {
+            "symbol": "XYZ",
+            "datetime": t[i],
+            "quantity": quantity,
+            "price": price,
+            "direction": direction,
+            "commission": commission,
+        }
+
+    # Scale in 100 + 100, partial exit 150, flip with a 150 sell
+    sequence = [
+        execution(0, "BUY", 100, 1.00, 1.0),
+        execution(1, "BUY", 100, 2.00),
+        execution(2, "SELL", 150, 3.00, 3.0),
+        execution(3, "SELL", 150, 4.00),
+    ]
+    pieces, open_lots = replay(sequence, "fifo")
+    got = [(p["side"], p["quantity"], p["entry_price"], p["exit_price"]) for p in pieces]
+    expected = [(1, 100, 1.0, 3.0), (1, 50, 2.0, 3.0), (1, 50, 2.0, 4.0)]
+    if got != expected:
+        return False, f"fifo scale-in/flip: {got} != {expected}"
+    if [(lot["side"], lot["quantity"]) for lot in open_lots["XYZ"]] != [(-1, 100)]:
+        return False, f"fifo flip left {open_lots}"
+    if abs(pieces[0]["commission"] - 3.0) > TOLERANCE:
+        return False, f"pro-rata commission {pieces[0]['commission']} != 3.0"
+
+    pieces, _ = replay(sequence, "lifo")
+    got = [(p["quantity"], p["entry_price"]) for p in pieces]
+    if got != [(100, 2.0), (50, 1.0), (50, 1.0)]:
+        return False, f"lifo scale-in: {got}"
+
+    pieces, _ = replay(sequence, "average")
+    if [(p["quantity"], p["entry_price"]) for p in pieces] != [(150, 1.5), (50, 1.5)]:
+        return False, f"average cost: {pieces}"
+
+    # Short first, covered in two fills
+    sequence = [
+        execution(0, "SELL", 200, 5.00),
+        execution(1, "BUY", 50, 4.00),
+        execution(2, "BUY", 150, 4.50),
+    ]
+    pieces, open_lots = replay(sequence, "fifo")
+    got = [(p["side"], p["quantity"], p["exit_price"]) for p in pieces]
+    if got != [(-1, 50, 4.0), (-1, 150, 4.5)] or open_lots:
+        return False, f"short-first: {got}, open {open_lots}"
+
+    return True, "Partial fills, scale-ins, flips and shorts match as expected"
+
+
+def check_scaling(seed):
+    """Matching time grows roughly linearly (O(n) after the sort)"""
+    rng = random.Random(seed + 2)
+    timings = []
+    for count in (20000, 80000):
+        executions = random_executions(rng, count)
+        start = time.perf_counter()
+        replay(executions, "fifo")
+        timings.append(time.perf_counter() - start)
+    ratio = timings[1] / timings[0] if timings[0] > 0 else 0
+    # 4x the executions; quadratic matching would be ~16x
+    if ratio > 8:
+        return False, f"4x executions took {ratio:.1f}x as long"
+    return True, f"4x executions took {ratio:.1f}x as long ({timings[1]:.2f}s for 80k)"
+
+
+def main():
+    """Main test execution"""
+    parser = argparse.ArgumentParser(description="Property tests for lot matching")
+    parser.add_argument(
+        "--cases", type=int, default=200, help="Random sequences per test (default: 200)"
+    )
+    parser.add_argument("--seed", type=int, default=2025, help="Random seed")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("LOT MATCHING PROPERTY TESTS")
+    print("=" * 70)
+
+    tests = [
+        ("Known sequences", check_known_sequences),
+        ("Conservation", lambda: check_conservation_properties(args.cases, args.seed)),
+        ("Policy independence", lambda: check_policy_independence(args.cases, args.seed)),
+        ("Scaling", lambda: check_scaling(args.seed)),
+    ]
+
+    failures = []
+    for label, test in tests:
+        success, message = test()
+        status = "✓" if success else "✗"
+        print(f"{status} {label}: {message}")
+        if not success:
+            failures.append(f"{label}: {message}")
+
+    print("=" * 70)
+    if failures:
+        print(f"Failed tests: {len(failures)}")
+        sys.exit(1)
+    print("✓✓✓ ALL TESTS PASSED! ✓✓✓")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Test Range Index Script
+Equivalence tests for the DateRangeIndex in range_index.py
+
+Random trade histories (weekend trades, several trades a day, swing
+trades, missing exit dates) are queried over random date ranges. Every
+answer is compared with a brute-force scan of the trades in the range:
+- Totals (P&L, gross win/loss, counts, volume, fees) and trading days
+- First/last day, best and worst day
+- Max drawdown of the trade-by-trade equity curve inside the range
+- last(n) matches the same scan over the last n days with trades
+
+Usage:
+    python .github/scripts/test_range_index.py
+    python .github/scripts/test_range_index.py --cases 500 --seed 7
+"""
+
+import argparse
+import random
+import sys
+from datetime import date, timedelta
+
+from globals_utils import setup_imports
+
+# Setup imports
+setup_imports(__file__)
+from range_index import DateRangeIndex, time_of_day_seconds
+
+# Tolerance for float sums
+TOLERANCE = 0.011
+
+# First day of the random histories (a Friday at a month end)
+ORIGIN = date(2025, 1, 31)
+
+# Days covered by the random histories
+SPAN = 45
+
+
+def random_trades(rng, count):
+    """
+    Random trades over SPAN calendar days, weekends included
+
+    Args:
+        rng (random.Random): Random source
+        count (int): Number of trades
+
+    Returns:
+        list: Trade dicts (unique exit times, so the timeline order is fixed)
+    """
+    trades = []
+    moments = rng.sample(range(SPAN * 86400), count)
+    for number, moment in enumerate(moments, 1):
+        exit_day = ORIGIN + timedelta(days=moment // 86400)
+        seconds = moment % 86400
+        entry_day = exit_day - timedelta(days=rng.choice([0, 0, 0, 1, 3]))
+        trade = {
+            "trade_number": number,
+            "ticker": rng.choice(["AAA", "BBB"]),
+            "entry_date": entry_day.isoformat(),
+            "exit_date": exit_day.isoformat(),
+            "exit_time": f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}",
+            "pnl_usd": rng.choice([0, round(rng.uniform(-300, 300), 2)]),
+            "position_size": rng.choice([10, 100, 250]),
+            "fees": rng.choice([0, 1.0, 0.35]),
+        }
+        if rng.random() < 0.1:
+            # No exit recorded: realized on the entry date, ordered by entry time
+            trade["entry_date"] = trade.pop("exit_date")
+            trade["entry_time"] = trade.pop("exit_time")
+        trades.append(trade)
+    rng.shuffle(trades)
+    return trades
+
+
+def realized(trade):
+    """(day, time) a trade is realized at, read the way a person would"""
+    day = date.fromisoformat(trade.get("exit_date") or trade["entry_date"])
+    return day, trade.get("exit_time") or trade.get("entry_time")
+
+
+def brute_force(trades):
+    """
+    Range stats by scanning the given trades
+
+    Args:
+        trades (list): Trades in the range
+
+    Returns:
+        dict: Expected stats (same keys DateRangeIndex returns)
+    """
+    trades = sorted(trades, key=realized)
+    days = {}
+    equity = peak = drawdown = 0.0
+    for trade in trades:
+        pnl = trade["pnl_usd"]
+        day = realized(trade)[0]
+        days[day] = days.get(day, 0.0) + pnl
+        equity += pnl
+        peak = max(peak, equity)
+        drawdown = max(drawdown, peak - equity)
+    if not trades:
+        return {"trade_count": 0, "trading_days": 0}
+
+    day_pnl = {day: round(pnl, 2) for day, pnl in days.items()}
+    ordered = sorted(day_pnl)
+    best = max(ordered, key=lambda day: (day_pnl[day], -day.toordinal()))
+    worst = min(ordered, key=lambda day: (day_pnl[day], day.toordinal()))
+    pnls = [trade["pnl_usd"] for trade in trades]
+    return {
+        "from": ordered[0].isoformat(),
+        "to": ordered[-1].isoformat(),
+        "trading_days": len(ordered),
+        "pnl": sum(pnls),
+        "gross_win": sum(pnl for pnl in pnls if pnl > 0),
+        "gross_loss": sum(pnl for pnl in pnls if pnl < 0),
+        "trade_count": len(trades),
+        "win_count": sum(1 for pnl in pnls if pnl > 0),
+        "loss_count": sum(1 for pnl in pnls if pnl < 0),
+        "volume": sum(trade["position_size"] for trade in trades),
+        "fees": sum(trade["fees"] for trade in trades),
+        "best_day": {"date": best.isoformat(), "pnl": day_pnl[best]},
+        "worst_day": {"date": worst.isoformat(), "pnl": day_pnl[worst]},
+        "max_drawdown": drawdown,
+    }
+
+
+def compare(got, expected):
+    """
+    Differences between index stats and brute-force stats
+
+    Returns:
+        str: Failure description, or '' if they agree
+    """
+    for field, value in expected.items():
+        actual = got.get(field)
+        if isinstance(value, float):
+            if abs(actual - value) > TOLERANCE:
+                return f"{field}: {actual} != {value}"
+        elif actual != value:
+            return f"{field}: {actual} != {value}"
+    return ""
+
+
+def random_bound(rng):
+    """A random range bound around the history, or None (open)"""
+    if rng.random() < 0.1:
+        return None
+    return ORIGIN + timedelta(days=rng.randint(-3, SPAN + 3))
+
+
+def check_random_ranges(cases, seed):
+    """query(start, end) matches a brute-force scan for random ranges"""
+    rng = random.Random(seed)
+    queries = 0
+    for case in range(cases):
+        trades = random_trades(rng, rng.randint(0, 80))
+        index = DateRangeIndex(trades)
+        for _ in range(10):
+            start, end = random_bound(rng), random_bound(rng)
+            in_range = [
+                trade
+                for trade in trades
+                if (start is None or realized(trade)[0] >= start)
+                and (end is None or realized(trade)[0] <= end)
+            ]
+            failure = compare(index.query(start, end), brute_force(in_range))
+            if failure:
+                return False, f"case {case} [{start}, {end}]: {failure}"
+            queries += 1
+    return True, f"{queries} random ranges match a brute-force scan"
+
+
+def check_last_days(cases, seed):
+    """last(n) covers the last n days with trades"""
+    rng = random.Random(seed + 1)
+    for case in range(cases):
+        trades = random_trades(rng, rng.randint(1, 60))
+        index = DateRangeIndex(trades)
+        days = sorted({realized(trade)[0] for trade in trades})
+        count = rng.randint(1, len(days) + 2)
+        first = days[max(len(days) - count, 0)]
+        in_range = [trade for trade in trades if realized(trade)[0] >= first]
+        failure = compare(index.last(count), brute_force(in_range))
+        if failure:
+            return False, f"case {case} last({count}): {failure}"
+    return True, f"{cases} random last(n) queries match a brute-force scan"
+
+
+def check_known_ranges():
+    """Hand-checked weekend, intraday drawdown and time ordering cases"""
+    trades = [
+        {"exit_date": "2025-02-28", "exit_time": "10:00:00", "pnl_usd": 40.0},
+        # Saturday trade: its own day, not folded onto Friday
+        {"exit_date": "2025-03-01", "exit_time": "09:30:00", "pnl_usd": -10.0},
+        # Monday: +100, -300, +250 closes up 50 with a 300 intraday drawdown
+        {"exit_date": "2025-03-03", "exit_time": "15:00:00", "pnl_usd": 250.0},
+        {"exit_date": "2025-03-03", "exit_time": 34200, "pnl_usd": 100.0},
+        {"exit_date": "2025-03-03", "exit_time": "10:15", "pnl_usd": -300.0},
+    ]
+    index = DateRangeIndex(trades)
+
+    saturday = date(2025, 3, 1)
+    stats = index.query(saturday, saturday)
+    if (stats["trade_count"], stats["pnl"]) != (1, -10.0):
+        return False, f"Saturday-only range: {stats}"
+    stats = index.query(saturday, date(2025, 3, 2))
+    if (stats["trade_count"], stats["from"], stats["to"]) != (1, "2025-03-01", "2025-03-01"):
+        return False, f"weekend range: {stats}"
+    stats = index.query(date(2025, 2, 28), date(2025, 2, 28))
+    if stats["trade_count"] != 1 or stats["pnl"] != 40.0:
+        return False, f"Friday-only range: {stats}"
+    if index.query(date(2025, 3, 2), date(2025, 3, 2))["trade_count"]:
+        return False, "Sunday without trades is not empty"
+
+    stats = index.query(date(2025, 3, 3), date(2025, 3, 3))
+    if stats["pnl"] != 50.0 or stats["max_drawdown"] != 300.0:
+        return False, f"intraday drawdown: {stats}"
+
+    if index.last(2)["from"] != "2025-03-01" or index.last(2)["trading_days"] != 2:
+        return False, f"last(2): {index.last(2)}"
+
+    for value, seconds in (("09:30", 34200), ("09:30:15", 34215), (34200, 34200), (None, 0)):
+        if time_of_day_seconds(value) != seconds:
+            return False, f"time_of_day_seconds({value!r}) != {seconds}"
+
+    return True, "Weekend days, intraday drawdown and time ordering as expected"
+
+
+def main():
+    """Main test execution"""
+    parser = argparse.ArgumentParser(description="Equivalence tests for the range index")
+    parser.add_argument(
+        "--cases", type=int, default=200, help="Random histories per test (default: 200)"
+    )
+    parser.add_argument("--seed", type=int, default=2025, help="Random seed")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("RANGE INDEX EQUIVALENCE TESTS")
+    print("=" * 70)
+
+    tests = [
+        ("Known ranges", check_known_ranges),
+        ("Random ranges", lambda: check_random_ranges(args.cases, args.seed)),
+        ("Last n days", lambda: check_last_days(args.cases, args.seed)),
+    ]
+
+    failures = []
+    for label, test in tests:
+        success, message = test()
+        status = "✓" if success else "✗"
+        print(f"{status} {label}: {message}")
+        if not success:
+            failures.append(f"{label}: {message}")
+
+    print("=" * 70)
+    if failures:
+        print(f"Failed tests: {len(failures)}")
+        sys.exit(1)
+    print("✓✓✓ ALL TESTS PASSED! ✓✓✓")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
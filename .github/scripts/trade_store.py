@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Trade Store
+SQLite copy of the parsed trades, indexed for filtered queries
+
+parse_trades.py keeps the store in step with its parse cache: each row
+remembers the stamp of the trade file it came from, so only files whose
+stamp changed are rewritten and files that disappeared are deleted.
+Consumers that need a subset of trades (export_csv.py) query it instead
+of loading and scanning trades-index.json.
+
+Tables:
+- trades: one row per trade file, with the filterable columns and the
+  full trade as JSON (exactly what trades-index.json holds)
+- tags / trade_tags: tag names per kind (strategy_tags, setup_tags, ...)
+  and the trades carrying them (many-to-many)
+- trade_fills: fill ids a trade was matched from (see importers/fills_store.py)
+
+Performance Optimizations:
+- Indexes on entry date, ticker, strategy and tag name, so every filter is
+  an index range scan
+- Incremental sync: unchanged trade files cost one stamp comparison
+- query() yields trades one at a time from the cursor
+
+Usage:
+    from trade_store import TradeStore
+
+    store = TradeStore()
+    for trade in store.query(ticker="AAPL", date_from="2025-01-01"):
+        ...
+"""
+
+import json
+import os
+import sqlite3
+from datetime import datetime
+from typing import Dict, Iterator, Optional
+
+from utils import CACHE_DIR
+
+TRADE_STORE_PATH = f"{CACHE_DIR}/trades.sqlite"
+
+# Bump when the schema changes; stores from another version are rebuilt
+TRADE_STORE_VERSION = 1
+
+# Trade fields holding lists of tag names
+TAG_FIELDS = ("strategy_tags", "setup_tags", "session_tags", "market_condition_tags")
+
+# Trade fields holding fill ids, and the role stored for each
+FILL_FIELDS = (("entry_fills", "entry"), ("exit_fills", "exit"))
+
+# P&L sign filters for query(pnl=...)
+PNL_CONDITIONS = {
+    "positive": "pnl_usd > 0",
+    "negative": "pnl_usd < 0",
+    "zero": "pnl_usd = 0",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trades (
+    id INTEGER PRIMARY KEY,
+    file_path TEXT NOT NULL UNIQUE,
+    stamp TEXT NOT NULL,
+    trade_number INTEGER NOT NULL,
+    ticker TEXT,
+    entry_date TEXT,
+    broker TEXT,
+    strategy TEXT,
+    pnl_usd REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS trades_entry_date ON trades (entry_date);
+CREATE INDEX IF NOT EXISTS trades_ticker ON trades (ticker COLLATE NOCASE, entry_date);
+CREATE INDEX IF NOT EXISTS trades_strategy ON trades (strategy COLLATE NOCASE);
+CREATE TABLE IF NOT EXISTS tags (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    UNIQUE (kind, name)
+);
+CREATE INDEX IF NOT EXISTS tags_name ON tags (name COLLATE NOCASE);
+CREATE TABLE IF NOT EXISTS trade_tags (
+    tag_id INTEGER NOT NULL REFERENCES tags (id),
+    trade_id INTEGER NOT NULL REFERENCES trades (id) ON DELETE CASCADE,
+    PRIMARY KEY (tag_id, trade_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS trade_tags_trade ON trade_tags (trade_id);
+CREATE TABLE IF NOT EXISTS trade_fills (
+    fill_id TEXT NOT NULL,
+    trade_id INTEGER NOT NULL REFERENCES trades (id) ON DELETE CASCADE,
+    role TEXT NOT NULL,
+    PRIMARY KEY (fill_id, trade_id, role)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS trade_fills_trade ON trade_fills (trade_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _iso_date(value) -> Optional[str]:
+    """
+    A trade date as YYYY-MM-DD, or None if it is missing or not a date
+
+    Dates are normalized once when stored, so range filters compare
+    strings instead of parsing every trade's date on every query.
+    """
+    if not value:
+        return None
+    try:
+        return datetime.strptime(str(value), "%Y-%m-%d").date().isoformat()
+    except ValueError:
+        return None
+
+
+def _names(value) -> list:
+    """Tag or fill names from a trade field (list or single string)"""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = [value]
+    return [str(name) for name in value if name not in (None, "")]
+
+
+def _number(value) -> Optional[float]:
+    """A numeric trade field as float, or None"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class TradeStore:
+    """
+    SQLite store of parsed trades with tag and fill links
+    """
+
+    def __init__(self, path: str = TRADE_STORE_PATH):
+        """
+        Args:
+            path (str): SQLite database file (created if missing), or ':memory:'
+        """
+        if path != ":memory:":
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != TRADE_STORE_VERSION:
+            # Derived data: drop an older layout and rebuild on the next sync
+            with self.connection:
+                for table in ("trade_fills", "trade_tags", "tags", "trades", "meta"):
+                    self.connection.execute(f"DROP TABLE IF EXISTS {table}")
+            self.connection.execute(f"PRAGMA user_version = {TRADE_STORE_VERSION}")
+        self.connection.executescript(_SCHEMA)
+
+    def sync(self, entries: Dict[str, Dict]) -> tuple:
+        """
+        Bring the store in line with the parsed trade files
+
+        Args:
+            entries (Dict[str, Dict]): Trade file path -> {'stamp', 'trade'},
+                as in the parse cache; files without a trade are left out
+
+        Returns:
+            tuple: (trades written, trades removed)
+        """
+        stored = dict(self.connection.execute("SELECT file_path, stamp FROM trades"))
+        written = 0
+        with self.connection:
+            removed = [
+                path
+                for path in stored
+                if path not in entries or not entries[path].get("trade")
+            ]
+            self.connection.executemany(
+                "DELETE FROM trades WHERE file_path = ?", ((path,) for path in removed)
+            )
+            for path, entry in entries.items():
+                trade = entry.get("trade")
+                if not trade:
+                    continue
+                stamp = json.dumps(entry.get("stamp"))
+                if stored.get(path) == stamp:
+                    continue
+                if path in stored:
+                    self.connection.execute("DELETE FROM trades WHERE file_path = ?", (path,))
+                self._insert(path, stamp, trade)
+                written += 1
+            if removed or written:
+                # Drop tags no trade carries any more
+                self.connection.execute(
+                    "DELETE FROM tags WHERE id NOT IN (SELECT tag_id FROM trade_tags)"
+                )
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('synced_at', ?)",
+                    (datetime.now().isoformat(),),
+                )
+        if not (written or removed) and self.path != ":memory:":
+            # Unchanged content: only mark the store as current (see open_trade_store)
+            os.utime(self.path)
+        return written, len(removed)
+
+    def _insert(self, path: str, stamp: str, trade: Dict):
+        """Insert one trade with its tag and fill links"""
+        strategy = trade.get("strategy")
+        cursor = self.connection.execute(
+            "INSERT INTO trades"
+            " (file_path, stamp, trade_number, ticker, entry_date, broker, strategy, pnl_usd, data)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                path,
+                stamp,
+                trade.get("trade_number") or 0,
+                trade.get("ticker"),
+                _iso_date(trade.get("entry_date")),
+                trade.get("broker"),
+                "" if strategy is None else str(strategy),
+                _number(trade.get("pnl_usd")),
+                json.dumps(trade),
+            ),
+        )
+        trade_id = cursor.lastrowid
+        for kind in TAG_FIELDS:
+            for name in _names(trade.get(kind)):
+                self.connection.execute(
+                    "INSERT OR IGNORE INTO tags (kind, name) VALUES (?, ?)", (kind, name)
+                )
+                self.connection.execute(
+                    "INSERT OR IGNORE INTO trade_tags"
+                    " SELECT id, ? FROM tags WHERE kind = ? AND name = ?",
+                    (trade_id, kind, name),
+                )
+        for field, role in FILL_FIELDS:
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO trade_fills VALUES (?, ?, ?)",
+                ((fill, trade_id, role) for fill in _names(trade.get(field))),
+            )
+
+    def query(
+        self,
+        strategy: str = None,
+        ticker: str = None,
+        broker: str = None,
+        tag: str = None,
+        date_from: str = None,
+        date_to: str = None,
+        pnl: str = None,
+    ) -> Iterator[Dict]:
+        """
+        Trades matching every given filter, in trades-index.json order
+
+        Text filters are case-insensitive; dates are inclusive YYYY-MM-DD
+        bounds on the entry date (trades without a valid entry date are
+        left out when either bound is given).
+
+        Args:
+            strategy (str): Strategy name
+            ticker (str): Ticker symbol
+            broker (str): Broker name
+            tag (str): Tag name of any kind (strategy, setup, session, market)
+            date_from (str): First entry date
+            date_to (str): Last entry date
+            pnl (str): P&L sign, one of PNL_CONDITIONS
+
+        Yields:
+            Dict: Trade as stored in trades-index.json
+        """
+        conditions = []
+        values = []
+        for column, value in (("strategy", strategy), ("ticker", ticker), ("broker", broker)):
+            if value is not None:
+                conditions.append(f"{column} = ? COLLATE NOCASE")
+                values.append(value)
+        if tag is not None:
+            conditions.append(
+                "id IN (SELECT trade_id FROM trade_tags JOIN tags ON tags.id = tag_id"
+                " WHERE tags.name = ? COLLATE NOCASE)"
+            )
+            values.append(tag)
+        if date_from is not None:
+            conditions.append("entry_date >= ?")
+            values.append(date_from)
+        if date_to is not None:
+            conditions.append("entry_date <= ?")
+            values.append(date_to)
+        if pnl is not None:
+            conditions.append(PNL_CONDITIONS[pnl])
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        cursor = self.connection.execute(
+            f"SELECT data FROM trades{where} ORDER BY trade_number, file_path", values
+        )
+        for (data,) in cursor:
+            yield json.loads(data)
+
+    def count(self) -> int:
+        """Number of stored trades"""
+        return self.connection.execute("SELECT COUNT(*) FROM trades").fetchone()[0]
+
+    def close(self):
+        """Close the database connection"""
+        self.connection.close()
+
+
+def open_trade_store(
+    index_path: str = "index.directory/trades-index.json", path: str = TRADE_STORE_PATH
+) -> Optional[TradeStore]:
+    """
+    Open the trade store if it is at least as new as the trades index
+
+    The index is also rewritten without parse_trades.py (import_csv.py
+    appends to it), in which case the store may be behind it.
+
+    Args:
+        index_path (str): trades-index.json path
+        path (str): Trade store path
+
+    Returns:
+        TradeStore or None if the store is missing or older than the index
+    """
+    try:
+        if os.path.getmtime(path) < os.path.getmtime(index_path):
+            return None
+    except OSError:
+        return None
+    return TradeStore(path)
+
+
+def trade_store_from_index(trades: list) -> TradeStore:
+    """
+    In-memory store built from trades-index.json trades
+
+    Lets callers run the same queries when the on-disk store is stale.
+
+    Args:
+        trades (list): Trades from the index
+
+    Returns:
+        TradeStore: Store holding those trades
+    """
+    store = TradeStore(":memory:")
+    # Keyed by position: appended index entries may repeat or lack file_path
+    store.sync(
+        {
+            f"{position:09d}": {"stamp": None, "trade": trade}
+            for position, trade in enumerate(trades)
+        }
+    )
+    return store
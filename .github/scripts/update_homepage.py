@@ -3,6 +3,9 @@
 Update Homepage Script
 Updates the index.html with the 3 most recent trades
 Injects trade data into the homepage HTML
+
+Writes the compact trades payload the dashboard loads
+(index.directory/trades-compact.json, see compact_index.py)
 """
 
 import sys
@@ -13,6 +16,7 @@ from globals_utils import setup_imports
 # Setup imports
 setup_imports(__file__)
 from utils import load_trades_index
+from compact_index import COMPACT_INDEX_PATH, write_compact_index
 
 
 def main():
@@ -37,10 +41,15 @@ def main():
         f"Statistics: Win Rate: {stats.get('win_rate', 0)}%, Total P&L: ${stats.get('total_pnl', 0)}"
     )
 
-    # The index.html file uses JavaScript to dynamically load from index.directory/trades-index.json
-    # So we just need to ensure the JSON file is accessible
+    # The dashboard loads the compact payload; bodies and notes are fetched
+    # from detail shards only when needed
+    written, total = write_compact_index(index_data)
+    print(f"Compact index written to {COMPACT_INDEX_PATH}")
+    print(f"Detail shards: {written} written, {total - written} unchanged")
+
+    # The index.html file uses JavaScript to dynamically load the trade data
     print("Homepage will be updated via JavaScript when loaded")
-    print("index.directory/trades-index.json is ready for frontend consumption")
+    print("index.directory/trades-compact.json is ready for frontend consumption")
 
 
 if __name__ == "__main__":
@@ -4,8 +4,40 @@ Common Utilities Module
 Shared functions used across multiple scripts to avoid code duplication.
 """
 
+import hashlib
 import json
-from collections import defaultdict
+import os
+from datetime import date
+
+# Trade index written by parse_trades.py
+TRADES_INDEX_PATH = "index.directory/trades-index.json"
+
+# Dense per-calendar-day series written by parse_trades.py
+DAILY_SERIES_PATH = "index.directory/daily-series.json"
+
+# Bump when the daily series layout changes; older files are rebuilt
+DAILY_SERIES_VERSION = 2
+
+# Fingerprint manifests for incremental generators
+CACHE_DIR = "index.directory/.cache"
+
+# Parsed trade files keyed by path (parse_trades.py), reused by later stages
+PARSE_CACHE_PATH = f"{CACHE_DIR}/parse-cache.json"
+
+# Bump when parse_trades.py output changes to invalidate the parse cache
+PARSE_CACHE_VERSION = 1
+
+# Additive per-day columns stored in the daily series
+DAILY_SERIES_FIELDS = [
+    "pnl",
+    "gross_win",
+    "gross_loss",
+    "trade_count",
+    "win_count",
+    "loss_count",
+    "volume",
+    "fees",
+]
 
 
 def load_trades_index():
@@ -16,10 +48,10 @@ def load_trades_index():
         dict: The trades index data, or None if file not found
     """
     try:
-        with open("index.directory/trades-index.json", "r", encoding="utf-8") as f:
+        with open(TRADES_INDEX_PATH, "r", encoding="utf-8") as f:
             return json.load(f)
     except FileNotFoundError:
-        print("index.directory/trades-index.json not found. Run parse_trades.py first.")
+        print(f"{TRADES_INDEX_PATH} not found. Run parse_trades.py first.")
         return None
 
 
@@ -60,68 +92,575 @@ def calculate_period_stats(trades):
     if not trades:
         return {}
 
-    total_trades = len(trades)
-    
-    # Single pass to calculate all metrics
-    win_count = 0
-    loss_count = 0
-    total_pnl = 0.0
-    total_volume = 0
-    best_trade = None
-    worst_trade = None
-    best_pnl = float('-inf')
-    worst_pnl = float('inf')
-    
-    # Strategy breakdown using defaultdict for efficiency
-    strategies = defaultdict(lambda: {"count": 0, "pnl": 0.0})
-    
-    for trade in trades:
-        pnl = trade.get("pnl_usd", 0)
-        total_pnl += pnl
-        total_volume += trade.get("position_size", 0)
-        
-        # Track wins/losses
+    return PeriodStats.from_trades(trades).to_dict()
+
+
+class PeriodStats:
+    """
+    Mergeable statistics for a group of trades.
+
+    merge() is associative and PeriodStats() is its identity, so stats for a
+    month can be built by merging its weeks, a year by merging its months,
+    and partial results from worker processes can be reduced in any grouping
+    (as long as left-to-right order is kept, ties resolve like a single pass).
+    """
+
+    def __init__(self):
+        self.total_trades = 0
+        self.winning_trades = 0
+        self.losing_trades = 0
+        self.breakeven_trades = 0
+        self.total_pnl = 0.0
+        self.gross_profit = 0.0
+        self.gross_loss = 0.0
+        self.total_volume = 0
+        self.best_trade = None
+        self.worst_trade = None
+        self.strategies = {}
+
+    @classmethod
+    def from_trades(cls, trades):
+        """
+        Build stats from raw trades in a single pass
+
+        Args:
+            trades (list): List of trade dictionaries
+
+        Returns:
+            PeriodStats: Stats for the trades
+        """
+        stats = cls()
+        for trade in trades:
+            stats.add(trade)
+        return stats
+
+    @classmethod
+    def from_daily_totals(cls, totals, trades):
+        """
+        Build stats from daily-series totals for a period
+
+        The counts and sums come from aggregate_daily_series(); only the
+        best/worst trade and the strategy breakdown need the trades.
+
+        Args:
+            totals (dict): {DAILY_SERIES_FIELDS entry: total} for the period
+            trades (list): The period's trades (bucketed with trade_day())
+
+        Returns:
+            PeriodStats: Stats for the period
+        """
+        stats = cls()
+        stats.total_trades = totals["trade_count"]
+        stats.winning_trades = totals["win_count"]
+        stats.losing_trades = totals["loss_count"]
+        stats.breakeven_trades = (
+            totals["trade_count"] - totals["win_count"] - totals["loss_count"]
+        )
+        stats.total_pnl = totals["pnl"]
+        stats.gross_profit = totals["gross_win"]
+        stats.gross_loss = totals["gross_loss"]
+        stats.total_volume = totals["volume"]
+        for trade in trades:
+            stats.track(trade, float(trade.get("pnl_usd", 0) or 0))
+        return stats
+
+    def add(self, trade):
+        """
+        Fold one trade into the stats
+
+        Args:
+            trade (dict): Trade dictionary
+        """
+        pnl = float(trade.get("pnl_usd", 0) or 0)
+        self.total_trades += 1
+        self.total_pnl += pnl
+        self.total_volume += trade.get("position_size", 0) or 0
+
         if pnl > 0:
-            win_count += 1
+            self.winning_trades += 1
+            self.gross_profit += pnl
         elif pnl < 0:
-            loss_count += 1
-        
-        # Track best/worst trades
-        if pnl > best_pnl:
-            best_pnl = pnl
-            best_trade = trade
-        if pnl < worst_pnl:
-            worst_pnl = pnl
-            worst_trade = trade
-        
-        # Update strategy breakdown
-        strategy = trade.get("strategy", "Unknown")
-        strategies[strategy]["count"] += 1
-        strategies[strategy]["pnl"] += pnl
+            self.losing_trades += 1
+            self.gross_loss += pnl
+        else:
+            self.breakeven_trades += 1
+
+        self.track(trade, pnl)
+
+    def track(self, trade, pnl):
+        """
+        Update the best/worst trade and strategy breakdown with one trade
+
+        Args:
+            trade (dict): Trade dictionary
+            pnl (float): The trade's P&L
+        """
+        summary = {
+            "ticker": trade.get("ticker"),
+            "pnl": pnl,
+            "trade_number": trade.get("trade_number"),
+        }
+        if self.best_trade is None or pnl > self.best_trade["pnl"]:
+            self.best_trade = summary
+        if self.worst_trade is None or pnl < self.worst_trade["pnl"]:
+            self.worst_trade = summary
+
+        strategy = self.strategies.setdefault(
+            trade.get("strategy", "Unknown"), {"count": 0, "pnl": 0.0}
+        )
+        strategy["count"] += 1
+        strategy["pnl"] += pnl
+
+    def merge(self, other):
+        """
+        Combine with stats for the trades that follow this group
+
+        Args:
+            other (PeriodStats): Stats for the later trades
+
+        Returns:
+            PeriodStats: New stats covering both groups
+        """
+        merged = PeriodStats()
+        for field in (
+            "total_trades",
+            "winning_trades",
+            "losing_trades",
+            "breakeven_trades",
+            "total_pnl",
+            "gross_profit",
+            "gross_loss",
+            "total_volume",
+        ):
+            setattr(merged, field, getattr(self, field) + getattr(other, field))
+
+        # Earlier trades win ties, matching a single pass over both groups
+        merged.best_trade = self.best_trade
+        if other.best_trade and (
+            merged.best_trade is None
+            or other.best_trade["pnl"] > merged.best_trade["pnl"]
+        ):
+            merged.best_trade = other.best_trade
+        merged.worst_trade = self.worst_trade
+        if other.worst_trade and (
+            merged.worst_trade is None
+            or other.worst_trade["pnl"] < merged.worst_trade["pnl"]
+        ):
+            merged.worst_trade = other.worst_trade
+
+        for source in (self.strategies, other.strategies):
+            for name, data in source.items():
+                strategy = merged.strategies.setdefault(name, {"count": 0, "pnl": 0.0})
+                strategy["count"] += data["count"]
+                strategy["pnl"] += data["pnl"]
+
+        return merged
+
+    @classmethod
+    def merge_all(cls, parts):
+        """
+        Merge an ordered sequence of stats
 
-    # Use first trade as fallback if no best/worst found
-    if best_trade is None:
-        best_trade = trades[0]
-    if worst_trade is None:
-        worst_trade = trades[0]
+        Args:
+            parts (iterable): PeriodStats in chronological order
 
+        Returns:
+            PeriodStats: Combined stats (empty if no parts)
+        """
+        merged = cls()
+        for part in parts:
+            merged = merged.merge(part)
+        return merged
+
+    def to_dict(self):
+        """
+        Summary statistics in the calculate_period_stats() format
+
+        Returns:
+            dict: Period statistics
+        """
+        total = self.total_trades
+        best = self.best_trade or {"ticker": None, "pnl": 0, "trade_number": None}
+        worst = self.worst_trade or {"ticker": None, "pnl": 0, "trade_number": None}
+        return {
+            "total_trades": total,
+            "winning_trades": self.winning_trades,
+            "losing_trades": self.losing_trades,
+            "win_rate": round(self.winning_trades / total * 100, 2) if total > 0 else 0,
+            "total_pnl": round(self.total_pnl, 2),
+            "avg_pnl": round(self.total_pnl / total, 2) if total > 0 else 0,
+            "best_trade": {
+                "ticker": best["ticker"],
+                "pnl": round(best["pnl"], 2),
+                "trade_number": best["trade_number"],
+            },
+            "worst_trade": {
+                "ticker": worst["ticker"],
+                "pnl": round(worst["pnl"], 2),
+                "trade_number": worst["trade_number"],
+            },
+            "total_volume": self.total_volume,
+            "strategies": {
+                name: dict(data) for name, data in self.strategies.items()
+            },
+        }
+
+    def to_json(self):
+        """Serialize for caching"""
+        return dict(vars(self))
+
+    @classmethod
+    def from_json(cls, data):
+        """Restore stats serialized by to_json()"""
+        stats = cls()
+        for field, value in data.items():
+            setattr(stats, field, value)
+        return stats
+
+
+def trade_day(trade):
+    """
+    Calendar day a trade's P&L is realized on: its exit date, falling back
+    to the entry date. Shared by the daily series and the summaries so
+    every time-based output buckets a trade on the same day.
+
+    Args:
+        trade (dict): Trade dictionary
+
+    Returns:
+        date: Realization day, or None if the trade has no valid date
+    """
+    date_str = str(trade.get("exit_date") or trade.get("entry_date") or "")
+    try:
+        return date.fromisoformat(date_str[:10])
+    except ValueError:
+        return None
+
+
+def trade_series_values(trade):
+    """
+    One trade's contribution to each DAILY_SERIES_FIELDS column
+
+    Args:
+        trade (dict): Trade dictionary
+
+    Returns:
+        dict: {field: value}
+    """
+    pnl = float(trade.get("pnl_usd", 0) or 0)
     return {
-        "total_trades": total_trades,
-        "winning_trades": win_count,
-        "losing_trades": loss_count,
-        "win_rate": round(win_count / total_trades * 100, 2) if total_trades > 0 else 0,
-        "total_pnl": round(total_pnl, 2),
-        "avg_pnl": round(total_pnl / total_trades, 2) if total_trades > 0 else 0,
-        "best_trade": {
-            "ticker": best_trade.get("ticker"),
-            "pnl": round(best_trade.get("pnl_usd", 0), 2),
-            "trade_number": best_trade.get("trade_number"),
-        },
-        "worst_trade": {
-            "ticker": worst_trade.get("ticker"),
-            "pnl": round(worst_trade.get("pnl_usd", 0), 2),
-            "trade_number": worst_trade.get("trade_number"),
-        },
-        "total_volume": total_volume,
-        "strategies": dict(strategies),
+        "pnl": pnl,
+        "gross_win": pnl if pnl > 0 else 0.0,
+        "gross_loss": pnl if pnl < 0 else 0.0,
+        "trade_count": 1,
+        "win_count": 1 if pnl > 0 else 0,
+        "loss_count": 1 if pnl < 0 else 0,
+        "volume": trade.get("position_size", 0) or 0,
+        "fees": float(trade.get("fees", trade.get("commission", 0)) or 0),
     }
+
+
+def whole_quantity(value):
+    """A share count as int when it is whole, else rounded to 4 places"""
+    return int(value) if float(value).is_integer() else round(value, 4)
+
+
+def period_key(day, period="week"):
+    """
+    Build the summary period key for a date.
+    Shared by the summary generators and the daily series aggregation.
+
+    Args:
+        day (date): Calendar date
+        period (str): 'week', 'month', or 'year'
+
+    Returns:
+        str: Key such as '2025-W45', '2025-11' or '2025'
+    """
+    if period == "week":
+        return f"{day.year}-W{day.isocalendar()[1]:02d}"
+    elif period == "month":
+        return f"{day.year}-{day.month:02d}"
+    elif period == "year":
+        return str(day.year)
+    return "unknown"
+
+
+def _empty_daily_series():
+    """Daily series with no days"""
+    series = {"version": DAILY_SERIES_VERSION, "start_date": None, "days": 0}
+    series.update({field: [] for field in DAILY_SERIES_FIELDS})
+    return series
+
+
+def build_daily_series(trades):
+    """
+    Build a dense, calendar-day-indexed series of daily trade totals.
+    Each trade is bucketed on trade_day() (exit date, falling back to entry
+    date); index i is start_date + i days, weekends included.
+
+    Args:
+        trades (list): List of trade dictionaries
+
+    Returns:
+        dict: {'version', 'start_date', 'days', and one array per
+               DAILY_SERIES_FIELDS entry}
+    """
+    bucketed = []
+    for trade in trades:
+        day = trade_day(trade)
+        if day is not None:
+            bucketed.append((day.toordinal(), trade))
+
+    if not bucketed:
+        return _empty_daily_series()
+
+    first = min(ordinal for ordinal, _ in bucketed)
+    days = max(ordinal for ordinal, _ in bucketed) - first + 1
+    money_fields = ("pnl", "gross_win", "gross_loss", "fees")
+    columns = {
+        field: [0.0] * days if field in money_fields else [0] * days
+        for field in DAILY_SERIES_FIELDS
+    }
+
+    for ordinal, trade in bucketed:
+        i = ordinal - first
+        for field, value in trade_series_values(trade).items():
+            columns[field][i] += value
+
+    for field in money_fields:
+        columns[field] = [round(value, 2) for value in columns[field]]
+    # Whole share counts stay integers; fractional quantities are kept
+    columns["volume"] = [whole_quantity(value) for value in columns["volume"]]
+
+    series = {
+        "version": DAILY_SERIES_VERSION,
+        "start_date": date.fromordinal(first).isoformat(),
+        "days": days,
+    }
+    series.update(columns)
+    return series
+
+
+def load_daily_series(trades=None):
+    """
+    Load the daily series written by parse_trades.py
+
+    The file is only used if it has the current layout and is at least as
+    new as trades-index.json (import_csv.py appends to the index without
+    rewriting the series).
+
+    Args:
+        trades (list): Optional trades to build the series from when the
+                       file is missing or out of date
+
+    Returns:
+        dict: Daily series, or None if unavailable
+    """
+    series = None
+    problem = None
+    try:
+        with open(DAILY_SERIES_PATH, "r", encoding="utf-8") as f:
+            series = json.load(f)
+    except FileNotFoundError:
+        problem = "not found"
+    except (OSError, json.JSONDecodeError):
+        problem = "could not be read"
+    if series is not None:
+        index_stamp = file_stamp(TRADES_INDEX_PATH)
+        if series.get("version") != DAILY_SERIES_VERSION:
+            problem = "is from an older version"
+        elif index_stamp and file_stamp(DAILY_SERIES_PATH)[0] < index_stamp[0]:
+            problem = "is older than the trades index"
+
+    if problem is None:
+        return series
+    if trades is not None:
+        return build_daily_series(trades)
+    print(f"{DAILY_SERIES_PATH} {problem}. Run parse_trades.py first.")
+    return None
+
+
+def daily_series_dates(series):
+    """
+    List the calendar date for every index of a daily series
+
+    Args:
+        series (dict): Daily series
+
+    Returns:
+        list: date objects, one per series index
+    """
+    if not series or not series.get("start_date"):
+        return []
+    first = date.fromisoformat(series["start_date"]).toordinal()
+    return [date.fromordinal(first + i) for i in range(series["days"])]
+
+
+def aggregate_daily_series(series, period="week"):
+    """
+    Roll a daily series up into week/month/year totals
+
+    Args:
+        series (dict): Daily series
+        period (str or tuple): 'week', 'month', or 'year', or a tuple of
+            them to group by several keys at once (e.g. ('week', 'month')
+            for the pieces a week and a month can both be merged from)
+
+    Returns:
+        dict: {period_key (tuple of keys for a tuple period): {field: total}}
+              in chronological order, for periods with trades
+    """
+    totals = {}
+    for i, day in enumerate(daily_series_dates(series)):
+        if not series["trade_count"][i]:
+            continue
+        if isinstance(period, tuple):
+            key = tuple(period_key(day, part) for part in period)
+        else:
+            key = period_key(day, period)
+        bucket = totals.setdefault(key, {field: 0 for field in DAILY_SERIES_FIELDS})
+        for field in DAILY_SERIES_FIELDS:
+            bucket[field] += series[field][i]
+
+    for bucket in totals.values():
+        for field in ("pnl", "gross_win", "gross_loss", "fees"):
+            bucket[field] = round(bucket[field], 2)
+
+    return totals
+
+
+def fingerprint(*parts):
+    """
+    Stable content fingerprint of JSON-serializable values
+
+    Args:
+        *parts: Values that determine a generated output
+
+    Returns:
+        str: SHA-256 hex digest
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def file_stamp(path):
+    """
+    Cheap change marker for a file (no read)
+
+    Returns:
+        list: [mtime_ns, size], or None if the file does not exist
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def load_parse_cache():
+    """
+    Load the parse cache written by parse_trades.py
+
+    Returns:
+        dict: {trade file path: {'stamp', 'trade', 'body'}}, empty if the
+              cache is missing, unreadable or from another cache version
+    """
+    try:
+        with open(PARSE_CACHE_PATH, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if cache.get("version") != PARSE_CACHE_VERSION:
+        return {}
+    return cache.get("files", {})
+
+
+class OutputManifest:
+    """
+    Record of generated files keyed by the fingerprint of their inputs.
+    Lets generators skip outputs whose inputs and on-disk content are unchanged.
+
+    Each entry stores the input fingerprint, a digest of the written content
+    and the file's stat stamp. The stamp is checked first; only when it moved
+    (fresh checkout, manual edit) is the file hashed to confirm.
+    """
+
+    def __init__(self, name, root=""):
+        """
+        Args:
+            name (str): Manifest name, stored as CACHE_DIR/<name>.json
+            root (str): Directory that CACHE_DIR and output paths are relative
+                        to (defaults to the working directory)
+        """
+        self.root = root
+        self.path = os.path.join(root, CACHE_DIR, f"{name}.json")
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.entries = {}
+        self.changed = False
+
+    def is_fresh(self, output_path, input_fingerprint):
+        """
+        Check whether an output is up to date for the given inputs
+
+        Args:
+            output_path (str): Generated file path
+            input_fingerprint (str): Fingerprint of the output's inputs
+
+        Returns:
+            bool: True if the output can be skipped
+        """
+        entry = self.entries.get(output_path)
+        if not entry or entry.get("fingerprint") != input_fingerprint:
+            return False
+
+        stamp = file_stamp(os.path.join(self.root, output_path))
+        if stamp is None:
+            return False
+        if stamp == entry.get("stamp"):
+            return True
+
+        with open(os.path.join(self.root, output_path), "rb") as f:
+            if hashlib.sha256(f.read()).hexdigest() != entry.get("digest"):
+                return False
+        entry["stamp"] = stamp
+        self.changed = True
+        return True
+
+    def record(self, output_path, input_fingerprint, content):
+        """
+        Record an output that was just written
+
+        Args:
+            output_path (str): Generated file path
+            input_fingerprint (str): Fingerprint of the output's inputs
+            content (str): Content that was written
+        """
+        self.entries[output_path] = {
+            "fingerprint": input_fingerprint,
+            "digest": hashlib.sha256(content.encode("utf-8")).hexdigest(),
+            "stamp": file_stamp(os.path.join(self.root, output_path)),
+        }
+        self.changed = True
+
+    def discard(self, output_path):
+        """Forget an output that no longer exists"""
+        if self.entries.pop(output_path, None) is not None:
+            self.changed = True
+
+    def digest(self, output_path):
+        """Content digest of a recorded output, or None"""
+        entry = self.entries.get(output_path)
+        return entry.get("digest") if entry else None
+
+    def save(self):
+        """Persist the manifest if anything changed"""
+        if not self.changed:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        self.changed = False
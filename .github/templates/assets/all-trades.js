@@ -0,0 +1,256 @@
+// All trades list behaviour (index.directory/all-trades.html)
+//
+// The listing is stored as fixed-size JSON pages (all-trades/page-NNNN.json)
+// written by generate_index.py. Only the rows near the viewport are in the
+// DOM, pages are fetched when first scrolled into view, and sort orders come
+// precomputed from all-trades/index.json.
+//
+// The search box queries the search index (search.js) across trades, notes
+// and summary reviews.
+
+(function () {
+  // Row height in px; matches tr.listing-row in all-trades.css
+  const ROW_HEIGHT = 56;
+  // Extra rows rendered above and below the viewport
+  const OVERSCAN = 10;
+
+  const table = document.getElementById('trades-table');
+  if (!table) return;
+
+  const body = table.querySelector('tbody');
+  const sortSelect = document.getElementById('trades-sort');
+  const countLabel = document.getElementById('trades-count');
+  const indexUrl = table.dataset.index;
+  const baseUrl = indexUrl.slice(0, indexUrl.lastIndexOf('/') + 1);
+
+  let listing = null;
+  let order = [];
+  let column = {};
+  let rendered = null;
+  let frame = 0;
+  const pages = new Map();
+
+  function loadPage(number) {
+    if (pages.has(number)) return;
+    const page = listing.pages[number];
+    pages.set(number, null);
+    fetch(`${baseUrl}${page.file}?v=${page.version}`)
+      .then((response) => response.json())
+      .then((data) => {
+        pages.set(number, data.rows);
+        rendered = null;
+        scheduleRender();
+      })
+      .catch((error) => {
+        console.error('[AllTrades] Failed to load listing page', page.file, error);
+        pages.delete(number);
+      });
+  }
+
+  function cell(text, className) {
+    const td = document.createElement('td');
+    td.textContent = text;
+    if (className) td.className = className;
+    return td;
+  }
+
+  function linkCell(href, text, strong) {
+    const td = document.createElement('td');
+    const a = document.createElement('a');
+    a.href = href;
+    if (strong) {
+      const b = document.createElement('strong');
+      b.textContent = text;
+      a.appendChild(b);
+    } else {
+      a.textContent = text;
+    }
+    td.appendChild(a);
+    return td;
+  }
+
+  function tradeRow(row) {
+    const tr = document.createElement('tr');
+    tr.className = 'listing-row';
+    const link = row[column.link];
+    const pnl = Number(row[column.pnl_usd]) || 0;
+    tr.dataset.href = link;
+    tr.append(
+      linkCell(link, `#${row[column.trade_number]}`, false),
+      linkCell(link, row[column.ticker], true),
+      cell(row[column.direction]),
+      cell(`$${(Number(row[column.entry_price]) || 0).toFixed(4)}`),
+      cell(`$${(Number(row[column.exit_price]) || 0).toFixed(4)}`),
+      cell((Number(row[column.position_size]) || 0).toLocaleString('en-US')),
+      cell(`${pnl >= 0 ? '+' : ''}$${Math.abs(pnl).toFixed(2)}`, pnl >= 0 ? 'positive' : 'negative'),
+      cell(row[column.entry_date]),
+      cell(row[column.strategy])
+    );
+    return tr;
+  }
+
+  function placeholderRow() {
+    const tr = document.createElement('tr');
+    tr.className = 'listing-row';
+    const td = cell('Loading…', 'listing-pending');
+    td.colSpan = 9;
+    tr.appendChild(td);
+    return tr;
+  }
+
+  function spacerRow(rows) {
+    const tr = document.createElement('tr');
+    tr.className = 'listing-spacer';
+    tr.style.height = `${rows * ROW_HEIGHT}px`;
+    const td = document.createElement('td');
+    td.colSpan = 9;
+    tr.appendChild(td);
+    return tr;
+  }
+
+  function messageRow(text) {
+    const tr = document.createElement('tr');
+    const td = cell(text, 'empty-state');
+    td.colSpan = 9;
+    tr.appendChild(td);
+    return tr;
+  }
+
+  function render() {
+    frame = 0;
+    const total = order.length;
+    if (!total) {
+      body.replaceChildren(messageRow('No trades recorded yet. Add your first trade to get started!'));
+      return;
+    }
+
+    // tbody starts with the top spacer, so its top edge is row 0
+    const offset = -body.getBoundingClientRect().top;
+    const first = Math.max(0, Math.floor(offset / ROW_HEIGHT) - OVERSCAN);
+    const last = Math.min(total, Math.ceil((offset + window.innerHeight) / ROW_HEIGHT) + OVERSCAN);
+    if (rendered && rendered[0] === first && rendered[1] === last) return;
+    rendered = [first, last];
+
+    const fragment = document.createDocumentFragment();
+    fragment.appendChild(spacerRow(first));
+    for (let i = first; i < last; i++) {
+      const position = order[i];
+      const number = Math.floor(position / listing.page_size);
+      const rows = pages.get(number);
+      if (rows) {
+        fragment.appendChild(tradeRow(rows[position % listing.page_size]));
+      } else {
+        loadPage(number);
+        fragment.appendChild(placeholderRow());
+      }
+    }
+    fragment.appendChild(spacerRow(total - last));
+    body.replaceChildren(fragment);
+  }
+
+  function scheduleRender() {
+    if (!frame) frame = requestAnimationFrame(render);
+  }
+
+  function applySort() {
+    const [key, direction] = sortSelect.value.split('-');
+    const ascending = listing.orders[key] || listing.orders.date;
+    order = direction === 'desc' ? ascending.slice().reverse() : ascending;
+    rendered = null;
+    scheduleRender();
+  }
+
+  // Whole rows link to their trade page; one listener instead of one per row
+  document.addEventListener('click', (event) => {
+    const row = event.target.closest('tr[data-href]');
+    if (row && !event.target.closest('a')) {
+      window.location.href = row.dataset.href;
+    }
+  });
+
+  fetch(indexUrl, { cache: 'no-cache' })
+    .then((response) => response.json())
+    .then((data) => {
+      listing = data;
+      listing.columns.forEach((name, i) => { column[name] = i; });
+      if (countLabel) {
+        countLabel.textContent = `${listing.total.toLocaleString('en-US')} recorded trades`;
+      }
+      sortSelect.addEventListener('change', applySort);
+      window.addEventListener('scroll', scheduleRender, { passive: true });
+      window.addEventListener('resize', () => { rendered = null; scheduleRender(); });
+      applySort();
+    })
+    .catch((error) => {
+      console.error('[AllTrades] Failed to load listing index', error);
+      body.replaceChildren(messageRow('Could not load the trade list.'));
+    });
+})();
+
+(function () {
+  // Delay after the last keystroke before querying, in ms
+  const SEARCH_DELAY = 150;
+
+  const input = document.getElementById('trades-search');
+  const list = document.getElementById('search-results');
+  if (!input || !list || typeof TradeSearch === 'undefined') return;
+
+  const search = new TradeSearch(input.dataset.index);
+  let timer = 0;
+  let latest = 0;
+
+  function resultItem(result) {
+    const li = document.createElement('li');
+    const a = document.createElement('a');
+    a.href = result.url;
+    const type = document.createElement('span');
+    type.className = `search-type ${result.type}`;
+    type.textContent = result.type;
+    const title = document.createElement('strong');
+    title.textContent = result.title;
+    a.append(type, title);
+    if (result.date) {
+      const date = document.createElement('span');
+      date.className = 'search-date';
+      date.textContent = result.date;
+      a.appendChild(date);
+    }
+    if (result.snippet) {
+      const snippet = document.createElement('p');
+      snippet.textContent = result.snippet;
+      a.appendChild(snippet);
+    }
+    li.appendChild(a);
+    return li;
+  }
+
+  function runQuery() {
+    const text = input.value.trim();
+    const request = ++latest;
+    if (!text) {
+      list.hidden = true;
+      list.replaceChildren();
+      return;
+    }
+    search.query(text).then((results) => {
+      // Drop responses for queries the user has already typed past
+      if (request !== latest) return;
+      if (!results.length) {
+        const li = document.createElement('li');
+        li.className = 'search-empty';
+        li.textContent = 'No matches';
+        list.replaceChildren(li);
+      } else {
+        list.replaceChildren(...results.map(resultItem));
+      }
+      list.hidden = false;
+    }).catch((error) => {
+      console.error('[AllTrades] Search failed', error);
+    });
+  }
+
+  input.addEventListener('input', () => {
+    clearTimeout(timer);
+    timer = setTimeout(runQuery, SEARCH_DELAY);
+  });
+})();
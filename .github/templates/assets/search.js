@@ -0,0 +1,124 @@
+// Client-side search over trades, notes and summary reviews
+//
+// Reads the index written by generate_search_index.py (search/docs.json and
+// search/shard-{prefix}.json) and scores documents with BM25. Each shard
+// holds the terms from its prefix up to the next shard's, so a query fetches
+// the shard each term falls into; the last term also matches as a prefix, so
+// results update while typing.
+//
+// Usage:
+//   const search = new TradeSearch('search/');
+//   search.query('cyn halt').then((results) => ...);
+
+class TradeSearch {
+  // Keep in sync with STOPWORDS in generate_search_index.py
+  static STOPWORDS = new Set((
+    'a an and are as at be but by for from had has have i in is it its my no not ' +
+    'of on or so that the then there this to was were will with'
+  ).split(' '));
+
+  constructor(baseUrl) {
+    this.baseUrl = baseUrl;
+    this.meta = null;
+    this.shards = new Map();
+  }
+
+  static tokenize(text) {
+    return (String(text).toLowerCase().match(/[a-z0-9]+/g) || [])
+      .filter((token) => token.length >= 2 && !TradeSearch.STOPWORDS.has(token));
+  }
+
+  loadMeta() {
+    if (!this.meta) {
+      this.meta = fetch(`${this.baseUrl}docs.json`, { cache: 'no-cache' })
+        .then((response) => response.json())
+        .then((meta) => ({ ...meta, shardKeys: Object.keys(meta.shards).sort() }));
+    }
+    return this.meta;
+  }
+
+  loadShard(meta, prefix) {
+    if (!(prefix in meta.shards)) return Promise.resolve({});
+    if (!this.shards.has(prefix)) {
+      const url = `${this.baseUrl}shard-${prefix}.json?v=${meta.shards[prefix]}`;
+      this.shards.set(prefix, fetch(url).then((response) => response.json()));
+    }
+    return this.shards.get(prefix);
+  }
+
+  // Shards that can hold a term: the last shard whose key sorts at or before
+  // the term's prefix. The term being typed also matches longer terms, which
+  // may run on into the following shards.
+  shardKeys(meta, term, typing) {
+    const prefix = term.slice(0, meta.prefix_length);
+    const keys = meta.shardKeys;
+    let first = -1;
+    while (first + 1 < keys.length && keys[first + 1] <= prefix) first += 1;
+    const matches = first >= 0 ? [keys[first]] : [];
+    if (typing) {
+      for (let i = first + 1; i < keys.length && keys[i].startsWith(term); i += 1) {
+        matches.push(keys[i]);
+      }
+    }
+    return matches;
+  }
+
+  /**
+   * Search the index
+   * @param {string} text - Query text
+   * @param {number} limit - Maximum number of results
+   * @returns {Promise<Array>} [{type, title, url, date, snippet, score}] best first
+   */
+  async query(text, limit = 20) {
+    const terms = [...new Set(TradeSearch.tokenize(text))];
+    if (!terms.length) return [];
+
+    const meta = await this.loadMeta();
+    const keys = terms.map((term, index) => this.shardKeys(meta, term, index === terms.length - 1));
+    const shards = {};
+    await Promise.all([...new Set(keys.flat())].map(async (prefix) => {
+      shards[prefix] = await this.loadShard(meta, prefix);
+    }));
+
+    const scores = new Map();
+    terms.forEach((term, index) => {
+      keys[index].forEach((prefix) => {
+        const shard = shards[prefix];
+        // The term being typed matches every indexed term it starts
+        const matches = index === terms.length - 1
+          ? Object.keys(shard).filter((candidate) => candidate.startsWith(term))
+          : (term in shard ? [term] : []);
+        matches.forEach((match) => this.scorePostings(meta, shard[match], scores));
+      });
+    });
+
+    const length = meta.columns.indexOf('length');
+    return [...scores.entries()]
+      .sort((a, b) => b[1] - a[1])
+      .slice(0, limit)
+      .map(([id, score]) => {
+        const doc = meta.docs[id];
+        const result = { score };
+        meta.columns.forEach((column, i) => {
+          if (i !== length) result[column] = doc[i];
+        });
+        return result;
+      });
+  }
+
+  scorePostings(meta, postings, scores) {
+    const df = postings.length / 2;
+    const idf = Math.log(1 + (meta.doc_count - df + 0.5) / (df + 0.5));
+    const lengthColumn = meta.columns.indexOf('length');
+    let id = 0;
+    for (let i = 0; i < postings.length; i += 2) {
+      id += postings[i];
+      const tf = postings[i + 1];
+      const length = meta.docs[id][lengthColumn];
+      const norm = meta.k1 * (1 - meta.b + meta.b * length / (meta.avg_length || 1));
+      scores.set(id, (scores.get(id) || 0) + idf * tf * (meta.k1 + 1) / (tf + norm));
+    }
+  }
+}
+
+window.TradeSearch = TradeSearch;
@@ -0,0 +1,9 @@
+// Trade detail page behaviour (index.directory/trades/trade-*.html)
+
+// Initialize GLightbox for image gallery
+const lightbox = GLightbox({
+  selector: '.glightbox',
+  touchNavigation: true,
+  loop: true,
+  autoplayVideos: true
+});
@@ -576,7 +576,16 @@ async function loadTickerPerformanceChart() {
       data: data,
       options: {
         ...options,
-        indexAxis: 'y'
+        indexAxis: 'y',
+        // Open the ticker's detail view (ticker.html) on click
+        onClick: (event, elements) => {
+          if (!elements.length) return;
+          const ticker = data.labels[elements[0].index];
+          window.location.href = `ticker.html?symbol=${encodeURIComponent(ticker)}`;
+        },
+        onHover: (event, elements) => {
+          event.native.target.style.cursor = elements.length ? 'pointer' : 'default';
+        }
       }
     });
   } catch (error) {
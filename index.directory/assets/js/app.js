@@ -119,10 +119,7 @@ class TradingJournal {
   async refreshStats() {
     try {
       // Load latest trades data
-      const response = await fetch(`${this.basePath}/index.directory/trades-index.json`);
-      if (!response.ok) return;
-      
-      const data = await response.json();
+      const data = await SFTiUtils.loadTradesIndex(`${this.basePath}/index.directory`);
       
       // Load analytics
       let analyticsData = null;
@@ -246,14 +243,9 @@ class TradingJournal {
     if (!container) return;
     
     try {
-      // Try to fetch trades index using dynamic base path
-      const response = await fetch(`${this.basePath}/index.directory/trades-index.json`);
-      if (!response.ok) {
-        throw new Error('Trades index not found');
-      }
-      
-      const data = await response.json();
-      const trades = data.trades || [];
+      // Load trades (compact payload, falling back to trades-index.json)
+      const data = await SFTiUtils.loadTradesIndex(`${this.basePath}/index.directory`);
+      const trades = data.trades;
       
       // Sort by date and get 3 most recent
       const recentTrades = trades
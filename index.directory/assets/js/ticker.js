@@ -0,0 +1,174 @@
+/**
+ * Ticker Page JavaScript
+ * Shows one symbol's cumulative P&L, win rate, hold time and trades
+ * (ticker.html?symbol=LPTX) from the per-ticker detail shards that
+ * generate_charts.py writes to assets/tickers/
+ *
+ * Performance Optimizations:
+ * - Fetches only the shard the symbol falls into instead of trades-index.json
+ * - The shard manifest is fetched once per page load
+ */
+
+// Use utilities from global SFTiUtils and SFTiChartConfig
+
+// State
+let shardManifest = null;
+let tickerPnlChart = null;
+
+// DOM elements
+const tickerForm = document.getElementById('ticker-form');
+const tickerInput = document.getElementById('ticker-input');
+const tickerSymbol = document.getElementById('ticker-symbol');
+const tickerStatus = document.getElementById('ticker-status');
+const tickerDetails = document.getElementById('ticker-details');
+
+/**
+ * Base URL of the ticker shards
+ * @returns {string} URL ending in '/'
+ */
+function tickerShardBase() {
+  const basePath = window.SFTiUtils ? SFTiUtils.getBasePath() : '';
+  return `${basePath}/index.directory/assets/tickers/`;
+}
+
+/**
+ * Shard key of a ticker (mirrors ticker_shard_key() in generate_charts.py)
+ * @param {string} ticker - Ticker symbol
+ * @param {number} prefixLength - Leading characters used as the key
+ * @returns {string} Shard key
+ */
+function tickerShardKey(ticker, prefixLength) {
+  const prefix = Array.from(String(ticker)).slice(0, prefixLength).join('').toUpperCase();
+  return prefix.replace(/[^\p{L}\p{N}]/gu, '_') || '_';
+}
+
+/**
+ * Load one ticker's detail record
+ * @param {string} ticker - Ticker symbol (uppercase)
+ * @returns {Promise<object|null>} Detail record, or null if the ticker has no trades
+ */
+async function loadTickerDetail(ticker) {
+  if (!shardManifest) {
+    const response = await fetch(`${tickerShardBase()}index.json`);
+    if (!response.ok) throw new Error(`Ticker shard manifest: HTTP ${response.status}`);
+    shardManifest = await response.json();
+  }
+
+  const key = tickerShardKey(ticker, shardManifest.prefix_length);
+  if (!shardManifest.shards.includes(key)) return null;
+
+  const response = await fetch(`${tickerShardBase()}${encodeURIComponent(key)}.json`);
+  if (!response.ok) throw new Error(`Ticker shard ${key}: HTTP ${response.status}`);
+  const shard = await response.json();
+  const match = Object.keys(shard).find(name => name.toUpperCase() === ticker);
+  return match ? shard[match] : null;
+}
+
+/**
+ * Format an average hold time in minutes
+ * @param {number|null} minutes - Average hold time
+ * @returns {string} e.g. '53.5 min' or '2.3 h'
+ */
+function formatHold(minutes) {
+  if (minutes === null || minutes === undefined) return '-';
+  return minutes < 120 ? `${minutes.toFixed(1)} min` : `${(minutes / 60).toFixed(1)} h`;
+}
+
+/**
+ * Render a ticker's summary, chart and trade list
+ * @param {string} ticker - Ticker symbol
+ * @param {object} detail - Detail record from the shard
+ */
+function renderTicker(ticker, detail) {
+  const colors = SFTiUtils.getPnLColors(detail.total_pnl);
+  const totalPnl = document.getElementById('ticker-total-pnl');
+  totalPnl.textContent = SFTiUtils.formatCurrency(detail.total_pnl);
+  totalPnl.style.color = colors.text;
+  document.getElementById('ticker-trade-count').textContent = detail.trade_count;
+  document.getElementById('ticker-win-rate').textContent = `${detail.win_rate}%`;
+  document.getElementById('ticker-avg-hold').textContent = formatHold(detail.avg_hold_minutes);
+
+  const list = document.getElementById('ticker-trades');
+  list.replaceChildren(
+    ...detail.trade_ids.map((id, i) => {
+      const item = document.createElement('li');
+      const link = document.createElement('a');
+      link.href = `trades/${encodeURIComponent(id)}.html`;
+      link.textContent = `${detail.dates[i]} · ${id}`;
+      item.appendChild(link);
+      return item;
+    })
+  );
+
+  const ctx = document.getElementById('ticker-pnl-chart');
+  if (tickerPnlChart) tickerPnlChart.destroy();
+  tickerPnlChart = new Chart(ctx, {
+    type: 'line',
+    data: {
+      labels: detail.dates,
+      datasets: [{
+        label: `${ticker} Cumulative P&L ($)`,
+        data: detail.cumulative_pnl,
+        borderColor: colors.border,
+        backgroundColor: detail.total_pnl >= 0 ? 'rgba(0, 255, 136, 0.1)' : 'rgba(255, 71, 87, 0.1)',
+        fill: true,
+        tension: 0.2
+      }]
+    },
+    options: SFTiChartConfig.getLineChartOptions(colors.border)
+  });
+
+  tickerDetails.hidden = false;
+}
+
+/**
+ * Show the ticker named in the page URL (?symbol=...)
+ */
+async function initTicker() {
+  const ticker = (new URLSearchParams(window.location.search).get('symbol') || '').trim().toUpperCase();
+  tickerInput.value = ticker;
+  tickerSymbol.textContent = ticker;
+  tickerDetails.hidden = true;
+
+  if (!ticker) {
+    tickerStatus.textContent = 'Enter a symbol to see its trades.';
+    return;
+  }
+
+  document.title = `${ticker} - SFTi-Pennies`;
+  tickerStatus.textContent = 'Loading...';
+  try {
+    const detail = await loadTickerDetail(ticker);
+    if (!detail) {
+      tickerStatus.textContent = `No trades recorded for ${ticker}.`;
+      return;
+    }
+    tickerStatus.textContent = '';
+    renderTicker(ticker, detail);
+  } catch (error) {
+    console.log('Ticker detail data not yet available:', error);
+    tickerStatus.textContent = 'No ticker data available yet. Run generate_charts.py to build it.';
+  }
+}
+
+tickerForm.addEventListener('submit', (event) => {
+  event.preventDefault();
+  const ticker = tickerInput.value.trim().toUpperCase();
+  const url = new URL(window.location.href);
+  url.searchParams.set('symbol', ticker);
+  window.history.pushState({}, '', url);
+  initTicker();
+});
+
+window.addEventListener('popstate', initTicker);
+
+// Initialize on DOM ready
+SFTiUtils.onDOMReady(initTicker);
+
+// Reload when the charts are regenerated in the browser
+if (window.SFTiEventBus) {
+  window.SFTiEventBus.on('data:regenerated', () => {
+    shardManifest = null;
+    initTicker();
+  });
+}
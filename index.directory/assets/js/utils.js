@@ -155,6 +155,99 @@
     }
   }
 
+  /**
+   * Decode one value of the compact trades payload (see compact_index.py)
+   * @param {*} value - Encoded value
+   * @param {string} encoding - Column encoding, e.g. 'fixed:100'
+   * @param {Object} dictionaries - Dictionary name -> array of strings
+   * @returns {*} Decoded value
+   */
+  function decodeCompactValue(value, encoding, dictionaries) {
+    const [kind, arg] = encoding.split(':');
+    switch (kind) {
+      case 'fixed':
+        return value / Number(arg);
+      case 'epoch_day':
+        return new Date(value * 86400000).toISOString().slice(0, 10);
+      case 'minutes':
+        return `${String(Math.floor(value / 60)).padStart(2, '0')}:${String(value % 60).padStart(2, '0')}`;
+      case 'dict':
+        return dictionaries[arg][value];
+      case 'dict_list':
+        return value.map((code) => dictionaries[arg][code]);
+      default:
+        return value;
+    }
+  }
+
+  /**
+   * Decode the compact trades payload into trade objects
+   * Bodies, notes and screenshots are not included; see loadTradeDetails()
+   * @param {Object} payload - Contents of trades-compact.json
+   * @returns {Array} Trade objects with the trades-index.json field names
+   */
+  function decodeCompactTrades(payload) {
+    const { columns, encodings, dictionaries } = payload;
+    return payload.rows.map((row) => {
+      const trade = {};
+      row.forEach((value, i) => {
+        if (value !== null) {
+          trade[columns[i]] = decodeCompactValue(value, encodings[i], dictionaries);
+        }
+      });
+      return trade;
+    });
+  }
+
+  /**
+   * Load trades and statistics, preferring the compact payload
+   * Falls back to trades-index.json when trades-compact.json is unavailable
+   * @param {string} directory - URL of index.directory (no trailing slash)
+   * @returns {Promise<Object>} { trades, statistics, compact } where compact is
+   *   the raw payload (null for the fallback)
+   */
+  async function loadTradesIndex(directory = '.') {
+    try {
+      const response = await fetch(`${directory}/trades-compact.json`);
+      if (response.ok) {
+        const payload = await response.json();
+        return {
+          trades: decodeCompactTrades(payload),
+          statistics: payload.statistics || {},
+          compact: payload
+        };
+      }
+    } catch (error) {
+      console.warn('Compact trades payload unavailable, using trades-index.json:', error);
+    }
+
+    const response = await fetch(`${directory}/trades-index.json`);
+    if (!response.ok) {
+      throw new Error('Trades index not found');
+    }
+    const data = await response.json();
+    return { trades: data.trades || [], statistics: data.statistics || {}, compact: null };
+  }
+
+  const detailShards = new Map();
+
+  /**
+   * Lazily load the body, notes, screenshots and other detail fields of a trade
+   * @param {string} directory - URL of index.directory (no trailing slash)
+   * @param {Object} payload - Compact payload from loadTradesIndex()
+   * @param {number} position - Row position of the trade in the payload
+   * @returns {Promise<Object>} Detail fields of the trade
+   */
+  async function loadTradeDetails(directory, payload, position) {
+    const shard = payload.detail_shards[Math.floor(position / payload.detail_shard_size)];
+    const url = `${directory}/${shard.file}?v=${shard.version}`;
+    if (!detailShards.has(url)) {
+      detailShards.set(url, fetch(url).then((response) => response.json()));
+    }
+    const rows = await detailShards.get(url);
+    return rows[position % payload.detail_shard_size];
+  }
+
   /**
    * Format currency value with sign
    * @param {number} amount - Amount to format
@@ -186,6 +279,9 @@
     formatDateForFilename,
     getYearWeekNumber,
     loadTradesByWeek,
+    decodeCompactTrades,
+    loadTradesIndex,
+    loadTradeDetails,
     formatCurrency,
     calculateWinRate
   };
@@ -18,6 +18,10 @@
 const CACHE_NAME = 'personal-pennies-vfs-v2';
 const CACHE_TIMEOUT = 5 * 60 * 1000; // 5 minutes
 
+// Content-hashed page assets (assets/dist/{name}.{hash}.{ext}) never change
+// under the same URL, so they are served cache-first without expiry
+const ASSET_CACHE_NAME = 'personal-pennies-assets-v1';
+
 // Import localforage in Service Worker context
 importScripts('https://cdn.jsdelivr.net/npm/localforage@1.10.0/dist/localforage.min.js');
 
@@ -130,9 +134,28 @@ self.addEventListener('fetch', (event) => {
     event.respondWith(handleTradePageRequest(pathname));
   } else if (pathname.includes('/assets/charts/') && pathname.endsWith('.json')) {
     event.respondWith(handleChartRequest(pathname));
+  } else if (pathname.includes('/assets/dist/')) {
+    event.respondWith(handleHashedAssetRequest(event.request));
   }
 });
 
+/**
+ * Handle content-hashed asset requests (cache-first, immutable)
+ */
+async function handleHashedAssetRequest(request) {
+  const cache = await caches.open(ASSET_CACHE_NAME);
+  const cached = await cache.match(request);
+  if (cached) {
+    return cached;
+  }
+
+  const response = await fetch(request);
+  if (response.ok) {
+    cache.put(request, response.clone());
+  }
+  return response;
+}
+
 /**
  * Handle summary file requests
  */